@@ -0,0 +1,26 @@
+"""add chunk_artifact to contents
+
+Revision ID: c7d2e5a1b3f4
+Revises: a4f0f8f9d1b2
+Create Date: 2026-10-17 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7d2e5a1b3f4"
+down_revision: Union[str, None] = "a4f0f8f9d1b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("contents", sa.Column("chunk_artifact", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("contents", "chunk_artifact")
@@ -1,5 +1,6 @@
 # app/core/celery_app.py
 from celery import Celery
+from celery.signals import worker_init, worker_process_init, worker_process_shutdown
 import logging
 from app.core.config import settings
 
@@ -45,6 +46,40 @@ celery_app.conf.update(
 )
 
 
+@worker_init.connect
+def preload_embedding_model(**kwargs):
+    """prefork 자식들이 copy-on-write로 가중치를 공유하도록 부모 프로세스에서 모델만 로드한다.
+
+    fork 전에 추론을 돌리면 torch 스레드 풀 상태가 자식에 복제되므로 encode는 하지 않는다.
+    디스크 캐시(SQLite)와 원격 임베딩 클라이언트는 자식마다 첫 사용 시 연다.
+    """
+    if not settings.EMBEDDING_WARMUP_ON_STARTUP:
+        return
+    from app.services.embedding_service import embedding_service
+
+    try:
+        embedding_service.preload_weights()
+    except Exception as e:
+        logger.warning(f"⚠️ 임베딩 모델 사전 로드 실패: {e}")
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs):
+    """자식 프로세스마다 수명 동안 쓸 이벤트 루프와 AI/스크래퍼 서비스를 만든다."""
+    from app.services.embedding_service import embedding_service
+    from app.tasks.worker_runtime import init_worker_runtime
+
+    embedding_service.reset_after_fork()
+    init_worker_runtime()
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**kwargs):
+    from app.tasks.worker_runtime import shutdown_worker_runtime
+
+    shutdown_worker_runtime()
+
+
 def test_celery_connection():
     """
     Celery 브로커 및 워커 연결 상태 테스트 함수
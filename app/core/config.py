@@ -34,6 +34,29 @@ class Settings(BaseSettings):
 
     # Scraper
     scraper_timeout: int = 10
+    SCRAPER_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    SCRAPER_READ_TIMEOUT_SECONDS: float = 12.0
+    SCRAPER_READER_READ_TIMEOUT_SECONDS: float = 18.0  # r.jina.ai reader는 렌더링 시간이 더 걸린다
+    SCRAPER_THUMBNAIL_TIMEOUT_SECONDS: float = 3.0  # reader 결과에 썸네일만 채우는 부가 요청
+    SCRAPER_MAX_CONNECTIONS: int = 64  # 프로세스(이벤트 루프)당 커넥션 풀 전체 상한
+    SCRAPER_MAX_KEEPALIVE_CONNECTIONS: int = 32
+    SCRAPER_MAX_CONNECTIONS_PER_HOST: int = 4  # 같은 호스트로 동시에 보내는 요청 수
+    SCRAPER_HTTP2: bool = True  # h2 패키지가 설치된 경우에만 적용
+    SCRAPER_HTML_ENGINE: str = "lxml"  # lxml (단일 순회) | bs4 (BeautifulSoup html.parser)
+    # article/main이 없을 때 본문 선택: density (텍스트·링크 밀도 점수) | keywords (class 키워드 div 전부)
+    SCRAPER_CONTENT_EXTRACTOR: str = "density"
+    # hedged 모드: HTML 추출이 늦으면 reader를 함께 시작해 먼저 온 본문을 쓴다
+    SCRAPER_HEDGE_ENABLED: bool = False
+    SCRAPER_HEDGE_DELAY_SECONDS: float = 2.5
+    SCRAPER_READER_FIRST_DOMAINS: List[str] = Field(default_factory=list)  # reader를 즉시 시작할 도메인
+    SCRAPER_HEDGE_MIN_SAMPLES: int = 3  # 도메인별 승리 기록이 이만큼 쌓여야 정책에 반영
+    SCRAPER_HEDGE_READER_WIN_RATIO: float = 0.6  # reader 승률이 이 이상이면 즉시 시작
+    # 같은 URL 재처리 시 조건부 GET(ETag/Last-Modified)으로 다운로드·파싱을 건너뛰는 캐시
+    SCRAPER_HTTP_CACHE_ENABLED: bool = True
+    SCRAPER_HTTP_CACHE_PATH: str = ".cache/scraper/pages.sqlite3"
+    SCRAPER_HTTP_CACHE_MAX_ENTRIES: int = 5_000
+    SCRAPER_HTTP_CACHE_TTL_SECONDS: float = 7 * 24 * 3600  # 재검증용 보관 기간 (신선도는 Cache-Control)
+    SCRAPER_HTTP_CACHE_MAX_BODY_BYTES: int = 5 * 1024 * 1024
 
     # Content Limit
     max_content_length: int = 5000
@@ -43,16 +66,65 @@ class Settings(BaseSettings):
     OPENAI_MODEL: str = "gpt-3.5-turbo"
     OPENAI_MAX_TOKENS: int = 4000
     OPENAI_TEMPERATURE: float = 0.3
+    OPENAI_TIMEOUT_SECONDS: float = 60.0
+    OPENAI_MAX_CONNECTIONS: int = 20
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    OPENAI_KEEPALIVE_EXPIRY_SECONDS: float = 90.0
+    # 동일 프롬프트 재요청 방지용 LLM 응답 캐시
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_PATH: str = ".cache/llm/responses.sqlite3"
+    LLM_CACHE_MAX_ENTRIES: int = 20_000
+    LLM_CACHE_TTL_SECONDS: float = 30 * 24 * 3600
 
     # 벡터 데이터베이스 설정
     QDRANT_URL: Optional[str] = None
     QDRANT_API_KEY: Optional[str] = None
     QDRANT_HOST: str = "localhost"
     QDRANT_PORT: int = 6333
+    QDRANT_HNSW_M: int = 16
+    QDRANT_HNSW_EF_CONSTRUCT: int = 100
+    QDRANT_SEARCH_HNSW_EF: Optional[int] = None
+    QDRANT_QUANTIZATION: str = "none"  # none | int8
+    QDRANT_QUANTIZATION_ALWAYS_RAM: bool = True
+    QDRANT_ON_DISK_VECTORS: bool = False
 
     # 임베딩 모델 설정
-    EMBEDDING_MODEL: str = "jhgan/ko-sroberta-multitask"
-    EMBEDDING_DIMENSION: int = 768
+    EMBEDDING_MODEL: str = "paraphrase-multilingual-mpnet-base-v2"
+    EMBEDDING_DIMENSION: int = 768  # 모델 로드 전 기본값, 로드 후에는 모델 차원을 따른다
+    EMBEDDING_MAX_SEQ_LENGTH: int = 128  # 모델이 max_seq_length를 알려주지 않을 때의 기본값
+    EMBEDDING_WARMUP_ON_STARTUP: bool = True
+    EMBEDDING_MODE: str = "local"  # local | remote (app.embedding_server)
+    EMBEDDING_SERVER_URL: str = "http://127.0.0.1:8100"
+    EMBEDDING_SERVER_UDS: Optional[str] = None  # 설정 시 Unix socket으로 연결
+    EMBEDDING_SERVER_TIMEOUT: float = 30.0
+    EMBEDDING_BACKEND: str = "torch"  # torch | onnx | onnx-int8
+    EMBEDDING_ONNX_DIR: str = ".cache/onnx"
+    EMBEDDING_ONNX_THREADS: int = 0  # 0이면 onnxruntime 기본값
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_DIR: str = ".cache/embeddings"
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 100_000
+    EMBEDDING_EXECUTOR_WORKERS: int = 2
+    EMBEDDING_BATCH_ENABLED: bool = True
+    EMBEDDING_BATCH_MAX_WAIT_MS: float = 5.0  # 첫 요청 후 최대 대기 시간
+    EMBEDDING_BATCH_MAX_SIZE: int = 32
+    QUERY_EMBEDDING_CACHE_SIZE: int = 2048
+    QUERY_EMBEDDING_CACHE_TTL_SECONDS: float = 900.0
+
+    # 청킹 설정
+    CHUNKING_MODE: str = "chars"  # chars | tokens (임베딩 모델 tokenizer 기준)
+    CHUNK_MAX_TOKENS: Optional[int] = None  # None이면 임베딩 모델 max_seq_length
+    CHUNK_OVERLAP_TOKENS: int = 24
+    CHUNK_RESERVED_TAG_TOKENS: int = 16  # 검색 텍스트 뒤에 붙는 태그 몫
+
+    # 요약 설정
+    SUMMARY_CHUNK_CONCURRENCY: int = 4  # 긴 문서 chunk 요약 동시 요청 수
+
+    # 검색 설정
+    SEARCH_GROUP_BY_CONTENT: bool = True  # Qdrant query-groups로 콘텐츠 단위 검색
+    SEARCH_GROUP_SIZE: int = 3  # 콘텐츠당 반환할 최대 chunk 수
+    DOCUMENT_METADATA_CACHE_SIZE: int = 4096  # 검색 결과 제목/요약/태그 캐시
+    # invalidate는 프로세스 로컬이라 다른 worker의 수정은 이 시간만큼 늦게 보인다. 길게 잡지 말 것
+    DOCUMENT_METADATA_CACHE_TTL_SECONDS: float = 120.0
 
     # RAG 시스템 설정
     MAX_SEARCH_RESULTS: int = 5
@@ -63,7 +135,7 @@ class Settings(BaseSettings):
         env_file = ".env"
         case_sensitive = False
 
-    @field_validator("ALLOWED_ORIGINS", mode="before")
+    @field_validator("ALLOWED_ORIGINS", "SCRAPER_READER_FIRST_DOMAINS", mode="before")
     @classmethod
     def parse_allowed_origins(cls, value):
         """Allow JSON array or comma-separated origins in env values."""
@@ -1,58 +1,223 @@
+import asyncio
 import logging
+from typing import Any, Dict, Optional, Set, Tuple
 
-from qdrant_client import QdrantClient
-from qdrant_client.http.models import Distance, VectorParams
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.http.models import (
+    Disabled,
+    Distance,
+    HnswConfigDiff,
+    PayloadSchemaType,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    VectorParams,
+    VectorParamsDiff,
+)
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# 모든 검색이 필터로 쓰는 payload 필드
+PAYLOAD_INDEXES = {
+    "user_id": PayloadSchemaType.INTEGER,
+    "content_id": PayloadSchemaType.INTEGER,
+    "is_public": PayloadSchemaType.BOOL,
+}
+
+
+def _scalar_params(quantization: Any) -> Optional[Tuple[str, Optional[float], Optional[bool]]]:
+    """ScalarQuantization 설정을 비교 가능한 값으로 바꾼다. scalar 양자화가 아니면 None."""
+    scalar = getattr(quantization, "scalar", None)
+    if scalar is None:
+        return None
+    scalar_type = getattr(scalar, "type", None)
+    return (
+        str(getattr(scalar_type, "value", scalar_type)).lower(),
+        getattr(scalar, "quantile", None),
+        getattr(scalar, "always_ram", None),
+    )
+
 
 class VectorDBConfig:
     """Qdrant client configuration and collection management."""
 
     def __init__(self):
         if settings.QDRANT_URL:
-            self.client = QdrantClient(
-                url=settings.QDRANT_URL,
-                api_key=settings.QDRANT_API_KEY,
-                timeout=30,
-            )
+            self._client_kwargs: Dict[str, Any] = {
+                "url": settings.QDRANT_URL,
+                "api_key": settings.QDRANT_API_KEY,
+                "timeout": 30,
+            }
         else:
-            self.client = QdrantClient(
-                host=settings.QDRANT_HOST,
-                port=settings.QDRANT_PORT,
-                timeout=30,
-            )
+            self._client_kwargs = {
+                "host": settings.QDRANT_HOST,
+                "port": settings.QDRANT_PORT,
+                "timeout": 30,
+            }
+
+        self.client = QdrantClient(**self._client_kwargs)
+        self._async_client: Optional[AsyncQdrantClient] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        # 루프가 바뀌어 교체된 클라이언트를 닫는 task (GC로 사라지지 않게 참조를 둔다)
+        self._closing: Set[asyncio.Task] = set()
 
         self.collection_name = "content_embeddings"
-        self.vector_size = 768
+
+    @property
+    def vector_size(self) -> int:
+        """컬렉션 벡터 크기는 설정된 임베딩 모델의 출력 차원을 따른다."""
+        from app.services.embedding_service import embedding_service
+
+        return embedding_service.dimension
+
+    @property
+    def async_client(self) -> AsyncQdrantClient:
+        """현재 이벤트 루프에 묶인 AsyncQdrantClient.
+
+        커넥션 풀은 생성된 루프에 종속되므로, asyncio.run을 반복 호출하는
+        워커에서는 루프가 바뀔 때마다 새 클라이언트를 만들고 이전 클라이언트는 닫는다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            previous = self._async_client
+            self._async_client = AsyncQdrantClient(**self._client_kwargs)
+            self._async_client_loop = loop
+            if previous is not None:
+                task = loop.create_task(self._close_client(previous))
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+        return self._async_client
+
+    @staticmethod
+    async def _close_client(client: AsyncQdrantClient) -> None:
+        try:
+            await client.close()
+        except Exception as e:
+            # 이전 루프가 이미 닫혔으면 소켓 정리가 실패할 수 있다. 참조는 여기서 끊긴다
+            logger.debug("Failed to close replaced AsyncQdrantClient: %s", e)
+
+    async def aclose(self) -> None:
+        """현재 루프의 AsyncQdrantClient를 닫는다 (워커 런타임 종료 시 호출)."""
+        client, self._async_client, self._async_client_loop = self._async_client, None, None
+        if client is not None:
+            await self._close_client(client)
+
+    @property
+    def search_params(self) -> Optional[SearchParams]:
+        """검색 시점 HNSW ef / 양자화 재채점 설정."""
+        quantization_enabled = settings.QDRANT_QUANTIZATION.lower() == "int8"
+        if settings.QDRANT_SEARCH_HNSW_EF is None and not quantization_enabled:
+            return None
+        return SearchParams(
+            hnsw_ef=settings.QDRANT_SEARCH_HNSW_EF,
+            quantization=QuantizationSearchParams(rescore=True) if quantization_enabled else None,
+        )
+
+    def _quantization_config(self) -> Optional[ScalarQuantization]:
+        if settings.QDRANT_QUANTIZATION.lower() != "int8":
+            return None
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(
+                type=ScalarType.INT8,
+                quantile=0.99,
+                always_ram=settings.QDRANT_QUANTIZATION_ALWAYS_RAM,
+            )
+        )
 
     async def setup_collection(self):
         try:
-            collections = self.client.get_collections()
+            client = self.async_client
+            collections = await client.get_collections()
             collection_names = [collection.name for collection in collections.collections]
 
             if self.collection_name not in collection_names:
-                self.client.create_collection(
+                await client.create_collection(
                     collection_name=self.collection_name,
                     vectors_config=VectorParams(
                         size=self.vector_size,
                         distance=Distance.COSINE,
+                        on_disk=settings.QDRANT_ON_DISK_VECTORS,
                     ),
+                    hnsw_config=HnswConfigDiff(
+                        m=settings.QDRANT_HNSW_M,
+                        ef_construct=settings.QDRANT_HNSW_EF_CONSTRUCT,
+                    ),
+                    quantization_config=self._quantization_config(),
                     on_disk_payload=False,
                 )
                 logger.info("Created Qdrant collection: %s", self.collection_name)
+                payload_schema = {}
             else:
                 logger.info("Using existing Qdrant collection: %s", self.collection_name)
+                info = await client.get_collection(self.collection_name)
+                await self._reconcile_collection(client, info)
+                payload_schema = info.payload_schema or {}
+
+            await self._ensure_payload_indexes(client, payload_schema)
 
         except Exception as e:
             logger.error("Failed to configure Qdrant: %s", e)
             raise
 
+    async def _reconcile_collection(self, client: AsyncQdrantClient, info: Any) -> None:
+        """기존 컬렉션의 HNSW / 양자화 / on-disk 설정을 Settings 값에 맞춘다."""
+        config = info.config
+        vectors = config.params.vectors
+        if hasattr(vectors, "size") and vectors.size != self.vector_size:
+            logger.error(
+                "Qdrant vector size mismatch: collection=%s expected=%s (re-create the collection)",
+                vectors.size,
+                self.vector_size,
+            )
+
+        update_kwargs: Dict[str, Any] = {}
+        hnsw = config.hnsw_config
+        if hnsw.m != settings.QDRANT_HNSW_M or hnsw.ef_construct != settings.QDRANT_HNSW_EF_CONSTRUCT:
+            update_kwargs["hnsw_config"] = HnswConfigDiff(
+                m=settings.QDRANT_HNSW_M,
+                ef_construct=settings.QDRANT_HNSW_EF_CONSTRUCT,
+            )
+
+        if bool(getattr(vectors, "on_disk", False)) != settings.QDRANT_ON_DISK_VECTORS:
+            update_kwargs["vectors_config"] = {"": VectorParamsDiff(on_disk=settings.QDRANT_ON_DISK_VECTORS)}
+
+        desired_quantization = self._quantization_config()
+        existing_quantization = config.quantization_config
+        if desired_quantization is None:
+            if existing_quantization is not None:
+                update_kwargs["quantization_config"] = Disabled.DISABLED
+        elif _scalar_params(existing_quantization) != _scalar_params(desired_quantization):
+            # 켜고 끄는 것뿐 아니라 always_ram / quantile 등 파라미터 변경도 반영한다
+            update_kwargs["quantization_config"] = desired_quantization
+
+        if update_kwargs:
+            await client.update_collection(collection_name=self.collection_name, **update_kwargs)
+            logger.info(
+                "Reconciled Qdrant collection %s: %s",
+                self.collection_name,
+                ", ".join(sorted(update_kwargs)),
+            )
+
+    async def _ensure_payload_indexes(self, client: AsyncQdrantClient, payload_schema: Dict[str, Any]) -> None:
+        """검색 필터에 쓰는 payload 필드에 인덱스가 없으면 만든다."""
+        for field_name, field_schema in PAYLOAD_INDEXES.items():
+            if field_name in payload_schema:
+                continue
+            await client.create_payload_index(
+                collection_name=self.collection_name,
+                field_name=field_name,
+                field_schema=field_schema,
+                wait=True,
+            )
+            logger.info("Created Qdrant payload index: %s.%s", self.collection_name, field_name)
+
     async def recreate_collection(self):
         try:
-            self.client.delete_collection(self.collection_name)
+            await self.async_client.delete_collection(self.collection_name)
             logger.info("Deleted existing Qdrant collection: %s", self.collection_name)
         except Exception:
             logger.info("Qdrant collection did not exist before recreate.")
@@ -0,0 +1,76 @@
+"""
+로컬 임베딩 서버.
+
+uvicorn worker와 Celery 자식 프로세스가 각자 모델을 올리는 대신, 이 프로세스 하나가
+모델을 소유하고 encode 요청을 처리한다. 단건 요청은 EmbeddingBatcher로 프로세스 간에도 묶인다.
+클라이언트는 EMBEDDING_MODE=remote 로 설정한다.
+
+Usage:
+    python -m app.embedding_server
+"""
+import logging
+from typing import List
+from urllib.parse import urlparse
+
+from fastapi import FastAPI
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+from app.services.embedding_service import EmbeddingService
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+app = FastAPI(title="SmartCurator Embedding Server", version="0.1.0")
+service = EmbeddingService(mode="local")
+
+
+class EmbedRequest(BaseModel):
+    texts: List[str] = Field(..., max_length=1024)
+
+
+class EmbedResponse(BaseModel):
+    model: str
+    dimension: int
+    embeddings: List[List[float]]
+
+
+@app.on_event("startup")
+async def startup_event():
+    await service.awarm_up()
+
+
+@app.get("/health")
+async def health_check():
+    return {
+        "status": "healthy",
+        "model": service.model_name,
+        "backend": service.backend,
+        "dimension": service.dimension,
+        "max_seq_length": service.max_seq_length,
+        "batcher": service.batcher.stats(),
+        "embedding_disk": service.cache.stats() if service.cache else None,
+    }
+
+
+@app.post("/embed", response_model=EmbedResponse)
+async def embed(request: EmbedRequest):
+    if len(request.texts) == 1:
+        # 여러 클라이언트의 단건 질의를 한 번의 forward pass로 묶는다
+        embeddings = [await service.agenerate_embedding(request.texts[0])]
+    else:
+        embeddings = await service.agenerate_batch_embeddings(request.texts)
+    return EmbedResponse(model=service.model_name, dimension=service.dimension, embeddings=embeddings)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    if settings.EMBEDDING_SERVER_UDS:
+        uvicorn.run(app, uds=settings.EMBEDDING_SERVER_UDS)
+    else:
+        parsed = urlparse(settings.EMBEDDING_SERVER_URL)
+        uvicorn.run(app, host=parsed.hostname or "127.0.0.1", port=parsed.port or 8100)
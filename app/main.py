@@ -37,6 +37,13 @@ app.add_middleware(
 async def startup_event():
     """서비스 시작 시 DB와 검색 컬렉션을 준비한다."""
     await init_db()
+    if settings.EMBEDDING_WARMUP_ON_STARTUP:
+        from app.services.embedding_service import embedding_service
+
+        try:
+            await embedding_service.awarm_up()
+        except Exception as e:
+            logger.warning("임베딩 모델 warm-up 실패(첫 요청 시 로드): %s", e)
     try:
         await vector_db.setup_collection()
     except Exception as e:
@@ -62,6 +69,26 @@ async def health_check():
     }
 
 
+@app.get("/health/cache")
+async def cache_metrics():
+    """임베딩 캐시 적중률 등 검색 경로 캐시 지표."""
+    from app.services.ai_service import get_llm_response_cache
+    from app.services.embedding_service import embedding_service
+    from app.services.scraper_service import get_scraper_http_cache
+    from app.services.vector_service import vector_service
+
+    llm_cache = get_llm_response_cache()
+    page_cache = get_scraper_http_cache()
+    return {
+        "query_embedding": vector_service.query_embedding_cache.stats(),
+        "document_metadata": vector_service.document_cache.stats(),
+        "embedding_disk": embedding_service.cache.stats() if embedding_service.cache else None,
+        "embedding_batcher": embedding_service.batcher.stats(),
+        "llm_response": llm_cache.stats() if llm_cache else None,
+        "scraper_http": page_cache.stats() if page_cache else None,
+    }
+
+
 app.include_router(auth.router)
 app.include_router(content.router)
 app.include_router(search.router)
@@ -22,6 +22,8 @@ class Content(Base):
     summary = Column(Text, nullable=True)
     tags = Column(JSON, nullable=True)
     processing_error = Column(Text, nullable=True)
+    # 원문 청킹 결과(오프셋/해시). 요약과 벡터 색인이 같은 chunk를 공유한다.
+    chunk_artifact = Column(JSON, nullable=True)
 
     status = Column(String(20), default="pending")
     is_public = Column(Boolean, default=False)
@@ -1,22 +1,80 @@
-﻿import json
+﻿import asyncio
+import hashlib
+import json
 import logging
 import re
+from types import SimpleNamespace
 from typing import Any, Dict, List, Optional, Tuple
 
 from app.core.config import settings
+from app.utils.disk_cache import DiskCache
+from app.utils.json_repair import repair_json
 
 
 logger = logging.getLogger(__name__)
 
 
+# _chat_json 응답이 어느 단계에서 파싱됐는지 집계 (direct → local_repair → llm_repair)
+JSON_PARSE_STATS: Dict[str, int] = {"direct": 0, "local_repair": 0, "llm_repair": 0, "failed": 0}
+
+
+def _record_json_tier(tier: str) -> None:
+    JSON_PARSE_STATS[tier] += 1
+
+
+_response_cache: Optional[DiskCache] = None
+
+
+def get_llm_response_cache() -> Optional[DiskCache]:
+    """LLM 응답 디스크 캐시. 프로세스(fork 이후 자식)마다 첫 사용 시 연다."""
+    global _response_cache
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+    if _response_cache is None:
+        try:
+            _response_cache = DiskCache(
+                settings.LLM_CACHE_PATH,
+                max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+                ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+            )
+        except Exception as e:
+            logger.warning("LLM 응답 캐시 초기화 실패(캐시 없이 진행): %s", e)
+            return None
+    return _response_cache
+
+
+def _cached_completion(content: str, finish_reason: str = "stop") -> SimpleNamespace:
+    """캐시 적중 시 OpenAI 응답 대신 돌려주는 최소 형태 (choices[0].message.content, usage)."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content), finish_reason=finish_reason)],
+        usage=SimpleNamespace(prompt_tokens=0, completion_tokens=0, total_tokens=0),
+        cached=True,
+    )
+
+
+def build_openai_http_client():
+    """OpenAI 호출용 httpx.AsyncClient. 생성한 이벤트 루프에서만 사용해야 한다."""
+    import httpx
+
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.OPENAI_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        timeout=httpx.Timeout(settings.OPENAI_TIMEOUT_SECONDS, connect=10.0),
+    )
+
+
 class AIService:
     """OpenAI GPT를 활용한 AI 서비스"""
 
-    def __init__(self):
+    def __init__(self, http_client: Optional[Any] = None):
         try:
             from openai import AsyncOpenAI
 
-            self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+            # http_client를 넘기면(워커 런타임) keep-alive 커넥션 풀을 프로세스 수명 동안 재사용한다
+            self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY, http_client=http_client)
         except ImportError:
             import openai
 
@@ -299,6 +357,7 @@ JSON만 반환:
                 user_message=prompt,
                 max_tokens=600,
                 temperature=0.2,
+                use_cache=False,
             )
             answer = (response.choices[0].message.content or "").strip()
             logger.info(f"✅ RAG 질답 완료: {answer[:50]}...")
@@ -400,6 +459,7 @@ chunk 요약들:
         user_message: str,
         max_tokens: int,
         temperature: float,
+        use_cache: bool = True,
     ) -> Dict[str, Any]:
         response = await self._chat_completion(
             system_message=system_message,
@@ -407,17 +467,38 @@ chunk 요약들:
             max_tokens=max_tokens,
             temperature=temperature,
             force_json=True,
+            use_cache=use_cache,
         )
         raw = response.choices[0].message.content or "{}"
         try:
-            return self._extract_json(raw)
+            data = self._extract_json(raw)
+            _record_json_tier("direct")
+            return data
         except json.JSONDecodeError as exc:
-            logger.warning("JSON 파싱 실패, 복구 시도: %s", exc)
+            # LLM 재요청 전에 로컬 복구(trailing comma, 따옴표, 잘린 괄호 등)를 먼저 시도한다
+            try:
+                repaired = repair_json(raw)
+                if isinstance(repaired, dict):
+                    _record_json_tier("local_repair")
+                    # 복구된 결과는 잘렸을 수 있으므로 캐시에 남기지 않는다 (이전 버전이 저장한 항목 포함)
+                    await self._invalidate_cached_response(system_message, user_message, max_tokens, temperature, True)
+                    logger.info("JSON 로컬 복구 성공: %s", JSON_PARSE_STATS)
+                    return repaired
+            except json.JSONDecodeError:
+                pass
+
+            logger.warning("JSON 파싱 실패, LLM 복구 시도: %s", exc)
             try:
                 repaired_raw = await self._repair_json_with_llm(raw, max_tokens=max_tokens)
-                return self._extract_json(repaired_raw)
+                data = self._extract_json(repaired_raw)
+                _record_json_tier("llm_repair")
+                await self._invalidate_cached_response(system_message, user_message, max_tokens, temperature, True)
+                return data
             except json.JSONDecodeError as exc2:
-                logger.warning("JSON 복구 후에도 파싱 실패: %s", exc2)
+                _record_json_tier("failed")
+                logger.warning("JSON 복구 후에도 파싱 실패: %s (%s)", exc2, JSON_PARSE_STATS)
+                # 깨진 응답이 캐시에 남아 재처리 때마다 같은 실패를 반복하지 않도록 지운다
+                await self._invalidate_cached_response(system_message, user_message, max_tokens, temperature, True)
                 raise exc2 from exc
 
     async def _chat_completion(
@@ -427,6 +508,90 @@ chunk 요약들:
         max_tokens: int,
         temperature: float,
         force_json: bool = False,
+        use_cache: bool = True,
+    ):
+        """LLM 호출. 같은 (모델, 프롬프트, 파라미터)의 응답은 디스크 캐시에서 돌려준다."""
+        cache = get_llm_response_cache() if use_cache else None
+        cache_key = None
+        if cache is not None:
+            cache_key = self._response_cache_key(system_message, user_message, max_tokens, temperature, force_json)
+            try:
+                cached = await asyncio.to_thread(cache.get_json, cache_key)
+            except Exception as e:
+                logger.warning("LLM 응답 캐시 조회 실패: %s", e)
+                cached = None
+            if cached is not None:
+                logger.info("LLM_CACHE_LOG hit model=%s hit_rate=%.3f", self.model_name, cache.hit_rate)
+                return _cached_completion(cached["content"], cached.get("finish_reason", "stop"))
+
+        response = await self._request_completion(system_message, user_message, max_tokens, temperature, force_json)
+
+        if cache_key is not None and self._is_cacheable_completion(response, force_json):
+            content = response.choices[0].message.content
+            try:
+                await asyncio.to_thread(cache.set_json, cache_key, {"content": content, "finish_reason": "stop"})
+            except Exception as e:
+                logger.warning("LLM 응답 캐시 저장 실패: %s", e)
+        return response
+
+    def _is_cacheable_completion(self, response: Any, force_json: bool) -> bool:
+        """정상 종료(stop)했고 JSON 모드면 복구 없이 바로 파싱되는 응답만 캐시한다.
+
+        잘린(length) 응답이나 repair_json으로만 살릴 수 있는 응답을 캐시하면
+        재처리할 때마다 같은 부분 요약이 돌아온다.
+        """
+        if not response.choices:
+            return False
+        choice = response.choices[0]
+        content = choice.message.content
+        if not content or getattr(choice, "finish_reason", None) != "stop":
+            return False
+        if not force_json:
+            return True
+        try:
+            self._extract_json(content)
+        except json.JSONDecodeError:
+            return False
+        return True
+
+    def _response_cache_key(
+        self,
+        system_message: str,
+        user_message: str,
+        max_tokens: int,
+        temperature: float,
+        force_json: bool,
+    ) -> str:
+        fingerprint = json.dumps(
+            {
+                "model": self.model_name,
+                "system": system_message,
+                "user": user_message,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+                "force_json": force_json,
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+    async def _invalidate_cached_response(self, *key_args: Any) -> None:
+        cache = get_llm_response_cache()
+        if cache is None:
+            return
+        try:
+            await asyncio.to_thread(cache.delete, self._response_cache_key(*key_args))
+        except Exception as e:
+            logger.warning("LLM 응답 캐시 삭제 실패: %s", e)
+
+    async def _request_completion(
+        self,
+        system_message: str,
+        user_message: str,
+        max_tokens: int,
+        temperature: float,
+        force_json: bool = False,
     ):
         if self.client:
             payload: Dict[str, Any] = {
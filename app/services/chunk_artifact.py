@@ -0,0 +1,176 @@
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.utils.text_chunking import (
+    count_tokens,
+    iter_chunk_spans,
+    normalize_text,
+    split_into_token_chunks,
+)
+
+logger = logging.getLogger(__name__)
+
+CHUNK_ARTIFACT_VERSION = 1
+CHAR_CHUNK_SIZE = 1100
+CHAR_CHUNK_OVERLAP = 180
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ChunkArtifact:
+    """콘텐츠 버전 하나의 청킹 결과.
+
+    chunk 문자열 대신 정규화된 원문 기준 오프셋만 저장한다.
+    source_hash / params가 같으면 요약과 색인 단계가 다시 나누지 않고 재사용한다.
+    """
+
+    source_hash: str
+    params: Dict[str, Any]
+    spans: List[Tuple[int, int]]
+    token_counts: Optional[List[int]] = None
+    # tokens 모드에서만 채운다: 요약 단계용 문자 기준 span (임베딩 chunk는 요약하기엔 너무 잘다)
+    summary_spans: Optional[List[Tuple[int, int]]] = None
+    _normalized: Optional[str] = field(default=None, repr=False, compare=False)
+
+    def bind(self, normalized: str) -> "ChunkArtifact":
+        self._normalized = normalized
+        return self
+
+    def texts(self) -> List[str]:
+        return self._slice(self.spans)
+
+    def summary_texts(self) -> List[str]:
+        """요약 단계용 chunk. 청킹 모드와 관계없이 문자 기준(CHAR_CHUNK_SIZE)으로 나뉜다."""
+        if self.params.get("mode") != "tokens":
+            return self.texts()
+        if self.summary_spans is None:
+            # summary_spans 이전에 저장된 artifact
+            self.summary_spans = _char_spans(self._require_normalized())
+        return self._slice(self.summary_spans)
+
+    def _require_normalized(self) -> str:
+        if self._normalized is None:
+            raise ValueError("ChunkArtifact is not bound to its source text")
+        return self._normalized
+
+    def _slice(self, spans: List[Tuple[int, int]]) -> List[str]:
+        normalized = self._require_normalized()
+        return [normalized[start:end] for start, end in spans]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "source_hash": self.source_hash,
+            "params": self.params,
+            "spans": [list(span) for span in self.spans],
+            "token_counts": self.token_counts,
+            "summary_spans": [list(span) for span in self.summary_spans] if self.summary_spans is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ChunkArtifact":
+        return cls(
+            source_hash=data["source_hash"],
+            params=data["params"],
+            spans=[(int(start), int(end)) for start, end in data["spans"]],
+            token_counts=data.get("token_counts"),
+            summary_spans=(
+                [(int(start), int(end)) for start, end in data["summary_spans"]]
+                if data.get("summary_spans") is not None
+                else None
+            ),
+        )
+
+
+def current_chunk_params(title: str = "") -> Dict[str, Any]:
+    """현재 설정으로 청킹할 때의 파라미터. 저장된 artifact와 비교해 재사용 여부를 정한다."""
+    if settings.CHUNKING_MODE.lower() != "tokens":
+        return {
+            "version": CHUNK_ARTIFACT_VERSION,
+            "mode": "chars",
+            "chunk_size": CHAR_CHUNK_SIZE,
+            "overlap": CHAR_CHUNK_OVERLAP,
+        }
+
+    from app.services.embedding_service import embedding_service
+
+    # 검색 텍스트에 붙는 제목과 special token(CLS/SEP), 태그 몫을 미리 뺀다.
+    # 태그는 요약 뒤에 정해지므로 고정 예산으로 잡아 파라미터가 흔들리지 않게 한다.
+    reserved = count_tokens(embedding_service.tokenizer, title) + 2 + settings.CHUNK_RESERVED_TAG_TOKENS
+    return {
+        "version": CHUNK_ARTIFACT_VERSION,
+        "mode": "tokens",
+        "model": embedding_service.model_name,
+        "max_tokens": settings.CHUNK_MAX_TOKENS or embedding_service.max_seq_length,
+        "overlap_tokens": settings.CHUNK_OVERLAP_TOKENS,
+        "reserved_tokens": reserved,
+    }
+
+
+def build_chunk_artifact(text: str, title: str = "") -> ChunkArtifact:
+    normalized = normalize_text(text)
+    params = current_chunk_params(title)
+    return _build(normalized, _sha256(normalized), params)
+
+
+def _char_spans(
+    normalized: str,
+    chunk_size: int = CHAR_CHUNK_SIZE,
+    overlap: int = CHAR_CHUNK_OVERLAP,
+) -> List[Tuple[int, int]]:
+    return [(span.start, span.end) for span in iter_chunk_spans(normalized, chunk_size, overlap)]
+
+
+def _build(normalized: str, source_hash: str, params: Dict[str, Any]) -> ChunkArtifact:
+    token_counts: Optional[List[int]] = None
+    summary_spans: Optional[List[Tuple[int, int]]] = None
+    if params["mode"] == "tokens":
+        from app.services.embedding_service import embedding_service
+
+        token_chunks = split_into_token_chunks(
+            normalized,
+            embedding_service.tokenizer,
+            max_tokens=params["max_tokens"],
+            overlap_tokens=params["overlap_tokens"],
+            reserved_tokens=params["reserved_tokens"],
+        )
+        spans = [(chunk.start, chunk.end) for chunk in token_chunks]
+        token_counts = [chunk.token_count for chunk in token_chunks]
+        summary_spans = _char_spans(normalized)
+    else:
+        spans = _char_spans(normalized, params["chunk_size"], params["overlap"])
+
+    return ChunkArtifact(
+        source_hash=source_hash,
+        params=params,
+        spans=spans,
+        token_counts=token_counts,
+        summary_spans=summary_spans,
+    ).bind(normalized)
+
+
+def load_or_build_chunk_artifact(
+    stored: Optional[Dict[str, Any]],
+    text: str,
+    title: str = "",
+) -> Tuple[ChunkArtifact, bool]:
+    """저장된 artifact가 현재 원문/설정과 맞으면 재사용하고, 아니면 새로 만든다.
+
+    반환값의 두 번째 항목은 새로 만들었는지 여부다 (True면 호출자가 저장한다).
+    """
+    normalized = normalize_text(text)
+    source_hash = _sha256(normalized)
+    params = current_chunk_params(title)
+    if stored:
+        try:
+            artifact = ChunkArtifact.from_dict(stored)
+            if artifact.source_hash == source_hash and artifact.params == params:
+                return artifact.bind(normalized), False
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning("저장된 chunk artifact를 읽을 수 없어 다시 만듭니다: %s", e)
+    return _build(normalized, source_hash, params), True
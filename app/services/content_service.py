@@ -103,6 +103,10 @@ class ContentService:
 
         await self.db.commit()
         await self.db.refresh(content)
+
+        from app.services.vector_service import vector_service
+
+        vector_service.invalidate_document(content_id)
         return content
 
     async def delete_content(self, content_id: int, user_id: int) -> bool:
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from concurrent.futures import Executor
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+HISTOGRAM_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+
+def _bucket_label(value: int) -> str:
+    lower = 1
+    for upper in HISTOGRAM_BUCKETS:
+        if value <= upper:
+            return str(upper) if lower == upper else f"{lower}-{upper}"
+        lower = upper + 1
+    return f">{HISTOGRAM_BUCKETS[-1]}"
+
+
+class EmbeddingBatcher:
+    """동시에 들어온 단건 임베딩 요청을 모아 한 번의 배치 encode로 처리한다.
+
+    첫 요청 후 max_wait_ms가 지나거나 max_batch_size만큼 쌓이면 executor에서
+    encode_batch를 실행하고, 결과를 호출자별 future에 나눠 돌려준다.
+    대기열은 현재 이벤트 루프에 묶이며 루프가 바뀌면 새로 시작한다.
+    """
+
+    def __init__(
+        self,
+        encode_batch: Callable[[List[str]], List[List[float]]],
+        executor: Executor,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ):
+        self._encode_batch = encode_batch
+        self._executor = executor
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_seconds = max(0.0, max_wait_ms) / 1000
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self.batches = 0
+        self.items = 0
+        self.queue_depth_histogram: Dict[str, int] = {}
+        self.batch_size_histogram: Dict[str, int] = {}
+
+    async def submit(self, text: str) -> List[float]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._pending = []
+            self._flush_handle = None
+
+        future = loop.create_future()
+        self._pending.append((text, future))
+        self._observe(self.queue_depth_histogram, len(self._pending))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait_seconds, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        # 기다리던 호출자가 취소된 항목은 encode하지 않는다
+        batch = [(text, future) for text, future in self._pending if not future.done()]
+        self._pending = []
+        if not batch:
+            return
+
+        self.batches += 1
+        self.items += len(batch)
+        self._observe(self.batch_size_histogram, len(batch))
+        encoded = self._loop.run_in_executor(self._executor, self._encode_batch, [text for text, _ in batch])
+        encoded.add_done_callback(lambda done: self._resolve(batch, done))
+
+    @staticmethod
+    def _resolve(batch: List[Tuple[str, asyncio.Future]], done: asyncio.Future) -> None:
+        error = asyncio.CancelledError() if done.cancelled() else done.exception()
+        if error is not None:
+            logger.error("배치 임베딩 디스패치 실패: %s", error)
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(done.result()[index])
+
+    @staticmethod
+    def _observe(histogram: Dict[str, int], value: int) -> None:
+        label = _bucket_label(value)
+        histogram[label] = histogram.get(label, 0) + 1
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+            "pending": len(self._pending),
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_seconds * 1000,
+            "queue_depth_histogram": dict(self.queue_depth_histogram),
+            "batch_size_histogram": dict(self.batch_size_histogram),
+        }
@@ -0,0 +1,189 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """(모델명, 전처리 텍스트 해시) 키 기반의 디스크 임베딩 캐시.
+
+    벡터는 memory-mapped float32 파일의 고정 슬롯에, 키 → 슬롯 매핑과
+    마지막 접근 시각은 sqlite 인덱스에 저장한다. 슬롯이 가득 차면
+    가장 오래 사용되지 않은 항목의 슬롯을 재사용(LRU)한다.
+
+    슬롯마다 (키, 벡터) 체크섬을 따로 둔다. 인덱스 조회와 memmap 읽기 사이에 다른 프로세스가
+    슬롯을 재사용했거나 쓰기가 중간에 끊긴 경우 체크섬이 맞지 않으므로 미스로 처리한다.
+    """
+
+    def __init__(self, cache_dir: str, model_name: str, dimension: int, max_entries: int):
+        self.model_name = model_name
+        self.dimension = dimension
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        safe_model = "".join(ch if ch.isalnum() else "_" for ch in model_name)
+        base_dir = Path(cache_dir)
+        base_dir.mkdir(parents=True, exist_ok=True)
+        self._vectors_path = base_dir / f"{safe_model}-{dimension}.f32"
+        self._index_path = base_dir / f"{safe_model}-{dimension}.sqlite3"
+        self._checksums_path = base_dir / f"{safe_model}-{dimension}.sum"
+
+        self._conn = sqlite3.connect(str(self._index_path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                slot INTEGER NOT NULL UNIQUE,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access)")
+        self._conn.commit()
+        self._vectors, self._checksums = self._open_vectors()
+
+    def _open_vectors(self) -> Tuple[np.memmap, np.memmap]:
+        vector_shape = (self.max_entries, self.dimension)
+        if (
+            self._vectors_path.exists()
+            and os.path.getsize(self._vectors_path) == self.max_entries * self.dimension * 4
+            and self._checksums_path.exists()
+            and os.path.getsize(self._checksums_path) == self.max_entries * 8
+        ):
+            return (
+                np.memmap(self._vectors_path, dtype=np.float32, mode="r+", shape=vector_shape),
+                np.memmap(self._checksums_path, dtype=np.uint64, mode="r+", shape=(self.max_entries,)),
+            )
+
+        # 용량 설정이 바뀌었거나 파일이 없으면 인덱스와 함께 새로 만든다.
+        if self._vectors_path.exists():
+            logger.info("Embedding cache capacity changed, resetting: %s", self._vectors_path)
+        self._conn.execute("DELETE FROM entries")
+        self._conn.commit()
+        return (
+            np.memmap(self._vectors_path, dtype=np.float32, mode="w+", shape=vector_shape),
+            np.memmap(self._checksums_path, dtype=np.uint64, mode="w+", shape=(self.max_entries,)),
+        )
+
+    @staticmethod
+    def _checksum(key: str, vector: np.ndarray) -> int:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8)
+        digest.update(vector.tobytes())
+        return int.from_bytes(digest.digest(), "little")
+
+    def make_key(self, text: str) -> str:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self.model_name}:{digest}"
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """텍스트별 캐시 벡터를 반환한다. 없으면 None."""
+        if not texts:
+            return []
+        keys = [self.make_key(text) for text in texts]
+        with self._lock:
+            slots: Dict[str, int] = {}
+            unique_keys = list(dict.fromkeys(keys))
+            for start in range(0, len(unique_keys), 500):
+                batch = unique_keys[start : start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, slot FROM entries WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                slots.update(rows)
+
+            if slots:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE entries SET last_access = ? WHERE key = ?",
+                    [(now, key) for key in slots],
+                )
+                self._conn.commit()
+
+            results: List[Optional[List[float]]] = []
+            for key in keys:
+                slot = slots.get(key)
+                vector = np.array(self._vectors[slot]) if slot is not None else None
+                if vector is None or int(self._checksums[slot]) != self._checksum(key, vector):
+                    self.misses += 1
+                    results.append(None)
+                    continue
+                self.hits += 1
+                results.append(vector.tolist())
+            return results
+
+    def put_many(self, texts: Sequence[str], embeddings: Sequence[Sequence[float]]) -> None:
+        """새 벡터를 저장한다. 가득 차면 LRU 슬롯을 재사용한다."""
+        if not texts:
+            return
+        with self._lock:
+            now = time.time()
+            pending: List[Tuple[str, int, np.ndarray]] = []
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for text, embedding in zip(texts, embeddings):
+                    if len(embedding) != self.dimension:
+                        continue
+                    key = self.make_key(text)
+                    row = self._conn.execute("SELECT slot FROM entries WHERE key = ?", (key,)).fetchone()
+                    if row is not None:
+                        slot = row[0]
+                    else:
+                        slot = self._allocate_slot()
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO entries (key, slot, last_access) VALUES (?, ?, ?)",
+                        (key, slot, now),
+                    )
+                    pending.append((key, slot, np.asarray(embedding, dtype=np.float32)))
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+            # 인덱스가 커밋된 뒤에만 슬롯을 덮어쓴다. 커밋 실패 시 롤백된 옛 키가 새 벡터를 가리키지 않는다.
+            # 쓰는 도중 읽힌 슬롯은 체크섬이 맞지 않아 미스가 된다.
+            for key, slot, vector in pending:
+                self._checksums[slot] = 0
+                self._vectors[slot] = vector
+                self._checksums[slot] = self._checksum(key, vector)
+                self.writes += 1
+            self._vectors.flush()
+            self._checksums.flush()
+
+    def _allocate_slot(self) -> int:
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        if count < self.max_entries:
+            return count
+        key, slot = self._conn.execute(
+            "SELECT key, slot FROM entries ORDER BY last_access ASC LIMIT 1"
+        ).fetchone()
+        self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        self.evictions += 1
+        return slot
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        with self._lock:
+            (size,) = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "size": size,
+            "max_entries": self.max_entries,
+        }
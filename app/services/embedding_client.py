@@ -0,0 +1,69 @@
+import logging
+from typing import List, Optional, Union
+
+import httpx
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class RemoteEmbeddingEncoder:
+    """로컬 임베딩 서버(app.embedding_server)에 encode를 위임하는 클라이언트.
+
+    SentenceTransformer.encode와 같은 호출 형태를 제공하므로 EmbeddingService는
+    모델 대신 이 객체를 들고 기존 전처리/배치 경로를 그대로 쓴다.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        uds: Optional[str] = None,
+        timeout: float = 30.0,
+        model_name: Optional[str] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        if transport is None:
+            transport = httpx.HTTPTransport(uds=uds, retries=1) if uds else httpx.HTTPTransport(retries=1)
+        self._client = httpx.Client(base_url=base_url, transport=transport, timeout=timeout)
+
+        response = self._client.get("/health")
+        response.raise_for_status()
+        info = response.json()
+        self.dimension = int(info["dimension"])
+        self.model_name = info["model"]
+        self.max_seq_length = info.get("max_seq_length")
+        self._tokenizer = None
+        if model_name and model_name != self.model_name:
+            logger.warning(
+                "임베딩 서버 모델이 설정과 다릅니다: server=%s expected=%s",
+                self.model_name,
+                model_name,
+            )
+        logger.info("임베딩 서버 연결: %s (%s, dim=%d)", uds or base_url, self.model_name, self.dimension)
+
+    @property
+    def tokenizer(self):
+        """토큰 청킹용 tokenizer는 서버 모델 이름으로 로컬에서 연다 (가중치는 받지 않는다)."""
+        if self._tokenizer is None:
+            from transformers import AutoTokenizer
+
+            name = self.model_name if "/" in self.model_name else f"sentence-transformers/{self.model_name}"
+            self._tokenizer = AutoTokenizer.from_pretrained(name)
+        return self._tokenizer
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dimension
+
+    def encode(self, sentences: Union[str, List[str]], batch_size: int = 32) -> np.ndarray:
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+
+        response = self._client.post("/embed", json={"texts": texts})
+        response.raise_for_status()
+        embeddings = np.asarray(response.json()["embeddings"], dtype=np.float32)
+        return embeddings[0] if single else embeddings
+
+    def close(self) -> None:
+        self._client.close()
@@ -1,31 +1,241 @@
 from sentence_transformers import SentenceTransformer
 import numpy as np
 from typing import List, Optional
+import asyncio
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from app.core.config import settings
+from app.services.embedding_batcher import EmbeddingBatcher
+from app.services.embedding_cache import EmbeddingCache
 
 logger = logging.getLogger(__name__)
 
 class EmbeddingService:
     """텍스트 임베딩 생성 및 유사도 계산 서비스"""
     
-    def __init__(self):
-        # 한/영 멀티링글 모델 (768차원, 한국어·영어 교차 검색 지원)
-        self.model = SentenceTransformer('paraphrase-multilingual-mpnet-base-v2')
-        logger.info("🤖 임베딩 모델 로드 완료")
+    def __init__(self, model_name: Optional[str] = None, mode: Optional[str] = None):
+        # 모델은 첫 사용(또는 warm_up) 시점에 로드해 임베딩을 쓰지 않는 프로세스는 가볍게 뜬다
+        self.model_name = model_name or settings.EMBEDDING_MODEL
+        # local: 프로세스 안에서 모델 실행, remote: 로컬 임베딩 서버에 위임
+        self.mode = (mode or settings.EMBEDDING_MODE).lower()
+        self._model = None
+        self._dimension: Optional[int] = None
+        self._load_lock = threading.Lock()
+        # 디스크 캐시(SQLite + memmap)는 fork 이후 각 프로세스에서 첫 사용 시 연다
+        self.cache: Optional[EmbeddingCache] = None
+        self._cache_opened = False
+        # CPU 바운드 encode를 이벤트 루프 밖에서 돌리기 위한 제한된 스레드 풀
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.EMBEDDING_EXECUTOR_WORKERS),
+            thread_name_prefix="embedding",
+        )
+        # 동시 단건 질의를 모아 한 번에 encode하는 디스패처
+        self.batcher = EmbeddingBatcher(
+            encode_batch=lambda texts: self.generate_batch_embeddings(texts),
+            executor=self._executor,
+            max_batch_size=settings.EMBEDDING_BATCH_MAX_SIZE,
+            max_wait_ms=settings.EMBEDDING_BATCH_MAX_WAIT_MS,
+        )
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._model is not None
+
+    @property
+    def model(self):
+        """SentenceTransformer 또는 같은 encode 인터페이스의 ONNX 인코더"""
+        if self._model is None:
+            self._load_model()
+        return self._model
+
+    @property
+    def dimension(self) -> int:
+        """모델이 실제로 내는 벡터 차원"""
+        if self._dimension is None:
+            self._load_model()
+        return self._dimension
+
+    def _load_model(self) -> None:
+        with self._load_lock:
+            if self._model is not None:
+                return
+            started = perf_counter()
+            model = self._create_model()
+            dimension = int(model.get_sentence_embedding_dimension() or settings.EMBEDDING_DIMENSION)
+            if dimension != settings.EMBEDDING_DIMENSION:
+                logger.warning(
+                    "EMBEDDING_DIMENSION(%s)과 모델 차원(%s)이 다릅니다. 모델 값을 사용합니다.",
+                    settings.EMBEDDING_DIMENSION,
+                    dimension,
+                )
+            self._dimension = dimension
+            self._model = model
+            logger.info(
+                "🤖 임베딩 모델 로드 완료: %s [%s] (%.1fs)",
+                self.model_name,
+                self.backend,
+                perf_counter() - started,
+            )
+
+    @property
+    def tokenizer(self):
+        """모델과 같은 tokenizer (토큰 기준 청킹용)"""
+        return self.model.tokenizer
+
+    @property
+    def max_seq_length(self) -> int:
+        """모델이 실제로 읽는 최대 토큰 수(special token 포함). 넘는 부분은 잘린다."""
+        return int(getattr(self.model, "max_seq_length", None) or settings.EMBEDDING_MAX_SEQ_LENGTH)
+
+    @property
+    def backend(self) -> str:
+        return settings.EMBEDDING_BACKEND.lower()
+
+    @property
+    def cache_namespace(self) -> str:
+        """양자화 등으로 벡터가 달라지는 백엔드는 캐시 키를 분리한다."""
+        if self.backend == "torch":
+            return self.model_name
+        return f"{self.model_name}@{self.backend}"
+
+    def _create_model(self):
+        if self.mode == "remote":
+            from app.services.embedding_client import RemoteEmbeddingEncoder
+
+            return RemoteEmbeddingEncoder(
+                base_url=settings.EMBEDDING_SERVER_URL,
+                uds=settings.EMBEDDING_SERVER_UDS,
+                timeout=settings.EMBEDDING_SERVER_TIMEOUT,
+                model_name=self.model_name,
+            )
+        if self.backend == "torch":
+            return SentenceTransformer(self.model_name)
+        if self.backend in ("onnx", "onnx-int8"):
+            from app.services.onnx_embedding import OnnxSentenceEncoder
+
+            return OnnxSentenceEncoder.from_pretrained(
+                self.model_name,
+                cache_dir=settings.EMBEDDING_ONNX_DIR,
+                quantize=self.backend == "onnx-int8",
+                num_threads=settings.EMBEDDING_ONNX_THREADS,
+            )
+        raise ValueError(f"Unsupported EMBEDDING_BACKEND: {settings.EMBEDDING_BACKEND}")
+
+    def warm_up(self, encode: bool = True) -> None:
+        """모델과 디스크 캐시를 미리 열고, encode=True면 한 번 추론해 첫 요청 지연을 없앤다."""
+        self._load_model()
+        self._get_cache()
+        if encode:
+            self.model.encode(["warm up"])
+
+    def preload_weights(self) -> bool:
+        """prefork 부모 프로세스용: 로컬 모델 가중치만 로드한다.
+
+        SQLite 연결과 httpx 소켓은 fork로 공유하면 안 되므로 디스크 캐시와 원격 클라이언트는
+        열지 않는다. remote 모드는 미리 올릴 가중치가 없으므로 아무것도 하지 않는다.
+        """
+        if self.mode == "remote":
+            return False
+        self._load_model()
+        return True
+
+    def reset_after_fork(self) -> None:
+        """fork된 자식에서 부모가 연 캐시 연결과 원격 클라이언트를 버리고 첫 사용 시 다시 연다."""
+        with self._load_lock:
+            # 부모 소유 연결이므로 close하지 않고 참조만 끊는다
+            self.cache = None
+            self._cache_opened = False
+            if self.mode == "remote":
+                self._model = None
+
+    async def awarm_up(self) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self.warm_up)
+
+    def _build_cache(self) -> Optional[EmbeddingCache]:
+        """설정에 따라 디스크 임베딩 캐시를 연다. 실패해도 임베딩은 계속 동작한다."""
+        # remote 모드에서는 서버가 디스크 캐시를 소유한다
+        if not settings.EMBEDDING_CACHE_ENABLED or self.mode == "remote":
+            return None
+        try:
+            return EmbeddingCache(
+                cache_dir=settings.EMBEDDING_CACHE_DIR,
+                model_name=self.cache_namespace,
+                dimension=self._dimension,
+                max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES,
+            )
+        except Exception as e:
+            logger.warning("임베딩 캐시 초기화 실패(캐시 없이 진행): %s", e)
+            return None
+
+    def _get_cache(self) -> Optional[EmbeddingCache]:
+        if self.cache is None and not self._cache_opened:
+            with self._load_lock:
+                if not self._cache_opened:
+                    self.cache = self._build_cache()
+                    self._cache_opened = True
+        return self.cache
+
+    def _zero_vector(self) -> List[float]:
+        # 실패 경로에서는 모델 로드를 다시 시도하지 않는다
+        return [0.0] * (self._dimension or settings.EMBEDDING_DIMENSION)
+
+    def _cache_get(self, texts: List[str]) -> List[Optional[List[float]]]:
+        cache = self._get_cache()
+        if cache is None:
+            return [None] * len(texts)
+        try:
+            return cache.get_many(texts)
+        except Exception as e:
+            logger.warning("임베딩 캐시 조회 실패: %s", e)
+            return [None] * len(texts)
+
+    def _cache_put(self, texts: List[str], embeddings: List[List[float]]) -> None:
+        cache = self._get_cache()
+        if cache is None:
+            return
+        try:
+            cache.put_many(texts, embeddings)
+        except Exception as e:
+            logger.warning("임베딩 캐시 저장 실패: %s", e)
     
+    async def agenerate_embedding(self, text: str) -> List[float]:
+        """generate_embedding을 전용 executor에서 실행하는 비동기 버전.
+
+        배치 디스패처가 켜져 있으면 동시에 들어온 질의와 묶어 한 번에 encode한다.
+        """
+        if settings.EMBEDDING_BATCH_ENABLED and text and text.strip():
+            return await self.batcher.submit(text)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.generate_embedding, text)
+
+    async def agenerate_batch_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """generate_batch_embeddings를 전용 executor에서 실행하는 비동기 버전"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.generate_batch_embeddings, texts)
+
     def generate_embedding(self, text: str) -> List[float]:
         """단일 텍스트의 임베딩 벡터 생성"""
         if not text or not text.strip():
-            return [0.0] * 768
+            return self._zero_vector()
             
         try:
             clean_text = self._preprocess_text(text)
-            embedding = self.model.encode(clean_text)
-            return embedding.tolist()
+            model = self.model
+            cached = self._cache_get([clean_text])[0]
+            if cached is not None:
+                return cached
+
+            embedding = model.encode(clean_text).tolist()
+            self._cache_put([clean_text], [embedding])
+            return embedding
             
         except Exception as e:
             logger.error(f"임베딩 생성 오류: {e}")
-            return [0.0] * 768
+            return self._zero_vector()
     
     def generate_batch_embeddings(self, texts: List[str]) -> List[List[float]]:
         """여러 텍스트의 배치 임베딩 생성 (성능 최적화)"""
@@ -34,12 +244,24 @@ class EmbeddingService:
             
         try:
             clean_texts = [self._preprocess_text(text) for text in texts]
-            embeddings = self.model.encode(clean_texts, batch_size=32)
-            return [emb.tolist() for emb in embeddings]
+            model = self.model
+            embeddings = self._cache_get(clean_texts)
+            missing = [index for index, embedding in enumerate(embeddings) if embedding is None]
+            if not missing:
+                return embeddings
+
+            # 길이순으로 정렬해 배치 내 padding 낭비를 줄이고, 결과는 원래 순서로 복원한다
+            order = sorted(missing, key=lambda i: len(clean_texts[i]))
+            sorted_embeddings = model.encode([clean_texts[i] for i in order], batch_size=32)
+
+            for position, index in enumerate(order):
+                embeddings[index] = sorted_embeddings[position].tolist()
+            self._cache_put([clean_texts[i] for i in order], [embeddings[i] for i in order])
+            return embeddings
             
         except Exception as e:
             logger.error(f"배치 임베딩 생성 오류: {e}")
-            return [[0.0] * 768 for _ in texts]
+            return [self._zero_vector() for _ in texts]
     
     def calculate_similarity(self, embedding1: List[float], embedding2: List[float]) -> float:
         """두 임베딩 간 코사인 유사도 계산"""
@@ -0,0 +1,214 @@
+import json
+import logging
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, List, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ONNX_MODEL_FILE = "model.onnx"
+ONNX_INT8_MODEL_FILE = "model.int8.onnx"
+ENCODER_CONFIG_FILE = "encoder_config.json"
+
+
+def mean_pool(last_hidden_state: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+    """SentenceTransformer Pooling(mean)과 같은 방식으로 padding 토큰을 제외하고 평균한다."""
+    mask = attention_mask[..., None].astype(np.float32)
+    summed = (last_hidden_state * mask).sum(axis=1)
+    counts = np.clip(mask.sum(axis=1), 1e-9, None)
+    return summed / counts
+
+
+def l2_normalize(embeddings: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return embeddings / np.clip(norms, 1e-12, None)
+
+
+class OnnxSentenceEncoder:
+    """SentenceTransformer(Transformer + mean pooling)를 ONNX Runtime으로 실행하는 CPU 인코더.
+
+    SentenceTransformer.encode와 같은 호출 형태를 제공해 EmbeddingService에서 그대로 바꿔 쓸 수 있다.
+    허용 오차(torch 경로 대비 코사인 유사도): fp32 ONNX ≥ 0.9999, 동적 int8 양자화 ≥ 0.99.
+    """
+
+    def __init__(
+        self,
+        session: Any,
+        tokenizer: Any,
+        max_seq_length: int,
+        dimension: int,
+        normalize: bool = False,
+    ):
+        self.session = session
+        self.tokenizer = tokenizer
+        self.max_seq_length = max_seq_length
+        self.dimension = dimension
+        self.normalize = normalize
+        self._input_names = {node.name for node in session.get_inputs()}
+
+    @classmethod
+    def from_pretrained(
+        cls,
+        model_name: str,
+        cache_dir: str,
+        quantize: bool = False,
+        num_threads: int = 0,
+    ) -> "OnnxSentenceEncoder":
+        """내보낸 ONNX 모델을 연다. 없으면 한 번 export(및 int8 양자화)해 cache_dir에 저장한다.
+
+        여러 worker가 동시에 처음 떠도 파일 락으로 한 프로세스만 export하고,
+        파일은 임시 이름으로 쓴 뒤 os.replace로 옮기므로 반쯤 쓰인 모델을 열지 않는다.
+        """
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        model_dir = Path(cache_dir) / "".join(ch if ch.isalnum() else "_" for ch in model_name)
+        fp32_path = model_dir / ONNX_MODEL_FILE
+        model_path = model_dir / ONNX_INT8_MODEL_FILE if quantize else fp32_path
+        # encoder_config.json은 export 마지막에 옮기므로 완료 표시로 쓴다
+        config_path = model_dir / ENCODER_CONFIG_FILE
+        if not (config_path.exists() and model_path.exists()):
+            with _export_lock(model_dir):
+                # 락을 기다리는 동안 다른 worker가 끝냈을 수 있다
+                if not (config_path.exists() and fp32_path.exists()):
+                    export_onnx_model(model_name, model_dir)
+                if quantize and not model_path.exists():
+                    quantize_onnx_model(fp32_path, model_path)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads > 0:
+            options.intra_op_num_threads = num_threads
+        session = ort.InferenceSession(str(model_path), sess_options=options, providers=["CPUExecutionProvider"])
+
+        config = json.loads(config_path.read_text(encoding="utf-8"))
+        logger.info("ONNX 임베딩 모델 로드: %s", model_path)
+        return cls(
+            session=session,
+            tokenizer=AutoTokenizer.from_pretrained(str(model_dir)),
+            max_seq_length=config["max_seq_length"],
+            dimension=config["dimension"],
+            normalize=config.get("normalize", False),
+        )
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dimension
+
+    def encode(self, sentences: Union[str, List[str]], batch_size: int = 32) -> np.ndarray:
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+
+        batches: List[np.ndarray] = []
+        for start in range(0, len(texts), batch_size):
+            encoded = self.tokenizer(
+                texts[start : start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np",
+            )
+            feeds = {
+                name: np.asarray(value, dtype=np.int64)
+                for name, value in encoded.items()
+                if name in self._input_names
+            }
+            last_hidden_state = self.session.run(None, feeds)[0]
+            pooled = mean_pool(last_hidden_state, feeds["attention_mask"])
+            batches.append(l2_normalize(pooled) if self.normalize else pooled)
+
+        embeddings = np.concatenate(batches).astype(np.float32)
+        return embeddings[0] if single else embeddings
+
+
+@contextmanager
+def _export_lock(model_dir: Path) -> Iterator[None]:
+    """같은 모델의 export/양자화를 프로세스 사이에서 직렬화한다."""
+    import fcntl
+
+    model_dir.parent.mkdir(parents=True, exist_ok=True)
+    with open(model_dir.parent / f".{model_dir.name}.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def export_onnx_model(model_name: str, output_dir: Path) -> Path:
+    """SentenceTransformer의 transformer 본체를 ONNX로 내보내고 tokenizer/설정을 함께 저장한다.
+
+    같은 파일시스템의 임시 디렉터리에 모두 쓴 뒤 파일별로 os.replace하고, 설정 파일을 마지막에 옮긴다.
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer(model_name, device="cpu")
+    module_names = [type(module).__name__ for module in model]
+    pooling = model[1] if len(model) > 1 else None
+    if pooling is None or not getattr(pooling, "pooling_mode_mean_tokens", False):
+        raise ValueError(f"ONNX backend supports mean pooling models only: {module_names}")
+
+    class _TransformerOnly(torch.nn.Module):
+        def __init__(self, auto_model):
+            super().__init__()
+            self.auto_model = auto_model
+
+        def forward(self, input_ids, attention_mask):
+            return self.auto_model(input_ids=input_ids, attention_mask=attention_mask)[0]
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    dummy = model.tokenizer(["onnx export"], return_tensors="pt")
+    wrapper = _TransformerOnly(model[0].auto_model).eval()
+    with tempfile.TemporaryDirectory(dir=output_dir.parent, prefix=f".{output_dir.name}-") as tmp:
+        staging = Path(tmp)
+        with torch.no_grad():
+            torch.onnx.export(
+                wrapper,
+                (dummy["input_ids"], dummy["attention_mask"]),
+                str(staging / ONNX_MODEL_FILE),
+                input_names=["input_ids", "attention_mask"],
+                output_names=["last_hidden_state"],
+                dynamic_axes={
+                    "input_ids": {0: "batch", 1: "sequence"},
+                    "attention_mask": {0: "batch", 1: "sequence"},
+                    "last_hidden_state": {0: "batch", 1: "sequence"},
+                },
+                opset_version=14,
+            )
+
+        model.tokenizer.save_pretrained(str(staging))
+        config = {
+            "model_name": model_name,
+            "max_seq_length": int(model.max_seq_length),
+            "dimension": int(model.get_sentence_embedding_dimension()),
+            "normalize": "Normalize" in module_names,
+        }
+        (staging / ENCODER_CONFIG_FILE).write_text(json.dumps(config, ensure_ascii=False), encoding="utf-8")
+
+        files = [path for path in staging.iterdir() if path.is_file()]
+        for path in sorted(files, key=lambda path: path.name == ENCODER_CONFIG_FILE):
+            os.replace(path, output_dir / path.name)
+
+    onnx_path = output_dir / ONNX_MODEL_FILE
+    logger.info("ONNX export 완료: %s", onnx_path)
+    return onnx_path
+
+
+def quantize_onnx_model(source_path: Path, target_path: Path) -> Path:
+    """가중치를 int8로 동적 양자화한다 (활성값은 추론 시 양자화)."""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    staging_path = target_path.with_name(f".{target_path.name}.{os.getpid()}.tmp")
+    try:
+        quantize_dynamic(str(source_path), str(staging_path), weight_type=QuantType.QInt8)
+        os.replace(staging_path, target_path)
+    finally:
+        staging_path.unlink(missing_ok=True)
+    logger.info("ONNX int8 양자화 완료: %s", target_path)
+    return target_path
@@ -0,0 +1,94 @@
+import logging
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+ROUTES = ("html", "reader", "none")
+
+
+def domain_of(url: str) -> str:
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class ScrapeRouteStats:
+    """도메인별로 어느 경로(html / reader)가 쓸 만한 본문을 가져왔는지 최근 결과를 센다.
+
+    reader가 주로 이기는 도메인은 hedged 모드에서 reader를 지연 없이 바로 시작한다.
+    최근 window개 결과만 보므로 사이트가 바뀌면 정책도 따라 바뀐다.
+    """
+
+    def __init__(
+        self,
+        reader_first_domains: Iterable[str] = (),
+        window: int = 20,
+        max_domains: int = 2048,
+        min_samples: int = 3,
+        reader_win_ratio: float = 0.6,
+    ):
+        self.reader_first_domains = {domain.lower().lstrip(".") for domain in reader_first_domains if domain}
+        self.window = max(1, window)
+        self.max_domains = max(1, max_domains)
+        self.min_samples = max(1, min_samples)
+        self.reader_win_ratio = reader_win_ratio
+        self._outcomes: "OrderedDict[str, Deque[str]]" = OrderedDict()
+        # 도메인별로 HTML 경로가 reader보다 늦어 취소된 횟수 (느리거나 막힌 페이지)
+        self._slow_html: Dict[str, int] = {}
+        self.totals: Dict[str, int] = {route: 0 for route in ROUTES}
+        self.slow_html_total = 0
+
+    def record(self, url: str, route: str, html_timed_out: bool = False) -> None:
+        domain = domain_of(url)
+        outcomes = self._outcomes.get(domain)
+        if outcomes is None:
+            outcomes = deque(maxlen=self.window)
+            self._outcomes[domain] = outcomes
+            if len(self._outcomes) > self.max_domains:
+                evicted, _ = self._outcomes.popitem(last=False)
+                self._slow_html.pop(evicted, None)
+        else:
+            self._outcomes.move_to_end(domain)
+        outcomes.append(route)
+        self.totals[route] += 1
+        if html_timed_out:
+            self._slow_html[domain] = self._slow_html.get(domain, 0) + 1
+            self.slow_html_total += 1
+        logger.info("SCRAPE_ROUTE_LOG domain=%s route=%s html_timed_out=%s", domain, route, html_timed_out)
+
+    def _is_reader_first(self, domain: str) -> bool:
+        return any(domain == known or domain.endswith("." + known) for known in self.reader_first_domains)
+
+    def prefers_reader(self, url: str) -> bool:
+        """설정에 등록됐거나 최근 결과에서 reader가 충분히 자주 이긴 도메인인지."""
+        domain = domain_of(url)
+        if self._is_reader_first(domain):
+            return True
+        outcomes = self._outcomes.get(domain)
+        if not outcomes:
+            return False
+        wins = [route for route in outcomes if route != "none"]
+        if len(wins) < self.min_samples:
+            return False
+        return wins.count("reader") / len(wins) >= self.reader_win_ratio
+
+    def reader_delay(self, url: str, default_delay: float) -> float:
+        return 0.0 if self.prefers_reader(url) else default_delay
+
+    def domain_stats(self, url: str) -> Optional[Dict[str, int]]:
+        domain = domain_of(url)
+        outcomes = self._outcomes.get(domain)
+        if outcomes is None:
+            return None
+        return {**{route: outcomes.count(route) for route in ROUTES}, "slow_html": self._slow_html.get(domain, 0)}
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "totals": dict(self.totals),
+            "slow_html": self.slow_html_total,
+            "domains": len(self._outcomes),
+            "reader_first_domains": sorted(
+                domain for domain in self._outcomes if self.prefers_reader("https://" + domain)
+            ),
+        }
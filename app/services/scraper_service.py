@@ -1,11 +1,12 @@
 import asyncio
-import json
+import importlib.util
+import logging
 import re
 from typing import Any, Dict, List, Optional
 from urllib.parse import parse_qs, urljoin, urlparse
 from xml.etree.ElementTree import ParseError
 
-import requests
+import httpx
 from bs4 import BeautifulSoup
 from youtube_transcript_api import (
     NoTranscriptFound,
@@ -14,20 +15,130 @@ from youtube_transcript_api import (
     YouTubeTranscriptApi,
 )
 
+from app.core.config import settings
+from app.services.scrape_routing import ScrapeRouteStats
+from app.utils.content_density import score_soup
+from app.utils.html_extraction import (
+    BOILERPLATE_TAGS,
+    EMPTY_CONTENT,
+    clean_content,
+    extract_html_page,
+    has_content_class,
+    pick_representative_image,
+    thumbnail_from_json_ld,
+)
+from app.utils.http_cache import CachedResponse, HttpCache
+
+logger = logging.getLogger(__name__)
+
+# HTML 추출 로직이 바뀌면 올린다. 캐시된 파싱 결과는 버전이 같을 때만 재사용한다
+HTML_PARSER_VERSION = 3
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+}
+
+
+def _http2_available() -> bool:
+    # httpx의 HTTP/2 지원은 선택 의존성(h2)이 있을 때만 켠다
+    return importlib.util.find_spec("h2") is not None
+
+
+_http_cache: Optional[HttpCache] = None
+
+
+def get_scraper_http_cache() -> Optional[HttpCache]:
+    """스크랩 페이지 조건부 GET 캐시. 프로세스(fork 이후 자식)마다 첫 사용 시 연다."""
+    global _http_cache
+    if not settings.SCRAPER_HTTP_CACHE_ENABLED:
+        return None
+    if _http_cache is None:
+        try:
+            _http_cache = HttpCache(
+                settings.SCRAPER_HTTP_CACHE_PATH,
+                max_entries=settings.SCRAPER_HTTP_CACHE_MAX_ENTRIES,
+                ttl_seconds=settings.SCRAPER_HTTP_CACHE_TTL_SECONDS,
+                max_body_bytes=settings.SCRAPER_HTTP_CACHE_MAX_BODY_BYTES,
+            )
+        except Exception as e:
+            logger.warning("스크래퍼 HTTP 캐시 초기화 실패(캐시 없이 진행): %s", e)
+            return None
+    return _http_cache
+
 
 class ScraperService:
     """URL 본문과 메타데이터를 추출하는 서비스."""
 
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-                "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            }
+    def __init__(
+        self,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        http_cache: Optional[HttpCache] = None,
+    ):
+        self.timeout = httpx.Timeout(
+            settings.SCRAPER_READ_TIMEOUT_SECONDS,
+            connect=settings.SCRAPER_CONNECT_TIMEOUT_SECONDS,
         )
-        self.timeout = 12
+        self.reader_timeout = httpx.Timeout(
+            settings.SCRAPER_READER_READ_TIMEOUT_SECONDS,
+            connect=settings.SCRAPER_CONNECT_TIMEOUT_SECONDS,
+        )
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.http_cache = http_cache if http_cache is not None else get_scraper_http_cache()
+        self.route_stats = ScrapeRouteStats(
+            reader_first_domains=settings.SCRAPER_READER_FIRST_DOMAINS,
+            min_samples=settings.SCRAPER_HEDGE_MIN_SAMPLES,
+            reader_win_ratio=settings.SCRAPER_HEDGE_READER_WIN_RATIO,
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """현재 이벤트 루프에 묶인 공유 AsyncClient. 루프가 바뀌면 풀을 새로 만든다."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers=DEFAULT_HEADERS,
+                timeout=self.timeout,
+                follow_redirects=True,
+                http2=settings.SCRAPER_HTTP2 and self._transport is None and _http2_available(),
+                limits=httpx.Limits(
+                    max_connections=settings.SCRAPER_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.SCRAPER_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+                transport=self._transport,
+            )
+            self._client_loop = loop
+            self._host_semaphores = {}
+        return self._client
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = (urlparse(url).netloc or "").lower()
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(1, settings.SCRAPER_MAX_CONNECTIONS_PER_HOST))
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    async def _get(
+        self,
+        url: str,
+        timeout: Optional[httpx.Timeout] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """호스트별 동시 요청 수를 제한하며 GET 한다."""
+        client = self._get_client()
+        async with self._host_semaphore(url):
+            return await client.get(url, timeout=timeout or self.timeout, headers=headers)
+
+    async def aclose(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+        self._host_semaphores = {}
 
     async def extract_content(self, url: str) -> Dict[str, Any]:
         """URL에서 본문과 제목, 썸네일 정보를 추출한다."""
@@ -39,24 +150,18 @@ class ScraperService:
             if self._is_youtube_url(normalized_url):
                 return await self._extract_youtube_transcript(normalized_url)
 
-            try:
-                primary = await self._extract_via_html(normalized_url)
-            except requests.RequestException:
-                primary = {}
-
-            if self._is_usable_text(primary.get("content", "")):
-                return primary
-
-            fallback = await self._extract_via_reader(normalized_url)
-            if self._is_usable_text(fallback.get("content", "")):
-                await self._ensure_fallback_thumbnail(normalized_url, primary, fallback)
-                return fallback
+            if settings.SCRAPER_HEDGE_ENABLED:
+                result = await self._extract_hedged(normalized_url)
+            else:
+                result = await self._extract_sequential(normalized_url)
+            if result is not None:
+                return result
 
             return {
                 "error": "URL 본문 추출 실패: 접근 제한 또는 본문이 충분하지 않습니다.",
                 "success": False,
             }
-        except requests.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             status_code = e.response.status_code if e.response is not None else None
             if status_code == 451:
                 return {
@@ -67,11 +172,88 @@ class ScraperService:
                     "success": False,
                 }
             return {"error": f"HTTP 오류({status_code}): {e}", "success": False}
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             return {"error": f"네트워크 오류: {e}", "success": False}
         except Exception as e:
             return {"error": f"스크래핑 실패: {e}", "success": False}
 
+    async def _extract_sequential(self, url: str) -> Optional[Dict[str, Any]]:
+        """HTML 추출이 실패하거나 본문이 부족할 때만 reader를 시도한다."""
+        try:
+            primary = await self._extract_via_html(url)
+        except httpx.HTTPError:
+            primary = {}
+
+        if self._is_usable_text(primary.get("content", "")):
+            self.route_stats.record(url, "html")
+            return primary
+
+        fallback = await self._extract_via_reader(url)
+        if self._is_usable_text(fallback.get("content", "")):
+            self.route_stats.record(url, "reader")
+            await self._ensure_fallback_thumbnail(url, primary, fallback)
+            return fallback
+
+        self.route_stats.record(url, "none")
+        return None
+
+    async def _extract_hedged(self, url: str) -> Optional[Dict[str, Any]]:
+        """HTML 추출을 먼저 시작하고, 지연 뒤(reader 우선 도메인은 즉시) reader를 함께 돌린다.
+
+        먼저 쓸 만한 본문을 낸 쪽을 쓰고 나머지는 취소한다. 둘 다 실패하면
+        순차 모드와 같게 reader의 HTTP 오류를 그대로 올린다.
+        """
+        html_task = asyncio.create_task(self._extract_via_html(url))
+        reader_task: Optional[asyncio.Task] = None
+        pending = {html_task}
+        primary: Dict[str, Any] = {}
+        reader_error: Optional[httpx.HTTPError] = None
+        winner: Optional[str] = None
+        result: Dict[str, Any] = {}
+        html_timed_out = False
+        delay = self.route_stats.reader_delay(url, settings.SCRAPER_HEDGE_DELAY_SECONDS)
+
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=delay if reader_task is None else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                # 같은 시점에 끝났다면 HTML 결과(썸네일·설명 포함)를 우선한다
+                for task in sorted(done, key=lambda t: t is not html_task):
+                    try:
+                        outcome = task.result()
+                    except httpx.HTTPError as e:
+                        if task is reader_task:
+                            reader_error = e
+                        outcome = {}
+                    if task is html_task:
+                        primary = outcome
+                    if self._is_usable_text(outcome.get("content", "")):
+                        winner = "html" if task is html_task else "reader"
+                        result = outcome
+                        break
+                if winner is None and reader_task is None:
+                    reader_task = asyncio.create_task(self._extract_via_reader(url))
+                    pending.add(reader_task)
+        finally:
+            html_timed_out = winner == "reader" and not html_task.done()
+            losers = [task for task in (html_task, reader_task) if task is not None and not task.done()]
+            for task in losers:
+                task.cancel()
+            await asyncio.gather(*losers, return_exceptions=True)
+
+        self.route_stats.record(url, winner or "none", html_timed_out=html_timed_out)
+        if winner == "reader":
+            # HTML이 시간 안에 못 온 페이지를 썸네일 때문에 다시 받으면 reader가 이긴 의미가 없다
+            await self._ensure_fallback_thumbnail(url, primary, result, fetch=not html_timed_out)
+        if winner is not None:
+            return result
+        if reader_error is not None:
+            raise reader_error
+        return None
+
     async def _extract_youtube_transcript(self, url: str) -> Dict[str, Any]:
         """YouTube URL에서 자막과 메타데이터를 추출한다."""
         video_id = self._extract_youtube_video_id(url)
@@ -127,7 +309,7 @@ class ScraperService:
         if len(transcript_text) < 40:
             return {"error": "유튜브 자막 길이가 너무 짧아 요약하기 어렵습니다.", "success": False}
 
-        title = await loop.run_in_executor(None, lambda: self._fetch_youtube_title(url, video_id))
+        title = await self._fetch_youtube_title(url, video_id)
         return {
             "title": title,
             "content": transcript_text,
@@ -138,18 +320,72 @@ class ScraperService:
         }
 
     async def _extract_via_html(self, url: str) -> Dict[str, Any]:
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: self.session.get(url, timeout=self.timeout),
-        )
+        cache = self.http_cache
+        entry = await self._lookup_cached_page(url) if cache is not None else None
+        if entry is not None and entry.is_fresh():
+            cache.record("hits")
+            return await self._cached_parse(entry)
+
+        response = await self._get(url, headers=entry.validators() if entry is not None else None)
+        if entry is not None and response.status_code == 304:
+            # 변경 없음: 본문을 받지 않고 저장해 둔 파싱 결과를 쓴다
+            cache.record("revalidated")
+            try:
+                await asyncio.to_thread(cache.refresh, entry, response.headers)
+            except Exception as e:
+                logger.warning("스크래퍼 HTTP 캐시 갱신 실패: %s", e)
+            return await self._cached_parse(entry)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.content, "html.parser")
+        result = self._parse_html_page(response.content, url)
+        if cache is not None:
+            cache.record("misses")
+            try:
+                await asyncio.to_thread(
+                    cache.store_response, url, response.headers, response.content, self._parsed_payload(result)
+                )
+            except Exception as e:
+                logger.warning("스크래퍼 HTTP 캐시 저장 실패: %s", e)
+        return result
+
+    async def _lookup_cached_page(self, url: str) -> Optional[CachedResponse]:
+        try:
+            return await asyncio.to_thread(self.http_cache.lookup, url)
+        except Exception as e:
+            logger.warning("스크래퍼 HTTP 캐시 조회 실패: %s", e)
+            return None
+
+    async def _cached_parse(self, entry: CachedResponse) -> Dict[str, Any]:
+        """캐시 항목의 파싱 결과를 돌려준다. 파서 버전이 다르면 저장된 본문을 다시 파싱한다."""
+        parsed = entry.parsed or {}
+        if parsed.get("parser_version") == HTML_PARSER_VERSION:
+            return dict(parsed["result"])
+        result = self._parse_html_page(entry.body, entry.url)
+        try:
+            await asyncio.to_thread(self.http_cache.update_parsed, entry, self._parsed_payload(result))
+        except Exception as e:
+            logger.warning("스크래퍼 HTTP 캐시 저장 실패: %s", e)
+        return result
+
+    @staticmethod
+    def _parsed_payload(result: Dict[str, Any]) -> Dict[str, Any]:
+        return {"parser_version": HTML_PARSER_VERSION, "result": result}
+
+    def _parse_html_page(self, html: bytes, url: str) -> Dict[str, Any]:
+        if settings.SCRAPER_HTML_ENGINE.lower() == "lxml":
+            try:
+                page = extract_html_page(html, url, content_extractor=settings.SCRAPER_CONTENT_EXTRACTOR.lower())
+                return {**page, "url": url, "success": True}
+            except Exception as e:
+                logger.debug("lxml 추출 실패, html.parser로 다시 시도: %s", e)
+
+        soup = BeautifulSoup(html, "html.parser")
         title = self._extract_title(soup, url)
+        # JSON-LD는 <script> 안에 있으므로 본문 정리(decompose) 전에 읽어 둔다
+        json_ld_thumbnail = self._extract_thumbnail_from_json_ld(soup, url)
         content = self._extract_main_content(soup)
         description = self._extract_description(soup)
-        thumbnail_url = self._extract_thumbnail_url(soup, url)
+        thumbnail_url = self._extract_thumbnail_url(soup, url, json_ld_thumbnail=json_ld_thumbnail)
 
         return {
             "title": title,
@@ -163,15 +399,11 @@ class ScraperService:
     async def _extract_via_reader(self, url: str) -> Dict[str, Any]:
         """동적 페이지나 차단 페이지 대비 텍스트 reader fallback."""
         reader_url = f"https://r.jina.ai/http://{url.lstrip('/').replace('https://', '').replace('http://', '')}"
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: self.session.get(reader_url, timeout=self.timeout + 6),
-        )
+        response = await self._get(reader_url, timeout=self.reader_timeout)
         response.raise_for_status()
 
         raw_text = (response.text or "").strip()
-        cleaned = self._clean_content(raw_text)
+        cleaned = clean_content(raw_text)
 
         title = self._extract_title_from_text(cleaned) or f"웹페이지 - {urlparse(url).netloc}"
         return {
@@ -184,33 +416,33 @@ class ScraperService:
         }
 
     async def _ensure_fallback_thumbnail(
-        self, url: str, primary: Dict[str, Any], fallback: Dict[str, Any]
+        self, url: str, primary: Dict[str, Any], fallback: Dict[str, Any], fetch: bool = True
     ) -> None:
-        """reader로 본문만 가져온 경우 썸네일을 HTML 메타에서 채운다."""
+        """reader로 본문만 가져온 경우 썸네일을 HTML 메타에서 채운다. fetch=False면 이미 있는 값만 쓴다."""
         existing = ((fallback.get("thumbnail_url") or primary.get("thumbnail_url")) or "").strip()
         if existing:
             fallback["thumbnail_url"] = existing
             return
+        if not fetch:
+            return
         thumb = await self._fetch_og_thumbnail_only(url=fallback.get("url") or url)
         if thumb:
             fallback["thumbnail_url"] = thumb
 
     async def _fetch_og_thumbnail_only(self, url: str) -> Optional[str]:
-        """본문 파싱 없이 og/twitter 메타만으로 대표 이미지 URL을 찾는다."""
+        """본문 파싱 없이 og/twitter 메타만으로 대표 이미지 URL을 찾는다.
+
+        본문은 이미 확보한 뒤의 부가 작업이므로 짧은 타임아웃으로 끊는다.
+        """
         if not (url or "").strip():
             return None
-        loop = asyncio.get_event_loop()
-
-        def _sync() -> Optional[str]:
-            try:
-                response = self.session.get(url.strip(), timeout=self.timeout)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, "html.parser")
-                return self._extract_thumbnail_url(soup, url)
-            except Exception:
-                return None
-
-        return await loop.run_in_executor(None, _sync)
+        try:
+            response = await self._get(url.strip(), timeout=httpx.Timeout(settings.SCRAPER_THUMBNAIL_TIMEOUT_SECONDS))
+            response.raise_for_status()
+            soup = BeautifulSoup(response.content, "html.parser")
+            return self._extract_thumbnail_url(soup, url)
+        except Exception:
+            return None
 
     def _extract_title(self, soup: BeautifulSoup, url: str) -> str:
         og_title = soup.find("meta", property="og:title")
@@ -236,35 +468,33 @@ class ScraperService:
         return None
 
     def _extract_main_content(self, soup: BeautifulSoup) -> str:
-        for tag in soup(["script", "style", "nav", "footer", "aside", "form", "noscript"]):
+        for tag in soup(sorted(BOILERPLATE_TAGS)):
             tag.decompose()
 
         main_content = soup.find("article") or soup.find("main")
         if main_content:
-            return self._clean_content(main_content.get_text(separator=" ", strip=True))
-
-        content_divs = soup.find_all(
-            "div",
-            class_=lambda x: x
-            and any(
-                keyword in x.lower()
-                for keyword in ["content", "article", "post", "main", "story", "entry", "news"]
-            ),
-        )
-        if content_divs:
-            joined = " ".join(div.get_text(separator=" ", strip=True) for div in content_divs)
-            return self._clean_content(joined)
+            return clean_content(main_content.get_text(separator=" ", strip=True))
+
+        if settings.SCRAPER_CONTENT_EXTRACTOR.lower() == "density":
+            main_text = score_soup(soup)
+            if main_text:
+                return clean_content(main_text)
+        else:
+            content_divs = soup.find_all("div", class_=has_content_class)
+            if content_divs:
+                joined = " ".join(div.get_text(separator=" ", strip=True) for div in content_divs)
+                return clean_content(joined)
 
         paragraphs = [p.get_text(separator=" ", strip=True) for p in soup.find_all("p")]
         paragraphs = [p for p in paragraphs if len(p) > 40]
         if paragraphs:
-            return self._clean_content(" ".join(paragraphs))
+            return clean_content(" ".join(paragraphs))
 
         body = soup.find("body")
         if body:
-            return self._clean_content(body.get_text(separator=" ", strip=True))
+            return clean_content(body.get_text(separator=" ", strip=True))
 
-        return "내용을 추출할 수 없습니다."
+        return EMPTY_CONTENT
 
     def _extract_description(self, soup: BeautifulSoup) -> Optional[str]:
         meta_desc = soup.find("meta", attrs={"name": "description"}) or soup.find(
@@ -274,7 +504,9 @@ class ScraperService:
             return meta_desc["content"].strip()
         return None
 
-    def _extract_thumbnail_url(self, soup: BeautifulSoup, base_url: str) -> Optional[str]:
+    def _extract_thumbnail_url(
+        self, soup: BeautifulSoup, base_url: str, json_ld_thumbnail: Optional[str] = None
+    ) -> Optional[str]:
         candidates = [
             soup.find("meta", property="og:image"),
             soup.find("meta", property="og:image:secure_url"),
@@ -288,7 +520,7 @@ class ScraperService:
             if content and not content.lower().startswith("data:"):
                 return urljoin(base_url, content)
 
-        json_ld_thumbnail = self._extract_thumbnail_from_json_ld(soup, base_url)
+        json_ld_thumbnail = json_ld_thumbnail or self._extract_thumbnail_from_json_ld(soup, base_url)
         if json_ld_thumbnail:
             return json_ld_thumbnail
 
@@ -308,117 +540,17 @@ class ScraperService:
         return None
 
     def _extract_thumbnail_from_json_ld(self, soup: BeautifulSoup, base_url: str) -> Optional[str]:
-        for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
-            raw = (script.string or script.get_text() or "").strip()
-            if not raw:
-                continue
-            try:
-                payload = json.loads(raw)
-            except Exception:
-                continue
-
-            image_url = self._find_image_in_json_ld(payload)
-            if image_url:
-                return urljoin(base_url, image_url)
-        return None
-
-    def _find_image_in_json_ld(self, payload: Any) -> Optional[str]:
-        if isinstance(payload, list):
-            for item in payload:
-                found = self._find_image_in_json_ld(item)
-                if found:
-                    return found
-            return None
-
-        if isinstance(payload, dict):
-            image_value = payload.get("image")
-            extracted = self._extract_image_value(image_value)
-            if extracted:
-                return extracted
-            for value in payload.values():
-                found = self._find_image_in_json_ld(value)
-                if found:
-                    return found
-        return None
-
-    def _extract_image_value(self, value: Any) -> Optional[str]:
-        if isinstance(value, str):
-            return value.strip() or None
-        if isinstance(value, list):
-            for item in value:
-                extracted = self._extract_image_value(item)
-                if extracted:
-                    return extracted
-        if isinstance(value, dict):
-            for key in ("url", "contentUrl", "thumbnailUrl"):
-                candidate = str(value.get(key, "")).strip()
-                if candidate:
-                    return candidate
-        return None
+        scripts = soup.find_all("script", attrs={"type": "application/ld+json"})
+        return thumbnail_from_json_ld([script.string or script.get_text() for script in scripts], base_url)
 
     def _extract_representative_image(self, soup: BeautifulSoup, base_url: str) -> Optional[str]:
         containers = []
         for selector in ("article", "main"):
             node = soup.find(selector)
             if node:
-                containers.append(node)
-        containers.append(soup)
-
-        seen_urls: set[str] = set()
-        for container in containers:
-            for img in container.find_all("img"):
-                candidate = self._normalize_image_candidate(img, base_url)
-                if not candidate or candidate in seen_urls:
-                    continue
-                seen_urls.add(candidate)
-                if self._looks_like_thumbnail_candidate(img, candidate):
-                    return candidate
-        return None
-
-    def _normalize_image_candidate(self, img: Any, base_url: str) -> Optional[str]:
-        attrs = [
-            img.get("src"),
-            img.get("data-src"),
-            img.get("data-original"),
-            img.get("data-lazy-src"),
-        ]
-        for value in attrs:
-            candidate = (value or "").strip()
-            if not candidate or candidate.lower().startswith("data:"):
-                continue
-            return urljoin(base_url, candidate)
-        return None
-
-    def _looks_like_thumbnail_candidate(self, img: Any, candidate_url: str) -> bool:
-        lowered = candidate_url.lower()
-        reject_keywords = (
-            "logo",
-            "icon",
-            "sprite",
-            "avatar",
-            "emoji",
-            "banner",
-            "blank",
-        )
-        if any(keyword in lowered for keyword in reject_keywords):
-            return False
-
-        width = self._safe_int(img.get("width"))
-        height = self._safe_int(img.get("height"))
-        if width and width < 160:
-            return False
-        if height and height < 90:
-            return False
-        alt = (img.get("alt") or "").strip().lower()
-        if alt in {"logo", "아이콘"}:
-            return False
-        return True
-
-    def _safe_int(self, value: Any) -> int:
-        try:
-            return int(str(value).strip())
-        except Exception:
-            return 0
+                containers.append(node.find_all("img"))
+        containers.append(soup.find_all("img"))
+        return pick_representative_image(containers, base_url)
 
     def _is_usable_text(self, text: str) -> bool:
         normalized = " ".join((text or "").split()).strip().lower()
@@ -502,11 +634,11 @@ class ScraperService:
             raise last_error
         raise NoTranscriptFound(video_id, ["ko", "en"], transcript_data=None)
 
-    def _fetch_youtube_title(self, url: str, video_id: str) -> str:
+    async def _fetch_youtube_title(self, url: str, video_id: str) -> str:
         oembed_url = f"https://www.youtube.com/oembed?url={url}&format=json"
         try:
-            response = self.session.get(oembed_url, timeout=self.timeout)
-            if response.ok:
+            response = await self._get(oembed_url)
+            if response.is_success:
                 payload = response.json() or {}
                 title = (payload.get("title") or "").strip()
                 if title:
@@ -540,23 +672,4 @@ class ScraperService:
                 texts.append(cleaned)
 
         merged = " ".join(texts)
-        return self._clean_content(merged)
-
-    def _clean_content(self, text: str) -> str:
-        if not text:
-            return "내용을 추출할 수 없습니다."
-
-        normalized = " ".join(text.split())
-        noisy_keywords = [
-            "쿠키",
-            "광고",
-            "구독",
-            "로그인",
-            "회원가입",
-            "프린트",
-            "URL복사",
-        ]
-        for keyword in noisy_keywords:
-            normalized = normalized.replace(keyword, "")
-
-        return normalized[:12000].strip() or "내용을 추출할 수 없습니다."
+        return clean_content(merged)
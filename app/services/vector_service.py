@@ -1,26 +1,63 @@
+import asyncio
+import hashlib
 import logging
 import uuid
 from collections import defaultdict
-from typing import Dict, List, Optional
-
-from qdrant_client.http.models import FieldCondition, Filter, FilterSelector, MatchValue, PointStruct
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http.models import (
+    FieldCondition,
+    Filter,
+    FilterSelector,
+    MatchValue,
+    PointIdsList,
+    PointStruct,
+)
 
 from app.core.config import settings
 from app.core.vector_config import vector_db
+from app.services.chunk_artifact import ChunkArtifact, build_chunk_artifact
 from app.services.embedding_service import embedding_service
 from app.utils.search_ranking import compute_hybrid_score, contains_anchor_terms, extract_anchor_terms, is_noisy_text
-from app.utils.text_chunking import split_into_chunks
+from app.utils.ttl_cache import AsyncLRUCache
 
 logger = logging.getLogger(__name__)
 
+# chunk point id 생성용 고정 네임스페이스 (바꾸면 전체 재색인이 일어난다)
+POINT_ID_NAMESPACE = uuid.UUID("6f1c2d0e-5b7a-4c1e-9d3f-8a2b4c6d8e10")
+# 필터 인덱스 대상이면서 문서 전체에 공통인 payload 필드.
+# 제목/요약/태그는 point마다 중복 저장하지 않고 검색 시 content_id 단위로 채운다.
+DOCUMENT_PAYLOAD_FIELDS = ("user_id", "is_public")
+# 슬림 payload 이전 point에 남아 있는 문서 메타데이터 필드
+LEGACY_DOCUMENT_FIELDS = ("title", "summary", "tags")
+# Postgres 조회가 실패했을 때 쓰는 빈 메타데이터 (캐시하지 않는다)
+UNAVAILABLE_DOCUMENT = {"title": "", "summary": "", "tags": [], "metadata_unavailable": True}
+
 
 class VectorService:
     """Service for storing and searching chunk-based vectors."""
 
-    def __init__(self):
-        self.client = vector_db.client
+    def __init__(self, client: Optional[AsyncQdrantClient] = None):
+        self._client = client
         self.collection_name = vector_db.collection_name
         self._collection_ready = False
+        self.query_embedding_cache = AsyncLRUCache(
+            max_entries=settings.QUERY_EMBEDDING_CACHE_SIZE,
+            ttl_seconds=settings.QUERY_EMBEDDING_CACHE_TTL_SECONDS,
+        )
+        self.document_cache = AsyncLRUCache(
+            max_entries=settings.DOCUMENT_METADATA_CACHE_SIZE,
+            ttl_seconds=settings.DOCUMENT_METADATA_CACHE_TTL_SECONDS,
+        )
+
+    @property
+    def client(self) -> AsyncQdrantClient:
+        """주입된 클라이언트가 없으면 현재 루프의 공용 AsyncQdrantClient를 쓴다."""
+        if self._client is not None:
+            return self._client
+        return vector_db.async_client
 
     async def _ensure_collection(self) -> None:
         """Qdrant 컬렉션이 없으면 자동 생성한다."""
@@ -38,6 +75,17 @@ class VectorService:
             return f"{cleaned} 관련 이슈/정의 배경과 맥락 내용"
         return cleaned
 
+    async def _embed_query(self, text: str) -> List[float]:
+        """쿼리 임베딩을 LRU 캐시에서 찾고, 없으면 한 번만 계산해 동시 요청과 공유한다."""
+
+        async def compute() -> List[float]:
+            embedding = await embedding_service.agenerate_embedding(text)
+            if not embedding or not any(embedding):
+                raise ValueError("empty query embedding")
+            return embedding
+
+        return await self.query_embedding_cache.get_or_compute(text, compute)
+
     def _sanitize_query_for_log(self, text: str) -> str:
         """Hide raw query text in production logs to reduce privacy risk."""
         cleaned = (text or "").strip()
@@ -45,6 +93,32 @@ class VectorService:
             return f"[masked len={len(cleaned)}]"
         return cleaned
 
+    def _chunk_point_id(self, content_id: int, chunk_index: int, search_text: str) -> str:
+        """(content_id, chunk_index, 임베딩 입력 해시)로 결정적인 point id를 만든다."""
+        chunk_hash = hashlib.sha256(search_text.encode("utf-8")).hexdigest()
+        return str(uuid.uuid5(POINT_ID_NAMESPACE, f"{content_id}:{chunk_index}:{chunk_hash}"))
+
+    async def _fetch_existing_points(self, content_id: int) -> Dict[str, Dict]:
+        """content_id에 속한 기존 point id와 문서 단위 payload 필드를 조회한다."""
+        content_filter = Filter(
+            must=[FieldCondition(key="content_id", match=MatchValue(value=content_id))]
+        )
+        existing: Dict[str, Dict] = {}
+        offset = None
+        while True:
+            records, offset = await self.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=content_filter,
+                limit=256,
+                offset=offset,
+                with_payload=[*DOCUMENT_PAYLOAD_FIELDS, *LEGACY_DOCUMENT_FIELDS],
+                with_vectors=False,
+            )
+            for record in records:
+                existing[str(record.id)] = dict(record.payload or {})
+            if offset is None:
+                return existing
+
     async def store_content_chunks(
         self,
         content_id: int,
@@ -54,21 +128,65 @@ class VectorService:
         user_id: int,
         is_public: bool = False,
         raw_content: str = "",
+        chunk_artifact: Optional[ChunkArtifact] = None,
     ) -> bool:
-        """Split content into chunks and upsert vectors to Qdrant."""
+        """Split content into chunks and sync only changed vectors to Qdrant.
+
+        chunk_artifact가 주어지면(원문 기준, 요약 단계에서 만든 것) 다시 나누지 않는다.
+        """
         try:
             await self._ensure_collection()
-            await self.delete_content_vector(content_id)
 
             # RAG answers need fact-level details that summaries may omit.
-            chunks = split_into_chunks(raw_content or summary or title, chunk_size=1100, overlap=180)
+            if chunk_artifact is None:
+                chunk_artifact = await asyncio.to_thread(
+                    build_chunk_artifact, raw_content or summary or title, title
+                )
+            chunks = chunk_artifact.texts()
+            if chunk_artifact.token_counts:
+                logger.info(
+                    "CHUNK_LOG content_id=%s mode=tokens chunks=%d tokens_total=%d tokens_max=%d",
+                    content_id,
+                    len(chunks),
+                    sum(chunk_artifact.token_counts),
+                    max(chunk_artifact.token_counts),
+                )
             if not chunks:
                 chunks = [summary or title]
 
+            search_texts = [f"{title} {chunk_text} {' '.join(tags)}" for chunk_text in chunks]
+            point_ids = [
+                self._chunk_point_id(content_id, index, search_text)
+                for index, search_text in enumerate(search_texts)
+            ]
+            document_payload = {
+                "user_id": user_id,
+                "is_public": is_public,
+            }
+
+            existing = await self._fetch_existing_points(content_id)
+            current_ids = set(point_ids)
+            new_indices = [index for index, point_id in enumerate(point_ids) if point_id not in existing]
+            retained_ids = [point_id for point_id in point_ids if point_id in existing]
+            vanished_ids = [point_id for point_id in existing if point_id not in current_ids]
+
+            # 변경된 chunk만 한 번의 배치 호출로 임베딩한다.
+            new_texts = [search_texts[index] for index in new_indices]
+            embeddings: List[List[float]] = []
+            if new_texts:
+                embed_started = perf_counter()
+                embeddings = await embedding_service.agenerate_batch_embeddings(new_texts)
+                embed_elapsed = perf_counter() - embed_started
+                logger.info(
+                    "EMBED_LOG content_id=%s chunks=%d elapsed=%.3fs chunks_per_sec=%.1f",
+                    content_id,
+                    len(new_texts),
+                    embed_elapsed,
+                    len(new_texts) / embed_elapsed if embed_elapsed > 0 else 0.0,
+                )
+
             points: List[PointStruct] = []
-            for index, chunk_text in enumerate(chunks):
-                search_text = f"{title} {chunk_text} {' '.join(tags)}"
-                embedding = embedding_service.generate_embedding(search_text)
+            for index, embedding in zip(new_indices, embeddings):
                 if not embedding or len(embedding) == 0 or sum(embedding) == 0:
                     logger.warning(
                         "Skip chunk due to empty embedding: content_id=%s, chunk=%s",
@@ -79,36 +197,211 @@ class VectorService:
 
                 points.append(
                     PointStruct(
-                        id=str(uuid.uuid4()),
+                        id=point_ids[index],
                         vector=embedding,
                         payload={
                             "content_id": content_id,
                             "chunk_index": index,
-                            "chunk_text": chunk_text[:1500],
-                            "title": title,
-                            "summary": (summary or "")[:800],
-                            "tags": tags,
-                            "user_id": user_id,
-                            "is_public": is_public,
+                            "chunk_text": chunks[index][:1500],
+                            **document_payload,
                         },
                     )
                 )
 
-            if not points:
+            if not points and not retained_ids:
                 logger.error("No vectors to upsert: content_id=%s", content_id)
                 return False
 
-            self.client.upsert(
-                collection_name=self.collection_name,
-                points=points,
-                wait=True,
+            self.invalidate_document(content_id)
+
+            # 새 벡터를 먼저 넣고 사라진 chunk는 나중에 지워 검색 공백 구간을 없앤다.
+            if points:
+                await self.client.upsert(
+                    collection_name=self.collection_name,
+                    points=points,
+                    wait=True,
+                )
+
+            stale_payload_ids = [
+                point_id
+                for point_id in retained_ids
+                if any(existing[point_id].get(key) != value for key, value in document_payload.items())
+            ]
+            if stale_payload_ids:
+                await self.client.set_payload(
+                    collection_name=self.collection_name,
+                    payload=document_payload,
+                    points=stale_payload_ids,
+                    wait=True,
+                )
+
+            legacy_payload_ids = [
+                point_id
+                for point_id in retained_ids
+                if any(key in existing[point_id] for key in LEGACY_DOCUMENT_FIELDS)
+            ]
+            if legacy_payload_ids:
+                await self.client.delete_payload(
+                    collection_name=self.collection_name,
+                    keys=list(LEGACY_DOCUMENT_FIELDS),
+                    points=legacy_payload_ids,
+                    wait=True,
+                )
+
+            if vanished_ids:
+                await self.client.delete(
+                    collection_name=self.collection_name,
+                    points_selector=PointIdsList(points=vanished_ids),
+                    wait=True,
+                )
+
+            logger.info(
+                "Stored content vectors: content_id=%s, chunk_count=%s, upserted=%s, payload_updated=%s, deleted=%s",
+                content_id,
+                len(points) + len(retained_ids),
+                len(points),
+                len(stale_payload_ids),
+                len(vanished_ids),
             )
-            logger.info("Stored content vectors: content_id=%s, chunk_count=%s", content_id, len(points))
             return True
         except Exception as e:
             logger.error("Failed to store vectors: content_id=%s, error=%s", content_id, e, exc_info=True)
             return False
 
+    def _prepare_query(self, query: str, query_enhance: bool = True) -> Tuple[str, str, List[str]]:
+        """정리된 쿼리, 임베딩용 확장 쿼리, anchor 용어를 만든다."""
+        cleaned_query = (query or "").strip()
+        anchor_terms = extract_anchor_terms(cleaned_query)
+        should_enhance = query_enhance and len(cleaned_query) <= 4
+        enhanced_query = self._enhance_query(cleaned_query) if should_enhance else cleaned_query
+        return cleaned_query, enhanced_query, anchor_terms
+
+    def _build_search_filter(self, user_id: Optional[int], content_id: Optional[int] = None) -> Filter:
+        filter_conditions = []
+        if user_id is not None:
+            filter_conditions.append(FieldCondition(key="user_id", match=MatchValue(value=user_id)))
+        if content_id is not None:
+            filter_conditions.append(FieldCondition(key="content_id", match=MatchValue(value=content_id)))
+
+        if filter_conditions:
+            return Filter(must=filter_conditions)
+        return Filter(must=[FieldCondition(key="is_public", match=MatchValue(value=True))])
+
+    def invalidate_document(self, content_id: int) -> None:
+        """제목/요약/태그가 바뀐 콘텐츠의 메타데이터 캐시를 비운다.
+
+        현재 프로세스 캐시만 비운다. Celery 재색인이나 다른 uvicorn worker가 처리한 수정은
+        각 API 프로세스에서 최대 DOCUMENT_METADATA_CACHE_TTL_SECONDS 동안 이전 값으로 보일 수 있다.
+        """
+        self.document_cache.invalidate(content_id)
+
+    async def _load_documents(self, content_ids: List[int]) -> Dict[int, Dict]:
+        """content_id별 제목/요약/태그를 캐시에서 찾고, 없는 것만 Postgres에서 한 번에 읽는다."""
+        documents: Dict[int, Dict] = {}
+        missing: List[int] = []
+        for content_id in dict.fromkeys(content_ids):
+            cached = self.document_cache.get(content_id)
+            if cached is not None:
+                documents[content_id] = cached
+            else:
+                missing.append(content_id)
+
+        if not missing:
+            return documents
+
+        # 모듈 import만으로 async 엔진이 만들어지지 않도록 조회할 때 불러온다
+        from sqlalchemy import select
+
+        from app.core.database import async_session_maker
+        from app.models.content import Content
+
+        try:
+            async with async_session_maker() as session:
+                rows = await session.execute(
+                    select(Content.id, Content.title, Content.summary, Content.tags).where(Content.id.in_(missing))
+                )
+                for content_id, title, summary, tags in rows.all():
+                    document = {
+                        "title": title or "",
+                        "summary": (summary or "")[:800],
+                        "tags": tags or [],
+                    }
+                    self.document_cache.set(content_id, document)
+                    documents[content_id] = document
+        except Exception as e:
+            logger.error(
+                "Failed to load document metadata for %d contents, serving without title/summary: %s",
+                len(missing),
+                e,
+            )
+            for content_id in missing:
+                documents.setdefault(content_id, dict(UNAVAILABLE_DOCUMENT))
+        return documents
+
+    def _build_chunk_row(
+        self,
+        result,
+        documents: Dict[int, Dict],
+        cleaned_query: str,
+        anchor_terms: List[str],
+    ) -> Optional[Dict]:
+        """Qdrant hit을 랭킹 점수가 붙은 chunk 결과로 바꾼다. 노이즈 chunk는 None."""
+        chunk_text = result.payload.get("chunk_text", "")
+        if is_noisy_text(chunk_text):
+            return None
+        document = documents.get(result.payload["content_id"])
+        if (document is None or document.get("metadata_unavailable")) and "title" in result.payload:
+            # 예전 형식의 point는 payload에 문서 메타데이터를 들고 있으므로 폴백으로 쓴다.
+            document = result.payload
+        if document is None:
+            # Postgres에 없는 콘텐츠 (삭제됨)
+            return None
+        title = document["title"]
+        tags = document.get("tags", [])
+        ranking_text = f"{title} {chunk_text} {' '.join(tags)}"
+        anchor_match = contains_anchor_terms(ranking_text, anchor_terms) if anchor_terms else True
+        return {
+            "content_id": result.payload["content_id"],
+            "chunk_index": result.payload.get("chunk_index", 0),
+            "chunk_text": chunk_text,
+            "title": title,
+            "summary": document.get("summary", ""),
+            "tags": tags,
+            "similarity_score": float(result.score),
+            "hybrid_score": compute_hybrid_score(
+                query=cleaned_query,
+                text=ranking_text,
+                similarity_score=float(result.score),
+            ) + (0.06 if anchor_match else 0.0),
+            "anchor_match": anchor_match,
+            "user_id": result.payload["user_id"],
+        }
+
+    def _log_retrieval(
+        self,
+        cleaned_query: str,
+        enhanced_query: str,
+        initial_hits: int,
+        fallback_used: bool,
+        results: List[Dict],
+    ) -> None:
+        top_scores = [row["similarity_score"] for row in results]
+        top1_score = top_scores[0] if top_scores else 0.0
+        avg_topk_score = sum(top_scores) / len(top_scores) if top_scores else 0.0
+        top1_hybrid_score = results[0]["hybrid_score"] if results else 0.0
+
+        logger.info(
+            "RETRIEVAL_LOG query=%r enhanced_query=%r initial_hits=%d fallback_used=%s final_hits=%d top1_score=%.4f top1_hybrid_score=%.4f avg_topk_score=%.4f",
+            self._sanitize_query_for_log(cleaned_query),
+            self._sanitize_query_for_log(enhanced_query),
+            initial_hits,
+            fallback_used,
+            len(results),
+            top1_score,
+            top1_hybrid_score,
+            avg_topk_score,
+        )
+
     async def search_similar_chunks(
         self,
         query: str,
@@ -119,90 +412,40 @@ class VectorService:
         fallback_threshold: float = 0.0,
         query_enhance: bool = True,
     ) -> List[Dict]:
-        """Search similar chunks with optional fallback threshold retry."""
+        """Search similar chunks; fall back to the relaxed tier when the strict tier is sparse."""
         try:
             await self._ensure_collection()
-            cleaned_query = (query or "").strip()
-            anchor_terms = extract_anchor_terms(cleaned_query)
-            should_enhance = query_enhance and len(cleaned_query) <= 4
-            enhanced_query = self._enhance_query(cleaned_query) if should_enhance else cleaned_query
+            cleaned_query, enhanced_query, anchor_terms = self._prepare_query(query, query_enhance)
 
-            query_embedding = embedding_service.generate_embedding(enhanced_query)
-            if not query_embedding or len(query_embedding) == 0 or sum(query_embedding) == 0:
+            try:
+                query_embedding = await self._embed_query(enhanced_query)
+            except ValueError:
                 logger.error("Failed to generate query embedding")
                 return []
 
-            filter_conditions = []
-            if user_id is not None:
-                filter_conditions.append(FieldCondition(key="user_id", match=MatchValue(value=user_id)))
-            if content_id is not None:
-                filter_conditions.append(FieldCondition(key="content_id", match=MatchValue(value=content_id)))
-
-            if filter_conditions:
-                search_filter = Filter(must=filter_conditions)
-            else:
-                search_filter = Filter(
-                    must=[FieldCondition(key="is_public", match=MatchValue(value=True))]
-                )
-
             candidate_limit = max(limit * 3, 12)
 
-            initial_results = self.client.search(
+            # 완화 임계값으로 한 번만 조회하고, 엄격/완화 구간은 점수로 나눈다.
+            # Qdrant 결과는 점수 내림차순이므로 엄격 구간은 항상 완화 결과의 앞부분이다.
+            relaxed_results = await self.client.search(
                 collection_name=self.collection_name,
                 query_vector=query_embedding,
-                query_filter=search_filter,
+                query_filter=self._build_search_filter(user_id, content_id),
                 limit=candidate_limit,
-                score_threshold=score_threshold,
+                score_threshold=min(score_threshold, fallback_threshold),
+                search_params=vector_db.search_params,
             )
+            initial_results = [result for result in relaxed_results if result.score >= score_threshold]
 
-            fallback_used = False
-            search_results = initial_results
-            if len(initial_results) < limit:
-                fallback_used = True
-                relaxed_results = self.client.search(
-                    collection_name=self.collection_name,
-                    query_vector=query_embedding,
-                    query_filter=search_filter,
-                    limit=candidate_limit,
-                    score_threshold=fallback_threshold,
-                )
-                merged_results = []
-                seen_ids = set()
-                for result in [*initial_results, *relaxed_results]:
-                    if result.id in seen_ids:
-                        continue
-                    seen_ids.add(result.id)
-                    merged_results.append(result)
-                search_results = merged_results
+            fallback_used = len(initial_results) < limit
+            search_results = relaxed_results if fallback_used else initial_results
 
+            documents = await self._load_documents([result.payload["content_id"] for result in search_results])
             results: List[Dict] = []
             for result in search_results:
-                chunk_text = result.payload.get("chunk_text", "")
-                title = result.payload["title"]
-                tags = result.payload.get("tags", [])
-                anchor_source = f"{title} {chunk_text} {' '.join(tags)}"
-                if is_noisy_text(chunk_text):
-                    continue
-                ranking_text = f"{title} {chunk_text} {' '.join(tags)}"
-                anchor_match = contains_anchor_terms(anchor_source, anchor_terms) if anchor_terms else True
-                results.append(
-                    {
-                        "content_id": result.payload["content_id"],
-                        "chunk_index": result.payload.get("chunk_index", 0),
-                        "chunk_text": chunk_text,
-                        "title": title,
-                        "summary": result.payload.get("summary", ""),
-                        "tags": tags,
-                        "similarity_score": float(result.score),
-                        "hybrid_score": compute_hybrid_score(
-                            query=cleaned_query,
-                            text=ranking_text,
-                            similarity_score=float(result.score),
-                        ) + (0.06 if anchor_match else 0.0),
-                        "anchor_match": anchor_match,
-                        "user_id": result.payload["user_id"],
-                    }
-                )
+                row = self._build_chunk_row(result, documents, cleaned_query, anchor_terms)
+                if row is not None:
+                    results.append(row)
 
             results.sort(
                 key=lambda row: (row["hybrid_score"], row["similarity_score"]),
@@ -210,36 +453,93 @@ class VectorService:
             )
             results = results[:limit]
 
-            top_scores = [row["similarity_score"] for row in results]
-            top1_score = top_scores[0] if top_scores else 0.0
-            avg_topk_score = sum(top_scores) / len(top_scores) if top_scores else 0.0
-            top1_hybrid_score = results[0]["hybrid_score"] if results else 0.0
+            self._log_retrieval(cleaned_query, enhanced_query, len(initial_results), fallback_used, results)
+            return results
+        except Exception as e:
+            logger.error("Failed to search chunks: %s", e, exc_info=True)
+            return []
 
-            logger.info(
-                "RETRIEVAL_LOG query=%r enhanced_query=%r initial_hits=%d fallback_used=%s final_hits=%d top1_score=%.4f top1_hybrid_score=%.4f avg_topk_score=%.4f",
-                self._sanitize_query_for_log(cleaned_query),
-                self._sanitize_query_for_log(enhanced_query),
-                len(initial_results),
-                fallback_used,
-                len(results),
-                top1_score,
-                top1_hybrid_score,
-                avg_topk_score,
+    async def _search_content_groups(
+        self,
+        query: str,
+        user_id: Optional[int],
+        limit: int,
+        score_threshold: float,
+        fallback_threshold: float = 0.0,
+    ) -> List[Dict]:
+        """Qdrant query-groups로 content_id별 상위 chunk만 받아 콘텐츠 단위 결과를 만든다."""
+        try:
+            await self._ensure_collection()
+            cleaned_query, enhanced_query, anchor_terms = self._prepare_query(query)
+
+            try:
+                query_embedding = await self._embed_query(enhanced_query)
+            except ValueError:
+                logger.error("Failed to generate query embedding")
+                return []
+
+            groups_result = await self.client.search_groups(
+                collection_name=self.collection_name,
+                query_vector=query_embedding,
+                query_filter=self._build_search_filter(user_id),
+                group_by="content_id",
+                limit=max(limit * 2, 8),
+                group_size=settings.SEARCH_GROUP_SIZE,
+                score_threshold=min(score_threshold, fallback_threshold),
+                search_params=vector_db.search_params,
             )
+            groups = groups_result.groups
+            # 그룹 hit도 점수 내림차순이므로 첫 hit 점수로 엄격/완화 구간을 나눈다.
+            initial_groups = [group for group in groups if group.hits and group.hits[0].score >= score_threshold]
+            fallback_used = len(initial_groups) < limit
+
+            selected_groups = groups if fallback_used else initial_groups
+            documents = await self._load_documents([group.id for group in selected_groups])
+
+            results: List[Dict] = []
+            for group in selected_groups:
+                hits = group.hits if fallback_used else [hit for hit in group.hits if hit.score >= score_threshold]
+                rows = [
+                    row
+                    for row in (self._build_chunk_row(hit, documents, cleaned_query, anchor_terms) for hit in hits)
+                    if row
+                ]
+                if not rows:
+                    continue
+                best = max(rows, key=lambda row: row["similarity_score"])
+                chunks = sorted(
+                    rows,
+                    key=lambda row: (row["hybrid_score"], row["similarity_score"]),
+                    reverse=True,
+                )
+                results.append(
+                    {
+                        "content_id": best["content_id"],
+                        "title": best["title"],
+                        "summary": best["summary"],
+                        "tags": best["tags"],
+                        "similarity_score": best["similarity_score"],
+                        "hybrid_score": best["hybrid_score"],
+                        "user_id": best["user_id"],
+                        "matched_chunks": chunks,
+                        "top_snippet": chunks[0]["chunk_text"],
+                    }
+                )
+
+            self._log_retrieval(cleaned_query, enhanced_query, len(initial_groups), fallback_used, results)
             return results
         except Exception as e:
-            logger.error("Failed to search chunks: %s", e, exc_info=True)
+            logger.error("Failed to search content groups: %s", e, exc_info=True)
             return []
 
-    async def search_similar_contents(
+    async def _search_content_from_chunks(
         self,
         query: str,
-        user_id: Optional[int] = None,
-        limit: int = 6,
-        score_threshold: float = 0.12,
-        min_output_score: float = 0.28,
+        user_id: Optional[int],
+        limit: int,
+        score_threshold: float,
     ) -> List[Dict]:
-        """Group chunk-level retrieval results into content-level results."""
+        """chunk 검색 결과를 Python에서 content_id별로 묶는다 (query-groups 미사용 경로)."""
         chunk_results = await self.search_similar_chunks(
             query=query,
             user_id=user_id,
@@ -272,10 +572,25 @@ class VectorService:
                 grouped_chunks[content_id],
                 key=lambda row: (row.get("hybrid_score", row["similarity_score"]), row["similarity_score"]),
                 reverse=True,
-            )[:3]
+            )[: settings.SEARCH_GROUP_SIZE]
             meta["matched_chunks"] = chunks
             meta["top_snippet"] = chunks[0]["chunk_text"] if chunks else ""
             results.append(meta)
+        return results
+
+    async def search_similar_contents(
+        self,
+        query: str,
+        user_id: Optional[int] = None,
+        limit: int = 6,
+        score_threshold: float = 0.12,
+        min_output_score: float = 0.28,
+    ) -> List[Dict]:
+        """Retrieve content-level results, each with its best matching chunks."""
+        if settings.SEARCH_GROUP_BY_CONTENT:
+            results = await self._search_content_groups(query, user_id, limit, score_threshold)
+        else:
+            results = await self._search_content_from_chunks(query, user_id, limit, score_threshold)
 
         results.sort(
             key=lambda row: (row.get("hybrid_score", row["similarity_score"]), row["similarity_score"]),
@@ -311,10 +626,11 @@ class VectorService:
             search_filter = Filter(
                 must=[FieldCondition(key="content_id", match=MatchValue(value=content_id))]
             )
-            self.client.delete(
+            await self.client.delete(
                 collection_name=self.collection_name,
                 points_selector=FilterSelector(filter=search_filter),
             )
+            self.invalidate_document(content_id)
             logger.info("Deleted vectors: content_id=%s", content_id)
             return True
         except Exception as e:
@@ -5,12 +5,13 @@ import re
 from urllib.parse import urlparse
 
 from app.core.celery_app import celery_app
+from app.core.config import settings
 from app.core.database_sync import SessionLocal
 from app.models.content import Content
 from app.services.ai_service import AIService
-from app.services.scraper_service import ScraperService
+from app.services.chunk_artifact import ChunkArtifact, load_or_build_chunk_artifact
 from app.services.vector_service import vector_service
-from app.utils.text_chunking import split_into_chunks
+from app.tasks.worker_runtime import get_worker_runtime, run_async
 
 logger = logging.getLogger(__name__)
 MAX_SUMMARY_CHUNKS = 8
@@ -105,7 +106,7 @@ URL: {url}
 }}
 """
     try:
-        response = asyncio.run(
+        response = run_async(
             ai_service._chat_json(  # noqa: SLF001 - 내부 유틸 재사용
                 system_message=(
                     "당신은 뉴스/문서 제목을 간결하게 정리하는 편집자다. "
@@ -142,6 +143,72 @@ def _should_use_direct_summary(raw_content: str, chunks: list[str]) -> bool:
     return len(raw_content) <= DIRECT_SUMMARY_CHAR_LIMIT and len(chunks) <= DIRECT_SUMMARY_MAX_CHUNKS
 
 
+async def _summarize_chunks(
+    ai_service: AIService,
+    chunks: list[str],
+    title: str,
+    url: str,
+    concurrency: int,
+) -> list[dict]:
+    """chunk 요약을 최대 concurrency개씩 동시에 요청하고 결과를 chunk 순서대로 돌려준다.
+
+    순서상 가장 앞선 실패(실패 응답 또는 예외)가 순차 처리 때와 같이 결과를 결정한다.
+    어떤 chunk가 실패하면 그보다 뒤에 있어 결과에 쓰이지 않을 요청은 취소한다.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    tasks: list[asyncio.Task] = []
+    first_failure = len(chunks)
+
+    def cancel_after(index: int) -> None:
+        nonlocal first_failure
+        if index >= first_failure:
+            return
+        first_failure = index
+        for later in tasks[index + 1 :]:
+            later.cancel()
+
+    async def summarize(index: int, chunk: str) -> dict:
+        async with semaphore:
+            try:
+                result = await ai_service.summarize_chunk(chunk, title, url)
+            except Exception:
+                cancel_after(index)
+                raise
+        if not result.get("success"):
+            cancel_after(index)
+        return result
+
+    tasks = [asyncio.create_task(summarize(index, chunk)) for index, chunk in enumerate(chunks)]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    ordered: list[dict] = []
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+        ordered.append(result)
+        if not result.get("success"):
+            break
+    return ordered
+
+
+def _load_chunk_artifact(content: Content) -> ChunkArtifact:
+    """원문 chunk artifact를 재사용하고, 원문/청킹 설정이 바뀌었으면 다시 만들어 저장 대상으로 둔다."""
+    artifact, rebuilt = load_or_build_chunk_artifact(
+        content.chunk_artifact,
+        content.raw_content or "",
+        content.title or "",
+    )
+    if rebuilt:
+        content.chunk_artifact = artifact.to_dict()
+    logger.info(
+        "🧩 chunk artifact %s: content_id=%s chunks=%d",
+        "생성" if rebuilt else "재사용",
+        content.id,
+        len(artifact.spans),
+    )
+    return artifact
+
+
 @celery_app.task(bind=True, max_retries=2, default_retry_delay=30)
 def process_content_task(self, content_id: int):
     """콘텐츠 처리 태스크."""
@@ -179,8 +246,9 @@ def process_content_task(self, content_id: int):
 def _process_content_sync(content_id: int):
     """Celery 워커에서 실행되는 동기 처리 파이프라인."""
     session = SessionLocal()
-    scraper = ScraperService()
-    ai_service = AIService()
+    runtime = get_worker_runtime()
+    scraper = runtime.scraper
+    ai_service = runtime.ai_service
 
     try:
         logger.info("🔄 콘텐츠 처리 시작: content_id=%s", content_id)
@@ -193,10 +261,11 @@ def _process_content_sync(content_id: int):
         content.status = "processing"
         content.processing_error = None
         session.commit()
+        chunk_artifact = None
 
         if content.content_type == "url" and content.url:
             logger.info("🕷️ 크롤링 시작: %s", content.url)
-            scraped = asyncio.run(scraper.extract_content(content.url))
+            scraped = run_async(scraper.extract_content(content.url))
             if scraped.get("success"):
                 scraped_content = (scraped.get("content") or "").strip()
                 if not _is_valid_scraped_content(scraped_content):
@@ -234,12 +303,12 @@ def _process_content_sync(content_id: int):
 
         if content.raw_content:
             logger.info("🤖 AI 요약 시작: content_id=%s", content_id)
-            chunks = split_into_chunks(content.raw_content, chunk_size=1100, overlap=180)
-            chunks = _merge_chunks_for_summary(chunks or [content.raw_content])
+            chunk_artifact = _load_chunk_artifact(content)
+            chunks = _merge_chunks_for_summary(chunk_artifact.summary_texts() or [content.raw_content])
             use_direct_summary = _should_use_direct_summary(content.raw_content, chunks)
 
             if use_direct_summary:
-                ai_res = asyncio.run(
+                ai_res = run_async(
                     ai_service.summarize_content(
                         content.raw_content,
                         content.title or "",
@@ -247,16 +316,17 @@ def _process_content_sync(content_id: int):
                     )
                 )
             else:
-                chunk_summaries = []
-
-                for chunk in chunks:
-                    chunk_res = asyncio.run(
-                        ai_service.summarize_chunk(
-                            chunk,
-                            content.title or "",
-                            content.url or "",
-                        )
+                chunk_results = run_async(
+                    _summarize_chunks(
+                        ai_service,
+                        chunks,
+                        content.title or "",
+                        content.url or "",
+                        concurrency=settings.SUMMARY_CHUNK_CONCURRENCY,
                     )
+                )
+                chunk_summaries = []
+                for chunk_res in chunk_results:
                     if not chunk_res.get("success"):
                         error_msg = chunk_res.get("error", "chunk 요약 실패")
                         logger.error("❌ chunk 요약 실패: %s", error_msg)
@@ -266,7 +336,7 @@ def _process_content_sync(content_id: int):
                         return {"content_id": content_id, "status": "failed", "error": error_msg}
                     chunk_summaries.append(chunk_res.get("summary", ""))
 
-                ai_res = asyncio.run(
+                ai_res = run_async(
                     ai_service.synthesize_chunk_summaries(
                         title=content.title or "",
                         url=content.url or "",
@@ -282,7 +352,7 @@ def _process_content_sync(content_id: int):
                     summary_text = content.summary or ""
                     is_too_short = len(summary_text) < 320 or _sentence_count(summary_text) < 5
                     if is_too_short:
-                        expanded_res = asyncio.run(
+                        expanded_res = run_async(
                             ai_service.expand_youtube_summary(
                                 content=content.raw_content or "",
                                 current_summary=summary_text,
@@ -313,7 +383,7 @@ def _process_content_sync(content_id: int):
 
         if content.status == "completed" and content.summary:
             logger.info("🧠 벡터 저장 시작: content_id=%s", content_id)
-            asyncio.run(
+            run_async(
                 vector_service.store_content_chunks(
                     content_id=content.id,
                     title=content.title,
@@ -322,6 +392,7 @@ def _process_content_sync(content_id: int):
                     user_id=content.user_id,
                     is_public=content.is_public,
                     raw_content=content.raw_content or "",
+                    chunk_artifact=chunk_artifact,
                 )
             )
             logger.info("✅ 벡터 저장 완료")
@@ -0,0 +1,75 @@
+import asyncio
+import logging
+from typing import Awaitable, Optional, TypeVar
+
+from app.core.vector_config import vector_db
+from app.services.ai_service import AIService, build_openai_http_client
+from app.services.scraper_service import ScraperService
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class WorkerRuntime:
+    """Celery 자식 프로세스 하나가 수명 동안 공유하는 이벤트 루프와 서비스 인스턴스.
+
+    태스크마다 asyncio.run과 서비스를 새로 만들면 keep-alive 커넥션과 TLS 세션이
+    매번 버려지므로, 루프와 httpx 커넥션 풀을 프로세스 단위로 유지한다.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        # httpx.AsyncClient는 이 루프 안에서만 쓰이도록 루프를 만든 뒤 생성한다
+        self._openai_http_client = build_openai_http_client()
+        self.ai_service = AIService(http_client=self._openai_http_client)
+        # 스크래퍼의 커넥션 풀은 첫 요청 때 이 루프에 묶여 만들어진다
+        self.scraper = ScraperService()
+
+    def run(self, coro: Awaitable[T]) -> T:
+        return self.loop.run_until_complete(coro)
+
+    def close(self) -> None:
+        if self.loop.is_closed():
+            return
+        try:
+            self.loop.run_until_complete(self._openai_http_client.aclose())
+            self.loop.run_until_complete(self.scraper.aclose())
+            self.loop.run_until_complete(vector_db.aclose())
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        finally:
+            self.loop.close()
+
+
+_runtime: Optional[WorkerRuntime] = None
+
+
+def init_worker_runtime() -> WorkerRuntime:
+    """worker_process_init에서 호출한다. fork 이후 자식 프로세스에서만 만들어야 한다."""
+    global _runtime
+    if _runtime is None or _runtime.loop.is_closed():
+        _runtime = WorkerRuntime()
+        logger.info("⚙️ 워커 런타임 초기화 (이벤트 루프 / OpenAI 커넥션 풀)")
+    return _runtime
+
+
+def get_worker_runtime() -> WorkerRuntime:
+    """solo 풀처럼 worker_process_init이 오지 않는 경우에는 첫 사용 시 만든다."""
+    return _runtime if _runtime is not None and not _runtime.loop.is_closed() else init_worker_runtime()
+
+
+def shutdown_worker_runtime() -> None:
+    global _runtime
+    if _runtime is None:
+        return
+    try:
+        _runtime.close()
+    except Exception as e:
+        logger.warning("워커 런타임 종료 중 오류: %s", e)
+    _runtime = None
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """동기 태스크 코드에서 워커 수명 이벤트 루프로 코루틴을 실행한다."""
+    return get_worker_runtime().run(coro)
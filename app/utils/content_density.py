@@ -0,0 +1,188 @@
+"""
+텍스트 밀도 / 링크 밀도 기반 본문 영역 선택기 (readability 방식).
+
+요소 시작/텍스트/끝 이벤트를 한 번씩 받아 선형 시간에 점수를 매긴다.
+lxml 단일 순회 추출기와 BeautifulSoup 경로가 같은 이벤트를 넣어 같은 결과를 얻는다.
+
+- 문단(p, pre, td, blockquote, 블록 자식이 없는 div/section)마다 1 + 쉼표 수 + 100자당 1점(최대 3)을
+  부모에 전부, 조부모에 절반 더한다.
+- 후보 점수 = (문단 점수 + 태그 가중치 + class/id 가중치) × (1 - 링크 밀도)
+- 최고 후보 안에서 링크 위주 블록(관련 기사, 랭킹)과 부정 class 블록(저작권, 공유 등)은 뺀다.
+"""
+import re
+from typing import Any, List, Optional, Tuple
+
+PARAGRAPH_TAGS = frozenset({"p", "pre", "td", "blockquote"})
+# 블록 자식이 없으면 문단처럼 취급하는 컨테이너 (<br>로만 줄을 나누는 포털 본문 등)
+TEXT_CONTAINER_TAGS = frozenset({"div", "section"})
+BLOCK_TAGS = frozenset(
+    {
+        "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt", "fieldset", "figure",
+        "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav",
+        "ol", "p", "pre", "section", "table", "tbody", "td", "th", "tr", "ul",
+    }
+)
+TAG_WEIGHTS = {
+    "div": 5, "section": 5, "article": 5,
+    "pre": 3, "td": 3, "blockquote": 3,
+    "form": -3, "ol": -3, "ul": -3, "li": -3, "dl": -3, "dd": -3, "dt": -3,
+    "h1": -5, "h2": -5, "h3": -5, "h4": -5, "h5": -5, "h6": -5, "th": -5,
+}
+CLASS_WEIGHT = 25
+POSITIVE_HINTS = re.compile(r"article|body|content|entry|main|news|post|story|text|view", re.I)
+NEGATIVE_HINTS = re.compile(
+    r"ad-|ads|banner|byline|comment|copyright|foot|header|linked|list|menu|nav|popular|promo"
+    r"|rank|related|share|sidebar|social|sponsor|tags|widget",
+    re.I,
+)
+MIN_PARAGRAPH_CHARS = 25
+MAX_LINK_DENSITY = 0.5
+# 부정 class 블록이라도 후보 텍스트의 이 비율 이상이면 본문 일부로 보고 남긴다
+NEGATIVE_BLOCK_MAX_SHARE = 0.3
+# body/html 자체가 최고 후보면 영역을 좁히지 못한 것이므로 다음 단계(문단/본문 전체)로 넘긴다
+PAGE_LEVEL_TAGS = frozenset({"html", "body"})
+
+
+def class_weight(class_value: Optional[str], id_value: Optional[str]) -> int:
+    weight = 0
+    for value in (class_value, id_value):
+        if not value:
+            continue
+        if NEGATIVE_HINTS.search(value):
+            weight -= CLASS_WEIGHT
+        if POSITIVE_HINTS.search(value):
+            weight += CLASS_WEIGHT
+    return weight
+
+
+class _Frame:
+    __slots__ = ("tag", "weight", "text_start", "chars_start", "link_start", "commas_start", "score", "has_block_child")
+
+    def __init__(self, tag: str, weight: int, text_start: int, chars_start: int, link_start: int, commas_start: int):
+        self.tag = tag
+        self.weight = weight
+        self.text_start = text_start
+        self.chars_start = chars_start
+        self.link_start = link_start
+        self.commas_start = commas_start
+        self.score = 0.0
+        self.has_block_child = False
+
+
+class DensityScorer:
+    """start/text/end 이벤트로 본문 영역을 고른다. 텍스트는 get_text(" ", strip=True) 조각 단위로 모은다."""
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self._chars = 0
+        self._link_chars = 0
+        self._commas = 0
+        self._link_depth = 0
+        self._stack: List[_Frame] = []
+        # (text_start, text_end, chars, link_density, weight) — 후보 안에서 뺄 수도 있는 블록
+        self._noise: List[Tuple[int, int, int, float, int]] = []
+        self._best: Optional[Tuple[float, str, int, int, int]] = None
+
+    def start(self, tag: str, class_value: Optional[str] = None, id_value: Optional[str] = None) -> None:
+        if tag == "a":
+            self._link_depth += 1
+        self._stack.append(
+            _Frame(
+                tag,
+                class_weight(class_value, id_value),
+                len(self.parts),
+                self._chars,
+                self._link_chars,
+                self._commas,
+            )
+        )
+
+    def text(self, text: str) -> None:
+        stripped = text.strip()
+        if not stripped:
+            return
+        self.parts.append(stripped)
+        self._chars += len(stripped)
+        self._commas += stripped.count(",")
+        if self._link_depth:
+            self._link_chars += len(stripped)
+
+    def end(self) -> None:
+        frame = self._stack.pop()
+        if frame.tag == "a":
+            self._link_depth -= 1
+        parent = self._stack[-1] if self._stack else None
+        if parent is not None and frame.tag in BLOCK_TAGS:
+            parent.has_block_child = True
+
+        chars = self._chars - frame.chars_start
+        if not chars:
+            return
+        link_density = (self._link_chars - frame.link_start) / chars
+        text_end = len(self.parts)
+
+        is_paragraph = frame.tag in PARAGRAPH_TAGS or (
+            frame.tag in TEXT_CONTAINER_TAGS and not frame.has_block_child
+        )
+        if is_paragraph and chars >= MIN_PARAGRAPH_CHARS and parent is not None:
+            score = 1 + (self._commas - frame.commas_start) + min(chars // 100, 3)
+            parent.score += score
+            if len(self._stack) >= 2:
+                self._stack[-2].score += score / 2
+
+        if frame.score > 0:
+            final = (frame.score + TAG_WEIGHTS.get(frame.tag, 0) + frame.weight) * (1 - link_density)
+            if self._best is None or final > self._best[0]:
+                self._best = (final, frame.tag, frame.text_start, text_end, chars)
+
+        # 본문 문장 속 인라인 링크는 두고, 블록 단위로만 잡음 후보에 올린다
+        if frame.tag in BLOCK_TAGS and (link_density > MAX_LINK_DENSITY or frame.weight < 0):
+            self._noise.append((frame.text_start, text_end, chars, link_density, frame.weight))
+
+    def best_text(self) -> Optional[str]:
+        """최고 후보 영역의 텍스트. 후보가 없거나 페이지 전체(body)뿐이면 None."""
+        if self._best is None:
+            return None
+        score, tag, start, end, chars = self._best
+        if score <= 0 or tag in PAGE_LEVEL_TAGS:
+            return None
+
+        # 후보 안의 잡음 블록 범위를 시작 순으로 훑으며 한 번씩만 지운다 (중첩 범위는 건너뜀)
+        keep = [True] * (end - start)
+        covered_until = start
+        for noise_start, noise_end in sorted(self._noise_within(start, end, chars)):
+            if noise_end <= covered_until:
+                continue
+            for index in range(max(noise_start, covered_until) - start, noise_end - start):
+                keep[index] = False
+            covered_until = noise_end
+        return " ".join(part for part, kept in zip(self.parts[start:end], keep) if kept)
+
+    def _noise_within(self, start: int, end: int, chars: int):
+        for noise_start, noise_end, noise_chars, link_density, weight in self._noise:
+            if noise_start < start or noise_end > end or (noise_start, noise_end) == (start, end):
+                continue
+            if link_density > MAX_LINK_DENSITY or noise_chars < chars * NEGATIVE_BLOCK_MAX_SHARE:
+                yield noise_start, noise_end
+
+
+def score_soup(soup: Any) -> Optional[str]:
+    """BeautifulSoup 트리(boilerplate decompose 이후)를 DensityScorer에 넣어 본문 텍스트를 고른다."""
+    from bs4 import CData, NavigableString, Tag
+
+    scorer = DensityScorer()
+    stack = [iter(soup.children)]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+            if stack:
+                scorer.end()
+        elif isinstance(child, Tag):
+            classes = child.get("class")
+            scorer.start(child.name, " ".join(classes) if isinstance(classes, list) else classes, child.get("id"))
+            stack.append(iter(child.children))
+        elif type(child) in (NavigableString, CData):
+            # get_text와 같게 주석/스크립트/템플릿 문자열은 건너뛴다
+            scorer.text(str(child))
+    return scorer.best_text()
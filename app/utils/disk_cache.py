@@ -0,0 +1,124 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """sqlite 기반 key/value 디스크 캐시.
+
+    값은 bytes로 저장하고 항목별 만료 시각(TTL)과 마지막 접근 시각을 둔다.
+    max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 지운다(LRU).
+    여러 프로세스가 같은 파일을 열어도 되도록 WAL 모드를 쓴다.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10_000, ttl_seconds: Optional[float] = None):
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.expired = 0
+        self._lock = threading.Lock()
+
+        db_path = Path(path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                expires_at REAL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+            now = time.time()
+            if row is not None and row[1] is not None and row[1] < now:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.commit()
+                self.expired += 1
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return bytes(row[0])
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        now = time.time()
+        expires_at = now + ttl if ttl else None
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, expires_at, last_access) VALUES (?, ?, ?, ?)",
+                    (key, sqlite3.Binary(value), expires_at, now),
+                )
+                self.writes += 1
+                self._evict_overflow()
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def _evict_overflow(self) -> None:
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        overflow = count - self.max_entries
+        if overflow <= 0:
+            return
+        self._conn.execute(
+            "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY last_access ASC LIMIT ?)",
+            (overflow,),
+        )
+        self.evictions += overflow
+
+    def get_json(self, key: str) -> Optional[Any]:
+        raw = self.get(key)
+        return None if raw is None else json.loads(raw.decode("utf-8"))
+
+    def set_json(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        self.set(key, json.dumps(value, ensure_ascii=False).encode("utf-8"), ttl_seconds)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._conn.commit()
+
+    @property
+    def hit_rate(self) -> float:
+        """메모리 카운터만으로 계산한 적중률 (DB를 건드리지 않는다)."""
+        lookups = self.hits + self.misses
+        return round(self.hits / lookups, 4) if lookups else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            (size,) = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "expired": self.expired,
+            "size": size,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+        }
@@ -0,0 +1,393 @@
+"""
+lxml 기반 단일 순회 HTML 추출기.
+
+BeautifulSoup(html.parser) 경로는 제목, decompose, 키워드 div, 설명, og/twitter/JSON-LD 썸네일,
+대표 이미지를 찾느라 트리를 여러 번 훑는다. 여기서는 lxml 트리를 iterwalk로 한 번만 돌며
+필요한 요소와 텍스트 블록을 모두 모으고, ScraperService의 bs4 경로와 같은 결과를 만든다.
+"""
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import urljoin, urlparse
+
+from app.utils.content_density import DensityScorer
+
+EMPTY_CONTENT = "내용을 추출할 수 없습니다."
+
+# 본문 추출 전에 통째로 지우는 태그 (bs4 경로의 decompose 대상)
+BOILERPLATE_TAGS = frozenset({"script", "style", "nav", "footer", "aside", "form", "noscript"})
+# BeautifulSoup get_text가 건너뛰는 문자열 컨테이너 (Script/Stylesheet/TemplateString/Ruby*)
+HIDDEN_TEXT_TAGS = frozenset({"script", "style", "template", "rt", "rp"})
+CONTENT_CLASS_KEYWORDS = ("content", "article", "post", "main", "story", "entry", "news")
+THUMBNAIL_META_KEYS: Tuple[Tuple[str, str], ...] = (
+    ("property", "og:image"),
+    ("property", "og:image:secure_url"),
+    ("name", "twitter:image"),
+    ("property", "twitter:image"),
+    ("property", "twitter:image:src"),
+    ("property", "og:image:url"),
+)
+OG_TITLE_KEY = ("property", "og:title")
+DESCRIPTION_META_KEYS: Tuple[Tuple[str, str], ...] = (("name", "description"), ("property", "og:description"))
+NOISY_KEYWORDS = ("쿠키", "광고", "구독", "로그인", "회원가입", "프린트", "URL복사")
+_REJECT_IMAGE_KEYWORDS = ("logo", "icon", "sprite", "avatar", "emoji", "banner", "blank")
+_XML_DECLARATION = re.compile(r"^\s*<\?xml[^>]*\?>", re.I)
+_BODY_TAG = re.compile(r"<body[\s/>]", re.I)
+
+
+def clean_content(text: str) -> str:
+    if not text:
+        return EMPTY_CONTENT
+
+    normalized = " ".join(text.split())
+    for keyword in NOISY_KEYWORDS:
+        normalized = normalized.replace(keyword, "")
+
+    return normalized[:12000].strip() or EMPTY_CONTENT
+
+
+def has_content_class(class_value: Optional[str]) -> bool:
+    """class 토큰 중 하나라도 본문 키워드를 포함하는지 (bs4 class_ 함수 매칭과 같은 규칙)."""
+    return any(
+        keyword in token.lower() for token in (class_value or "").split() for keyword in CONTENT_CLASS_KEYWORDS
+    )
+
+
+def find_image_in_json_ld(payload: Any) -> Optional[str]:
+    if isinstance(payload, list):
+        for item in payload:
+            found = find_image_in_json_ld(item)
+            if found:
+                return found
+        return None
+
+    if isinstance(payload, dict):
+        extracted = extract_image_value(payload.get("image"))
+        if extracted:
+            return extracted
+        for value in payload.values():
+            found = find_image_in_json_ld(value)
+            if found:
+                return found
+    return None
+
+
+def extract_image_value(value: Any) -> Optional[str]:
+    if isinstance(value, str):
+        return value.strip() or None
+    if isinstance(value, list):
+        for item in value:
+            extracted = extract_image_value(item)
+            if extracted:
+                return extracted
+    if isinstance(value, dict):
+        for key in ("url", "contentUrl", "thumbnailUrl"):
+            candidate = str(value.get(key, "")).strip()
+            if candidate:
+                return candidate
+    return None
+
+
+def thumbnail_from_json_ld(raw_scripts: List[str], base_url: str) -> Optional[str]:
+    for raw in raw_scripts:
+        raw = (raw or "").strip()
+        if not raw:
+            continue
+        try:
+            payload = json.loads(raw)
+        except Exception:
+            continue
+        image_url = find_image_in_json_ld(payload)
+        if image_url:
+            return urljoin(base_url, image_url)
+    return None
+
+
+def normalize_image_candidate(img: Any, base_url: str) -> Optional[str]:
+    """img 요소(bs4 Tag / lxml element 모두 .get 지원)에서 이미지 URL을 고른다."""
+    for attr in ("src", "data-src", "data-original", "data-lazy-src"):
+        candidate = (img.get(attr) or "").strip()
+        if not candidate or candidate.lower().startswith("data:"):
+            continue
+        return urljoin(base_url, candidate)
+    return None
+
+
+def safe_int(value: Any) -> int:
+    try:
+        return int(str(value).strip())
+    except Exception:
+        return 0
+
+
+def looks_like_thumbnail_candidate(img: Any, candidate_url: str) -> bool:
+    lowered = candidate_url.lower()
+    if any(keyword in lowered for keyword in _REJECT_IMAGE_KEYWORDS):
+        return False
+
+    width = safe_int(img.get("width"))
+    height = safe_int(img.get("height"))
+    if width and width < 160:
+        return False
+    if height and height < 90:
+        return False
+    alt = (img.get("alt") or "").strip().lower()
+    if alt in {"logo", "아이콘"}:
+        return False
+    return True
+
+
+def pick_representative_image(containers: List[List[Any]], base_url: str) -> Optional[str]:
+    """article → main → 문서 전체 순서로 썸네일로 쓸 만한 첫 이미지를 고른다."""
+    seen_urls: set[str] = set()
+    for images in containers:
+        for img in images:
+            candidate = normalize_image_candidate(img, base_url)
+            if not candidate or candidate in seen_urls:
+                continue
+            seen_urls.add(candidate)
+            if looks_like_thumbnail_candidate(img, candidate):
+                return candidate
+    return None
+
+
+class _Block:
+    """요소 하나의 텍스트 조각. keep_boilerplate면 decompose 대상 안쪽 텍스트도 모은다."""
+
+    __slots__ = ("parts", "keep_boilerplate")
+
+    def __init__(self, keep_boilerplate: bool = False):
+        self.parts: List[str] = []
+        self.keep_boilerplate = keep_boilerplate
+
+    def raw_text(self) -> str:
+        """get_text()와 같은 결과."""
+        return "".join(self.parts)
+
+    def text(self) -> str:
+        """get_text(separator=" ", strip=True)와 같은 결과."""
+        return " ".join(stripped for stripped in (part.strip() for part in self.parts) if stripped)
+
+
+class _PageScan:
+    def __init__(self, content_extractor: str = "density"):
+        self.content_extractor = content_extractor
+        self.density = DensityScorer() if content_extractor == "density" else None
+        self.title: Optional[_Block] = None
+        self.h1: Optional[_Block] = None
+        self.article: Optional[_Block] = None
+        self.main: Optional[_Block] = None
+        self.body: Optional[_Block] = None
+        self.content_divs: List[_Block] = []
+        self.paragraphs: List[_Block] = []
+        # (속성, 값)별로 처음 나온 meta의 content. bs4 find()처럼 첫 요소만 본다
+        self.metas: Dict[Tuple[str, str], Optional[str]] = {}
+        self.json_ld_scripts: List[str] = []
+        self.image_src_link: Optional[str] = None
+        # (img, article 안인지, main 안인지)
+        self.images: List[Tuple[Any, bool, bool]] = []
+
+    def walk(self, root: Any) -> "_PageScan":
+        from lxml import etree
+
+        density = self.density
+        open_blocks: List[_Block] = []
+        frames: List[Tuple[int, bool]] = []
+        boilerplate_depth = 0
+        hidden_depth = 0
+
+        def add_text(text: str) -> None:
+            for block in open_blocks:
+                if boilerplate_depth and not block.keep_boilerplate:
+                    continue
+                block.parts.append(text)
+            if density is not None and not boilerplate_depth:
+                density.text(text)
+
+        for event, el in etree.iterwalk(root, events=("start", "end", "comment", "pi")):
+            if event == "start":
+                tag = el.tag if isinstance(el.tag, str) else ""
+                in_boilerplate = boilerplate_depth > 0 or tag in BOILERPLATE_TAGS
+                opened = self._open_blocks(el, tag, in_boilerplate, open_blocks)
+                # bs4 경로는 boilerplate를 decompose한 트리를 점수화하므로 그 안쪽은 넣지 않는다
+                scored = density is not None and not in_boilerplate
+                if scored:
+                    density.start(tag, el.get("class"), el.get("id"))
+                frames.append((opened, scored))
+                if tag in BOILERPLATE_TAGS:
+                    boilerplate_depth += 1
+                if tag in HIDDEN_TEXT_TAGS:
+                    hidden_depth += 1
+                self._collect(el, tag, in_boilerplate, open_blocks)
+                if el.text and not hidden_depth:
+                    add_text(el.text)
+            elif event == "end":
+                tag = el.tag if isinstance(el.tag, str) else ""
+                opened, scored = frames.pop()
+                for _ in range(opened):
+                    open_blocks.pop()
+                if scored:
+                    density.end()
+                if tag in BOILERPLATE_TAGS:
+                    boilerplate_depth -= 1
+                if tag in HIDDEN_TEXT_TAGS:
+                    hidden_depth -= 1
+                if el.tail and not hidden_depth:
+                    add_text(el.tail)
+            elif el.tail and not hidden_depth:
+                # 주석/PI 자체 텍스트는 get_text에 포함되지 않지만 뒤따르는 텍스트는 포함된다
+                add_text(el.tail)
+        return self
+
+    def _open_blocks(self, el: Any, tag: str, in_boilerplate: bool, open_blocks: List[_Block]) -> int:
+        opened: List[_Block] = []
+        # 제목과 h1은 bs4 경로에서 decompose 이전에 읽는다
+        if tag == "title" and self.title is None:
+            self.title = _Block(keep_boilerplate=True)
+            opened.append(self.title)
+        elif tag == "h1" and self.h1 is None:
+            self.h1 = _Block(keep_boilerplate=True)
+            opened.append(self.h1)
+
+        if not in_boilerplate:
+            if tag == "article" and self.article is None:
+                self.article = _Block()
+                opened.append(self.article)
+            elif tag == "main" and self.main is None:
+                self.main = _Block()
+                opened.append(self.main)
+            elif tag == "body" and self.body is None:
+                self.body = _Block()
+                opened.append(self.body)
+            elif tag == "div" and self.density is None and has_content_class(el.get("class")):
+                block = _Block()
+                self.content_divs.append(block)
+                opened.append(block)
+            elif tag == "p":
+                block = _Block()
+                self.paragraphs.append(block)
+                opened.append(block)
+
+        open_blocks.extend(opened)
+        return len(opened)
+
+    def _collect(self, el: Any, tag: str, in_boilerplate: bool, open_blocks: List[_Block]) -> None:
+        if tag == "meta":
+            # og:title은 bs4 경로에서 decompose 이전에 읽는다
+            keys = (OG_TITLE_KEY,) if in_boilerplate else (OG_TITLE_KEY, *DESCRIPTION_META_KEYS, *THUMBNAIL_META_KEYS)
+            for attr, value in keys:
+                if (attr, value) not in self.metas and el.get(attr) == value:
+                    self.metas[(attr, value)] = el.get("content")
+        elif tag == "script":
+            # JSON-LD는 <script> 안에 있으므로 decompose 여부와 관계없이 모은다
+            if el.get("type") == "application/ld+json":
+                self.json_ld_scripts.append(el.text or "")
+        elif in_boilerplate:
+            return
+        elif tag == "link":
+            if self.image_src_link is None:
+                href = (el.get("href") or "").strip()
+                if href and any(rel.lower() == "image_src" for rel in (el.get("rel") or "").split()):
+                    self.image_src_link = href
+        elif tag == "img":
+            in_article = self.article is not None and any(block is self.article for block in open_blocks)
+            in_main = self.main is not None and any(block is self.main for block in open_blocks)
+            self.images.append((el, in_article, in_main))
+
+    def extract_title(self, url: str) -> str:
+        og_title = self.metas.get(OG_TITLE_KEY)
+        if og_title:
+            return og_title.strip()
+        if self.title is not None:
+            return self.title.raw_text().strip()
+        if self.h1 is not None:
+            return self.h1.raw_text().strip()
+        return f"웹페이지 - {urlparse(url).netloc}"
+
+    def extract_main_content(self) -> str:
+        block = self.article or self.main
+        if block is not None:
+            return clean_content(block.text())
+
+        if self.density is not None:
+            main_text = self.density.best_text()
+            if main_text:
+                return clean_content(main_text)
+        elif self.content_divs:
+            return clean_content(" ".join(div.text() for div in self.content_divs))
+
+        paragraphs = [text for text in (p.text() for p in self.paragraphs) if len(text) > 40]
+        if paragraphs:
+            return clean_content(" ".join(paragraphs))
+
+        if self.body is not None:
+            return clean_content(self.body.text())
+        return EMPTY_CONTENT
+
+    def extract_description(self) -> Optional[str]:
+        # name=description 태그가 있으면 content가 비어 있어도 og:description으로 넘어가지 않는다
+        for key in DESCRIPTION_META_KEYS:
+            if key in self.metas:
+                content = self.metas[key]
+                return content.strip() if content else None
+        return None
+
+    def extract_thumbnail_url(self, base_url: str) -> Optional[str]:
+        for key in THUMBNAIL_META_KEYS:
+            content = (self.metas.get(key) or "").strip()
+            if content and not content.lower().startswith("data:"):
+                return urljoin(base_url, content)
+
+        json_ld_thumbnail = thumbnail_from_json_ld(self.json_ld_scripts, base_url)
+        if json_ld_thumbnail:
+            return json_ld_thumbnail
+
+        if self.image_src_link:
+            return urljoin(base_url, self.image_src_link)
+
+        containers: List[List[Any]] = []
+        if self.article is not None:
+            containers.append([img for img, in_article, _ in self.images if in_article])
+        if self.main is not None:
+            containers.append([img for img, _, in_main in self.images if in_main])
+        containers.append([img for img, _, _ in self.images])
+        return pick_representative_image(containers, base_url)
+
+
+def decode_html(html: Union[bytes, str]) -> str:
+    """bytes 응답을 bs4와 같은 UnicodeDammit 규칙(선언된 charset → 추정)으로 디코딩한다."""
+    if isinstance(html, str):
+        return html
+    from bs4 import UnicodeDammit
+
+    return UnicodeDammit(html, is_html=True).unicode_markup or ""
+
+
+def parse_html(markup: str) -> Any:
+    import lxml.html
+
+    # lxml은 인코딩 선언이 있는 str 입력을 거부한다
+    return lxml.html.document_fromstring(_XML_DECLARATION.sub("", markup, count=1))
+
+
+def extract_html_page(html: Union[bytes, str], url: str, content_extractor: str = "density") -> Dict[str, Any]:
+    """HTML 한 페이지에서 title/content/description/thumbnail_url을 한 번의 순회로 추출한다.
+
+    content_extractor는 article/main이 없을 때의 본문 선택 방식이다.
+    density: 텍스트/링크 밀도 점수로 본문 영역을 고른다. keywords: class 키워드 div를 모두 이어 붙인다.
+
+    빈 문서 등 lxml이 파싱할 수 없으면 lxml.etree.ParserError를 던진다.
+    닫히지 않은 <p>처럼 html.parser와 lxml이 다른 트리를 만드는 깨진 마크업에서는
+    결과가 다를 수 있다 (lxml은 HTML 규칙대로 닫아 문단이 중복되지 않는다).
+    """
+    markup = decode_html(html)
+    scan = _PageScan(content_extractor).walk(parse_html(markup))
+    if not _BODY_TAG.search(markup):
+        # lxml은 <body>를 만들어 넣지만 html.parser 트리에는 없으므로 body fallback을 쓰지 않는다
+        scan.body = None
+    return {
+        "title": scan.extract_title(url),
+        "content": scan.extract_main_content(),
+        "description": scan.extract_description(),
+        "thumbnail_url": scan.extract_thumbnail_url(url),
+    }
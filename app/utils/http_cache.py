@@ -0,0 +1,177 @@
+import hashlib
+import json
+import time
+import zlib
+from dataclasses import asdict, dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+
+from app.utils.disk_cache import DiskCache
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Cache-Control 헤더를 {지시어: 값} 형태로 바꾼다 (값 없는 지시어는 None)."""
+    directives: Dict[str, Optional[str]] = {}
+    for part in (value or "").split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip().strip('"') or None
+    return directives
+
+
+def _parse_seconds(value: Optional[str]) -> Optional[int]:
+    try:
+        return max(0, int(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def freshness_lifetime(headers: Mapping[str, str]) -> float:
+    """응답이 재검증 없이 재사용될 수 있는 시간(초). no-cache면 0."""
+    directives = parse_cache_control(headers.get("cache-control"))
+    if "no-cache" in directives:
+        return 0.0
+    for name in ("s-maxage", "max-age"):
+        seconds = _parse_seconds(directives.get(name))
+        if seconds is not None:
+            return float(seconds)
+    expires = headers.get("expires")
+    if expires:
+        try:
+            return max(0.0, parsedate_to_datetime(expires).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return 0.0
+    return 0.0
+
+
+@dataclass
+class CachedResponse:
+    """캐시에 저장된 응답 하나. body는 zlib으로 압축해서 저장한다."""
+
+    url: str
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_type: Optional[str] = None
+    stored_at: float = 0.0
+    fresh_until: float = 0.0
+    parsed: Optional[Dict[str, Any]] = field(default=None)
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (time.time() if now is None else now) < self.fresh_until
+
+    def validators(self) -> Dict[str, str]:
+        """재검증 요청에 붙일 조건부 헤더."""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_bytes(self) -> bytes:
+        meta = asdict(self)
+        body = meta.pop("body")
+        # 메타 JSON 한 줄 + 본문을 이어 붙여 통째로 압축한다
+        return zlib.compress(json.dumps(meta, ensure_ascii=False).encode("utf-8") + b"\n" + body)
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> "CachedResponse":
+        meta, _, body = zlib.decompress(raw).partition(b"\n")
+        return cls(body=body, **json.loads(meta.decode("utf-8")))
+
+
+class HttpCache:
+    """스크랩한 페이지용 조건부 GET 캐시.
+
+    ETag/Last-Modified와 Cache-Control을 함께 저장해 신선한 항목은 네트워크 없이 쓰고,
+    만료된 항목은 If-None-Match/If-Modified-Since로 재검증한다. 파싱 결과도 같이 두어
+    304 응답이면 본문 다운로드와 HTML 파싱을 모두 건너뛴다.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 5_000,
+        ttl_seconds: Optional[float] = None,
+        max_body_bytes: int = 5 * 1024 * 1024,
+    ):
+        self.store = DiskCache(path, max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self.max_body_bytes = max_body_bytes
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.uncacheable = 0
+
+    def record(self, outcome: str) -> None:
+        """조회 결과를 센다. hits: 신선한 캐시 사용, revalidated: 304, misses: 전체 다운로드."""
+        setattr(self, outcome, getattr(self, outcome) + 1)
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        raw = self.store.get(self._key(url))
+        if raw is None:
+            return None
+        try:
+            return CachedResponse.from_bytes(raw)
+        except (zlib.error, ValueError, TypeError):
+            self.store.delete(self._key(url))
+            return None
+
+    def store_response(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        body: bytes,
+        parsed: Optional[Dict[str, Any]] = None,
+    ) -> Optional[CachedResponse]:
+        """200 응답을 저장한다. no-store이거나 재사용 근거(검증자/신선도)가 없으면 저장하지 않는다."""
+        directives = parse_cache_control(headers.get("cache-control"))
+        lifetime = freshness_lifetime(headers)
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        if "no-store" in directives or len(body) > self.max_body_bytes or not (etag or last_modified or lifetime):
+            self.uncacheable += 1
+            return None
+
+        now = time.time()
+        entry = CachedResponse(
+            url=url,
+            body=body,
+            etag=etag,
+            last_modified=last_modified,
+            content_type=headers.get("content-type"),
+            stored_at=now,
+            fresh_until=now + lifetime,
+            parsed=parsed,
+        )
+        self.store.set(self._key(url), entry.to_bytes())
+        return entry
+
+    def refresh(self, entry: CachedResponse, headers: Mapping[str, str]) -> CachedResponse:
+        """304 응답의 헤더로 신선도와 검증자를 갱신한다."""
+        now = time.time()
+        entry.etag = headers.get("etag") or entry.etag
+        entry.last_modified = headers.get("last-modified") or entry.last_modified
+        entry.stored_at = now
+        entry.fresh_until = now + freshness_lifetime(headers)
+        self.store.set(self._key(entry.url), entry.to_bytes())
+        return entry
+
+    def update_parsed(self, entry: CachedResponse, parsed: Dict[str, Any]) -> None:
+        entry.parsed = parsed
+        self.store.set(self._key(entry.url), entry.to_bytes())
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses + self.revalidated
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "uncacheable": self.uncacheable,
+            "hit_rate": round((self.hits + self.revalidated) / lookups, 4) if lookups else 0.0,
+            "store": self.store.stats(),
+        }
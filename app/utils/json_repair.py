@@ -0,0 +1,130 @@
+import json
+import re
+from itertools import chain
+from typing import Any, List, Tuple
+
+_FENCE_PATTERN = re.compile(r"```(?:json|JSON)?\s*(.*?)(?:```|$)", re.S)
+_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_CLOSERS = {"{": "}", "[": "]"}
+# 잘린 응답은 마지막 쉼표 위치부터 되감아 보며 닫는다 (과도한 재시도 방지용 상한)
+_MAX_CUT_ATTEMPTS = 8
+
+
+def _strip_fences(text: str) -> str:
+    match = _FENCE_PATTERN.search(text)
+    return match.group(1) if match else text
+
+
+def _scan(text: str) -> Tuple[List[str], List[str], List[Tuple[int, List[str]]], bool]:
+    """JSON 유사 텍스트를 한 번 훑으며 고친 토큰 목록, 열린 괄호 스택, 쉼표 위치를 만든다.
+
+    - 작은따옴표 문자열 → 큰따옴표 문자열, 문자열 안의 개행은 \\n으로
+    - 닫는 괄호 앞의 trailing comma 제거, Python 리터럴(True/False/None) 변환
+    - 최상위 값이 닫히면 뒤의 설명 문장은 버린다.
+    """
+    out: List[str] = []
+    stack: List[str] = []
+    cuts: List[Tuple[int, List[str]]] = []
+    quote = None
+    index = 0
+    length = len(text)
+
+    while index < length:
+        ch = text[index]
+        if quote is not None:
+            if ch == "\\" and index + 1 < length:
+                following = text[index + 1]
+                # JSON에는 \' 이스케이프가 없다
+                out.append("'" if following == "'" else ch + following)
+                index += 2
+                continue
+            if ch == quote:
+                out.append('"')
+                quote = None
+            elif ch == '"':
+                out.append('\\"')
+            elif ch == "\n":
+                out.append("\\n")
+            else:
+                out.append(ch)
+            index += 1
+            continue
+
+        if ch in "\"'":
+            quote = ch
+            out.append('"')
+        elif ch in "{[":
+            stack.append(ch)
+            out.append(ch)
+        elif ch in "}]":
+            _drop_trailing_comma(out)
+            if stack:
+                out.append(_CLOSERS[stack.pop()])
+                if not stack:
+                    return out, stack, cuts, False
+        elif ch == ",":
+            cuts.append((len(out), list(stack)))
+            out.append(ch)
+        elif ch in "TFN":
+            literal = next((word for word in _LITERALS if text.startswith(word, index)), None)
+            if literal is not None and _is_word_boundary(text, index, literal):
+                out.append(_LITERALS[literal])
+                index += len(literal)
+                continue
+            out.append(ch)
+        else:
+            out.append(ch)
+        index += 1
+
+    return out, stack, cuts, quote is not None
+
+
+def _is_word_boundary(text: str, index: int, word: str) -> bool:
+    before = text[index - 1] if index > 0 else " "
+    end = index + len(word)
+    after = text[end] if end < len(text) else " "
+    return not (before.isalnum() or before == "_") and not (after.isalnum() or after == "_")
+
+
+def _drop_trailing_comma(out: List[str]) -> None:
+    position = len(out) - 1
+    while position >= 0 and out[position].isspace():
+        position -= 1
+    if position >= 0 and out[position] == ",":
+        del out[position]
+
+
+def _close(tokens: List[str], stack: List[str], open_string: bool = False) -> str:
+    text = "".join(tokens)
+    if open_string:
+        text += '"'
+    text = text.rstrip().rstrip(",").rstrip()
+    return text + "".join(_CLOSERS[opener] for opener in reversed(stack))
+
+
+def repair_json(text: str) -> Any:
+    """LLM이 낸 깨진 JSON을 로컬에서 고쳐 파싱한다.
+
+    코드펜스, 앞뒤 설명 문장, trailing comma, 작은따옴표, 닫히지 않은 문자열/괄호,
+    중간에 잘린 배열·객체를 처리한다. 고칠 수 없으면 json.JSONDecodeError를 던진다.
+    """
+    candidate = _strip_fences(text or "")
+    starts = [position for position in (candidate.find("{"), candidate.find("[")) if position != -1]
+    if not starts:
+        raise json.JSONDecodeError("no JSON value", candidate, 0)
+    candidate = candidate[min(starts) :]
+
+    tokens, stack, cuts, open_string = _scan(candidate)
+    # 잘린 마지막 항목(짝 없는 key, 끊긴 값)은 버리고 직전 쉼표까지로 닫아 본다 (필요할 때만 생성)
+    attempts = chain(
+        (_close(tokens, stack, open_string),),
+        (_close(tokens[:position], cut_stack) for position, cut_stack in reversed(cuts[-_MAX_CUT_ATTEMPTS:])),
+    )
+
+    error: json.JSONDecodeError = json.JSONDecodeError("unrepairable", candidate, 0)
+    for attempt in attempts:
+        try:
+            return json.loads(attempt)
+        except json.JSONDecodeError as e:
+            error = e
+    raise error
@@ -1,72 +1,198 @@
 import re
-from typing import List
+from dataclasses import dataclass
+from typing import Any, Iterator, List, NamedTuple, Optional, Tuple
+
+# 토큰 청킹에서 자르기 좋은 위치: 줄바꿈, 문장 끝
+_BOUNDARY_PATTERN = re.compile(r"\n+|(?<=[.!?。])\s+")
+
+
+@dataclass(frozen=True)
+class TokenChunk:
+    """토큰 기준 chunk. start/end는 정규화된 텍스트의 문자 오프셋이다."""
+
+    text: str
+    start: int
+    end: int
+    token_count: int
+
+
+_NORMALIZE_PATTERN = re.compile(r"(?:\r\n|\r|\n){3,}|\r\n|\r|[ \t]+")
+_PARAGRAPH_BREAK = re.compile(r"\n\n")
+
+
+def _normalize_match(match: "re.Match[str]") -> str:
+    token = match.group(0)
+    if token[0] in " \t":
+        return " "
+    # 줄바꿈 3개 이상은 문단 구분 하나로, CRLF/CR은 LF로
+    return "\n" if token in ("\r\n", "\r") else "\n\n"
 
 
 def normalize_text(text: str) -> str:
-    """청킹 전 공백과 줄바꿈을 정리한다."""
+    """청킹 전 공백과 줄바꿈을 정리한다 (전체 텍스트를 한 번만 훑는다)."""
     if not text:
         return ""
+    return _NORMALIZE_PATTERN.sub(_normalize_match, text).strip()
 
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    text = re.sub(r"[ \t]+", " ", text)
-    return text.strip()
 
+class ChunkSpan(NamedTuple):
+    """정규화된 텍스트 안의 chunk 위치 [start, end)"""
+
+    start: int
+    end: int
+
+    def slice(self, normalized: str) -> str:
+        return normalized[self.start : self.end]
+
+
+def _strip_span(text: str, start: int, end: int) -> Tuple[int, int]:
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def _iter_paragraph_spans(text: str) -> Iterator[Tuple[int, int]]:
+    position = 0
+    for match in _PARAGRAPH_BREAK.finditer(text):
+        start, end = _strip_span(text, position, match.start())
+        if start < end:
+            yield start, end
+        position = match.end()
+    start, end = _strip_span(text, position, len(text))
+    if start < end:
+        yield start, end
 
-def split_into_chunks(text: str, chunk_size: int = 1100, overlap: int = 180) -> List[str]:
-    """
-    문단 우선 청킹.
-    - 먼저 빈 줄 기준으로 문단을 나누고
-    - 너무 긴 문단은 다시 문자 기준으로 분할
-    - 인접 chunk 간 일부 문맥(overlap)을 유지한다.
-    """
-    normalized = normalize_text(text)
-    if not normalized:
-        return []
 
-    paragraphs = [part.strip() for part in normalized.split("\n\n") if part.strip()]
-    chunks: List[str] = []
-    current = ""
-
-    def flush_current() -> None:
-        nonlocal current
-        if current.strip():
-            chunks.append(current.strip())
-        current = ""
-
-    for paragraph in paragraphs:
-        if len(paragraph) > chunk_size:
-            flush_current()
-            start = 0
-            while start < len(paragraph):
-                end = start + chunk_size
-                piece = paragraph[start:end].strip()
-                if piece:
-                    chunks.append(piece)
-                if end >= len(paragraph):
+def _iter_base_spans(text: str, chunk_size: int, overlap: int) -> Iterator[Tuple[int, int]]:
+    current: Optional[Tuple[int, int]] = None
+    for para_start, para_end in _iter_paragraph_spans(text):
+        if para_end - para_start > chunk_size:
+            # 너무 긴 문단은 문자 기준으로 겹치게 자른다
+            if current is not None:
+                yield current
+                current = None
+            start = para_start
+            while start < para_end:
+                end = min(start + chunk_size, para_end)
+                piece_start, piece_end = _strip_span(text, start, end)
+                if piece_start < piece_end:
+                    yield piece_start, piece_end
+                if end >= para_end:
                     break
                 start = max(end - overlap, start + 1)
             continue
 
-        candidate = paragraph if not current else f"{current}\n\n{paragraph}"
-        if len(candidate) <= chunk_size:
-            current = candidate
-            continue
+        if current is None:
+            current = (para_start, para_end)
+        elif para_end - current[0] <= chunk_size:
+            current = (current[0], para_end)
+        else:
+            yield current
+            current = (para_start, para_end)
 
-        flush_current()
-        current = paragraph
+    if current is not None:
+        yield current
 
-    flush_current()
 
-    if overlap <= 0 or len(chunks) <= 1:
-        return chunks
+def iter_chunk_spans(normalized: str, chunk_size: int = 1100, overlap: int = 180) -> Iterator[ChunkSpan]:
+    """
+    문단 우선 청킹을 (start, end) 오프셋으로 흘려보낸다.
+    - normalized는 normalize_text 결과여야 하며, 오프셋은 이 문자열 기준이다
+    - 빈 줄 기준 문단을 chunk_size까지 묶고, 너무 긴 문단은 문자 기준으로 분할
+    - overlap > 0이면 각 chunk 시작을 앞 chunk 끝에서 overlap만큼 당겨 문맥을 잇는다.
+    chunk 문자열을 만들지 않으므로 긴 문서도 추가 메모리 없이 훑을 수 있다.
+    """
+    previous: Optional[Tuple[int, int]] = None
+    for base_start, end in _iter_base_spans(normalized, chunk_size, overlap):
+        start = base_start
+        if previous is not None and overlap > 0:
+            start = min(start, max(previous[1] - overlap, previous[0]))
+            start, _ = _strip_span(normalized, start, end)
+        previous = (base_start, end)
+        yield ChunkSpan(start, end)
 
-    stitched: List[str] = []
-    for index, chunk in enumerate(chunks):
-        if index == 0:
-            stitched.append(chunk)
-            continue
-        prev_tail = chunks[index - 1][-overlap:].strip()
-        stitched.append(f"{prev_tail}\n\n{chunk}".strip())
-    return stitched
 
+def split_into_chunks(text: str, chunk_size: int = 1100, overlap: int = 180) -> List[str]:
+    """iter_chunk_spans 결과를 문자열로 만든다."""
+    normalized = normalize_text(text)
+    return [span.slice(normalized) for span in iter_chunk_spans(normalized, chunk_size, overlap)]
+
+
+def count_tokens(tokenizer: Any, text: str) -> int:
+    """special token을 제외한 토큰 수"""
+    if not text or not text.strip():
+        return 0
+    return len(tokenizer(text, add_special_tokens=False, verbose=False)["input_ids"])
+
+
+def split_into_token_chunks(
+    text: str,
+    tokenizer: Any,
+    max_tokens: int,
+    overlap_tokens: int = 24,
+    reserved_tokens: int = 0,
+) -> List[TokenChunk]:
+    """
+    임베딩 모델 tokenizer 기준 청킹.
+    - 정규화된 전체 텍스트를 한 번만 토크나이즈하고 offset mapping으로 원문 위치를 얻는다
+    - chunk당 토큰 수는 max_tokens - reserved_tokens(제목/태그/special token 몫)를 넘지 않는다
+    - 예산 뒤쪽 절반 안에 줄바꿈/문장 끝이 있으면 그 위치에서 자른다
+    - 인접 chunk는 overlap_tokens만큼 겹친다.
+    """
+    normalized = normalize_text(text)
+    if not normalized:
+        return []
+
+    budget = max(max_tokens - reserved_tokens, max(1, max_tokens // 4))
+    overlap = max(0, min(overlap_tokens, budget // 2))
+    encoding = tokenizer(
+        normalized,
+        add_special_tokens=False,
+        return_offsets_mapping=True,
+        verbose=False,
+    )
+    offsets = [tuple(offset) for offset in encoding["offset_mapping"]]
+    if not offsets:
+        return []
+
+    # 경계 문자 위치를 "그 뒤에서 시작하는 첫 토큰" 인덱스로 바꾼다
+    boundary_tokens = set()
+    token_index = 0
+    for match in _BOUNDARY_PATTERN.finditer(normalized):
+        while token_index < len(offsets) and offsets[token_index][0] < match.end():
+            token_index += 1
+        if 0 < token_index < len(offsets):
+            boundary_tokens.add(token_index)
+
+    chunks: List[TokenChunk] = []
+    start = 0
+    while start < len(offsets):
+        end = min(start + budget, len(offsets))
+        if end < len(offsets):
+            snapped = next(
+                (index for index in range(end, start + budget // 2, -1) if index in boundary_tokens),
+                None,
+            )
+            if snapped is not None:
+                end = snapped
+
+        char_start = offsets[start][0]
+        char_end = offsets[end - 1][1]
+        piece = normalized[char_start:char_end]
+        stripped = piece.strip()
+        if stripped:
+            lead = len(piece) - len(piece.lstrip())
+            chunks.append(
+                TokenChunk(
+                    text=stripped,
+                    start=char_start + lead,
+                    end=char_start + lead + len(stripped),
+                    token_count=end - start,
+                )
+            )
+        if end >= len(offsets):
+            break
+        start = max(end - overlap, start + 1)
+    return chunks
@@ -0,0 +1,102 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class AsyncLRUCache:
+    """TTL이 있는 in-process LRU 캐시.
+
+    같은 키에 대한 동시 요청은 진행 중인 하나의 계산 결과를 함께 기다린다(singleflight).
+    계산 중 예외가 나면 캐시에 저장하지 않고 대기 중인 호출자 모두에게 그대로 전달한다.
+    호출자가 취소돼도 계산은 끝까지 돌아 나머지 대기자와 캐시에 결과를 남긴다.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 600.0):
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시 값을 반환하고 적중/미스를 집계한다."""
+        value = self._lookup(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def _lookup(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        cached = self._lookup(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        # 계산은 별도 task에서 돌리고 첫 호출자도 shield로 기다린다.
+        # 한 호출자가 취소돼도(클라이언트 연결 끊김 등) 다른 대기자의 계산은 계속된다.
+        task = asyncio.ensure_future(self._compute_and_store(key, compute))
+        task.add_done_callback(_consume_exception)
+        self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _compute_and_store(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value = await compute()
+            self.set(key, value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self) -> Dict[str, float]:
+        requests = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": round((self.hits + self.coalesced) / requests, 4) if requests else 0.0,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+def _consume_exception(task: "asyncio.Future[Any]") -> None:
+    # 대기자가 모두 취소된 뒤 실패하면 "exception was never retrieved" 경고가 나므로 여기서 읽어 둔다.
+    if not task.cancelled():
+        task.exception()
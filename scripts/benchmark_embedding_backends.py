@@ -0,0 +1,108 @@
+"""
+임베딩 백엔드(torch / onnx / onnx-int8)의 처리량, 메모리, 검색 품질을 비교하는 스크립트.
+
+torch 결과를 기준으로 백엔드별 chunk/sec, 최대 RSS, 평균/최소 코사인 유사도,
+recall@k(앞쪽 텍스트를 질의로 써서 torch 상위 k 이웃과 겹치는 비율)를 출력한다.
+
+Usage:
+    python scripts/benchmark_embedding_backends.py --input chunks.txt --backends torch onnx onnx-int8
+"""
+import argparse
+import os
+import resource
+import sys
+import time
+from typing import Dict, List
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.services.embedding_service import EmbeddingService
+
+SAMPLE_TEXTS = [
+    "FastAPI와 Celery로 비동기 콘텐츠 처리 파이프라인을 구성하는 방법",
+    "Qdrant HNSW 인덱스의 m, ef_construct 파라미터가 검색 품질에 미치는 영향",
+    "How to profile CPU-bound Python services with py-spy and perf",
+    "벡터 양자화는 메모리 사용량을 줄이지만 재채점이 필요할 수 있다",
+    "Sentence embeddings with mean pooling over transformer token outputs",
+    "PostgreSQL 인덱스 설계와 쿼리 플랜 읽는 법",
+    "Scraping news articles reliably with conditional GET and ETags",
+    "요약 품질을 높이기 위한 chunk 크기와 overlap 조정",
+]
+
+
+def _load_texts(path: str, limit: int) -> List[str]:
+    if not path:
+        return (SAMPLE_TEXTS * (limit // len(SAMPLE_TEXTS) + 1))[:limit]
+    with open(path, encoding="utf-8") as f:
+        texts = [line.strip() for line in f if line.strip()]
+    return texts[:limit]
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    return matrix / np.clip(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12, None)
+
+
+def _recall_at_k(reference: np.ndarray, candidate: np.ndarray, queries: int, k: int) -> float:
+    ref, cand = _normalize(reference), _normalize(candidate)
+    k = min(k, len(ref) - 1)
+    if k <= 0:
+        return 1.0
+    hits = 0
+    for q in range(min(queries, len(ref))):
+        ref_scores = ref @ ref[q]
+        cand_scores = cand @ cand[q]
+        ref_scores[q] = cand_scores[q] = -np.inf
+        ref_top = set(np.argsort(-ref_scores)[:k])
+        cand_top = set(np.argsort(-cand_scores)[:k])
+        hits += len(ref_top & cand_top)
+    return hits / (min(queries, len(ref)) * k)
+
+
+def _run_backend(backend: str, texts: List[str], batch_size: int) -> Dict[str, object]:
+    settings.EMBEDDING_BACKEND = backend
+    service = EmbeddingService()
+    service.warm_up(encode=True)
+
+    started = time.perf_counter()
+    embeddings = np.asarray(service.model.encode(texts, batch_size=batch_size), dtype=np.float32)
+    elapsed = time.perf_counter() - started
+    return {
+        "embeddings": embeddings,
+        "chunks_per_sec": len(texts) / elapsed if elapsed else float("inf"),
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", default="", help="한 줄에 하나의 chunk 텍스트 (없으면 내장 샘플)")
+    parser.add_argument("--limit", type=int, default=512)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--backends", nargs="+", default=["torch", "onnx", "onnx-int8"])
+    args = parser.parse_args()
+
+    texts = _load_texts(args.input, args.limit)
+    backends = ["torch"] + [b for b in args.backends if b != "torch"]
+    results = {backend: _run_backend(backend, texts, args.batch_size) for backend in backends}
+    reference = results["torch"]["embeddings"]
+
+    print(f"texts={len(texts)} batch_size={args.batch_size} k={args.k}")
+    print(f"{'backend':<10} {'chunks/s':>10} {'maxRSS(MB)':>11} {'cos_mean':>9} {'cos_min':>9} {'recall@k':>9}")
+    for backend, result in results.items():
+        embeddings = result["embeddings"]
+        cosine = np.sum(_normalize(reference) * _normalize(embeddings), axis=1)
+        recall = _recall_at_k(reference, embeddings, args.queries, args.k)
+        # ru_maxrss는 프로세스 누적 최대값이므로 torch를 먼저 돌린 뒤의 값은 상한으로만 본다.
+        print(
+            f"{backend:<10} {result['chunks_per_sec']:>10.1f} {result['max_rss_mb']:>11.0f} "
+            f"{cosine.mean():>9.5f} {cosine.min():>9.5f} {recall:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+HTML 추출 엔진(bs4 html.parser / lxml 단일 순회)과 본문 선택 방식(keywords / density)을
+저장된 HTML 페이지에서 비교하는 스크립트.
+
+- 속도: 엔진별 평균 ms/page와 두 엔진 결과가 같은지
+- 품질: expectations.json이 있으면 본문 방식별로 포함돼야 할 문장 누락 수, 잡음 문장 유입 수,
+  본문 길이(= 이후 chunk/요약/임베딩 양)를 출력한다.
+
+Usage:
+    python scripts/benchmark_html_extraction.py --input tests/fixtures/html --repeat 50
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.services.scraper_service import ScraperService
+
+ENGINES = ("bs4", "lxml")
+EXTRACTORS = ("keywords", "density")
+PAGE_URL = "https://example.com/benchmark"
+
+
+def _load_pages(path: str) -> List[Tuple[str, bytes]]:
+    root = Path(path)
+    files = [root] if root.is_file() else sorted(root.glob("*.htm*"))
+    return [(file.name, file.read_bytes()) for file in files]
+
+
+def _load_expectations(path: str) -> Dict[str, Dict[str, List[str]]]:
+    root = Path(path)
+    expectations = (root.parent if root.is_file() else root) / "expectations.json"
+    if not expectations.exists():
+        return {}
+    return json.loads(expectations.read_text(encoding="utf-8"))
+
+
+def _parse(scraper: ScraperService, engine: str, extractor: str, html: bytes) -> Dict:
+    settings.SCRAPER_HTML_ENGINE = engine
+    settings.SCRAPER_CONTENT_EXTRACTOR = extractor
+    return scraper._parse_html_page(html, PAGE_URL)
+
+
+def _time_engine(scraper: ScraperService, engine: str, html: bytes, repeat: int) -> Tuple[float, Dict]:
+    result = _parse(scraper, engine, "density", html)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        scraper._parse_html_page(html, PAGE_URL)
+    return (time.perf_counter() - started) * 1000 / repeat, result
+
+
+def _quality(content: str, expected: Optional[Dict[str, List[str]]]) -> str:
+    if not expected:
+        return f"{len(content):>6} {'-':>5} {'-':>5}"
+    missing = sum(phrase not in content for phrase in expected.get("include", []))
+    leaked = sum(phrase in content for phrase in expected.get("exclude", []))
+    return f"{len(content):>6} {missing:>5} {leaked:>5}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", default="tests/fixtures/html", help="HTML 파일 또는 디렉터리")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    pages = _load_pages(args.input)
+    if not pages:
+        sys.exit(f"HTML 파일이 없습니다: {args.input}")
+    expectations = _load_expectations(args.input)
+
+    settings.SCRAPER_HTTP_CACHE_ENABLED = False
+    scraper = ScraperService()
+    totals = {engine: 0.0 for engine in ENGINES}
+
+    print(f"pages={len(pages)} repeat={args.repeat}")
+    print(f"{'page':<28} {'KB':>6} {'bs4 ms':>8} {'lxml ms':>8} {'speedup':>8} {'same':>5}")
+    for name, html in pages:
+        timings = {}
+        results = {}
+        for engine in ENGINES:
+            timings[engine], results[engine] = _time_engine(scraper, engine, html, args.repeat)
+            totals[engine] += timings[engine]
+        speedup = timings["bs4"] / timings["lxml"] if timings["lxml"] else float("inf")
+        print(
+            f"{name[:28]:<28} {len(html) / 1024:>6.1f} {timings['bs4']:>8.2f} {timings['lxml']:>8.2f} "
+            f"{speedup:>7.1f}x {str(results['bs4'] == results['lxml']):>5}"
+        )
+    mean = {engine: totals[engine] / len(pages) for engine in ENGINES}
+    print(f"{'mean ms/page':<28} {'':>6} {mean['bs4']:>8.2f} {mean['lxml']:>8.2f} {mean['bs4'] / mean['lxml']:>7.1f}x")
+
+    print()
+    print(f"{'page':<28} " + " ".join(f"{extractor + ' chars':>14} {'miss':>5} {'leak':>5}" for extractor in EXTRACTORS))
+    summary = {extractor: [0, 0, 0] for extractor in EXTRACTORS}
+    for name, html in pages:
+        expected = expectations.get(name)
+        row = []
+        for extractor in EXTRACTORS:
+            content = _parse(scraper, "lxml", extractor, html)["content"]
+            row.append(f"{'':>8}" + _quality(content, expected))
+            summary[extractor][0] += len(content)
+            if expected:
+                summary[extractor][1] += sum(p not in content for p in expected.get("include", []))
+                summary[extractor][2] += sum(p in content for p in expected.get("exclude", []))
+        print(f"{name[:28]:<28} " + " ".join(row))
+    print(
+        f"{'total':<28} "
+        + " ".join(f"{'':>8}{chars:>6} {missing:>5} {leaked:>5}" for chars, missing, leaked in summary.values())
+    )
+
+
+if __name__ == "__main__":
+    main()
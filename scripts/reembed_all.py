@@ -13,6 +13,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from sqlalchemy import select
 from app.core.database import async_session_maker
 from app.models.content import Content
+from app.services.chunk_artifact import load_or_build_chunk_artifact
 from app.services.vector_service import vector_service
 
 import logging
@@ -34,6 +35,14 @@ async def reembed_all():
         success, fail = 0, 0
         for content in contents:
             try:
+                # 원문/청킹 설정이 그대로면 저장된 chunk artifact를 재사용한다
+                chunk_artifact = None
+                if content.raw_content:
+                    chunk_artifact, rebuilt = load_or_build_chunk_artifact(
+                        content.chunk_artifact, content.raw_content, content.title or ""
+                    )
+                    if rebuilt:
+                        content.chunk_artifact = chunk_artifact.to_dict()
                 ok = await vector_service.store_content_chunks(
                     content_id=content.id,
                     title=content.title or "",
@@ -42,6 +51,7 @@ async def reembed_all():
                     user_id=content.user_id,
                     is_public=content.is_public or False,
                     raw_content=content.raw_content or "",
+                    chunk_artifact=chunk_artifact,
                 )
                 if ok:
                     success += 1
@@ -53,6 +63,7 @@ async def reembed_all():
                 fail += 1
                 logger.error("❌ content_id=%d error=%s", content.id, e)
 
+        await db.commit()
         logger.info("완료 — 성공: %d / 실패: %d", success, fail)
 
 
@@ -11,6 +11,7 @@ if str(ROOT_DIR) not in sys.path:
 
 from app.core.database import async_engine
 from app.models.content import Content
+from app.services.chunk_artifact import load_or_build_chunk_artifact
 from app.services.vector_service import vector_service
 
 
@@ -43,6 +44,14 @@ async def reindex():
                 print(f"  - summary_len={len(content.summary) if content.summary else 0}")
 
                 try:
+                    # 원문/청킹 설정이 그대로면 저장된 chunk artifact를 재사용한다
+                    chunk_artifact = None
+                    if content.raw_content:
+                        chunk_artifact, rebuilt = load_or_build_chunk_artifact(
+                            content.chunk_artifact, content.raw_content, content.title or ""
+                        )
+                        if rebuilt:
+                            content.chunk_artifact = chunk_artifact.to_dict()
                     success = await vector_service.store_content_chunks(
                         content_id=content.id,
                         title=content.title or "",
@@ -51,6 +60,7 @@ async def reindex():
                         user_id=content.user_id,
                         is_public=content.is_public or False,
                         raw_content=content.raw_content or "",
+                        chunk_artifact=chunk_artifact,
                     )
 
                     if success:
@@ -64,6 +74,8 @@ async def reindex():
                     fail_count += 1
                     print(f"  - exception: {e}")
 
+            await session.commit()
+
             print("\n" + "=" * 50)
             print("Reindex finished")
             print(f"  success: {success_count}")
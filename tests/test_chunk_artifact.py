@@ -0,0 +1,115 @@
+"""
+test_chunk_artifact.py
+
+chunk artifact 의 생성, 직렬화, 원문/설정 변경 시 재생성을 검증한다.
+"""
+
+import re
+from unittest.mock import PropertyMock, patch
+
+import pytest
+
+from app.services.chunk_artifact import (
+    ChunkArtifact,
+    _build,
+    build_chunk_artifact,
+    load_or_build_chunk_artifact,
+)
+from app.utils.text_chunking import normalize_text, split_into_chunks
+
+# app.tasks.content_tasks는 DB 세션을 import하므로 같은 값을 여기서 둔다
+DIRECT_SUMMARY_MAX_CHUNKS = 2
+
+SOURCE = "첫 문단입니다.\n\n\n두 번째   문단입니다.\n\n" + "가나다 " * 400
+
+
+class TestChunkArtifact:
+    def test_texts_match_char_chunker(self):
+        artifact = build_chunk_artifact(SOURCE)
+        assert artifact.texts() == split_into_chunks(SOURCE, chunk_size=1100, overlap=180)
+
+    def test_artifact_stored_with_chunk_hashes_is_still_reused(self):
+        # chunk_hashes를 함께 저장하던 이전 artifact
+        stored = {**build_chunk_artifact(SOURCE).to_dict(), "chunk_hashes": ["x"]}
+
+        artifact, rebuilt = load_or_build_chunk_artifact(stored, SOURCE)
+
+        assert rebuilt is False
+        assert artifact.texts() == split_into_chunks(SOURCE, chunk_size=1100, overlap=180)
+
+    def test_round_trip_reuses_stored_artifact(self):
+        stored = build_chunk_artifact(SOURCE).to_dict()
+
+        artifact, rebuilt = load_or_build_chunk_artifact(stored, SOURCE)
+
+        assert rebuilt is False
+        assert artifact.texts() == split_into_chunks(SOURCE, chunk_size=1100, overlap=180)
+
+    def test_changed_source_rebuilds(self):
+        stored = build_chunk_artifact(SOURCE).to_dict()
+        artifact, rebuilt = load_or_build_chunk_artifact(stored, SOURCE + "\n\n추가 문단")
+        assert rebuilt is True
+        assert artifact.source_hash != stored["source_hash"]
+
+    def test_changed_params_rebuild(self):
+        stored = build_chunk_artifact(SOURCE).to_dict()
+        stored["params"] = {**stored["params"], "chunk_size": 500}
+        _, rebuilt = load_or_build_chunk_artifact(stored, SOURCE)
+        assert rebuilt is True
+
+    def test_corrupt_stored_artifact_rebuilds(self):
+        _, rebuilt = load_or_build_chunk_artifact({"spans": "broken"}, SOURCE)
+        assert rebuilt is True
+
+    def test_unbound_artifact_cannot_materialize(self):
+        artifact = ChunkArtifact.from_dict(build_chunk_artifact(SOURCE).to_dict())
+        with pytest.raises(ValueError):
+            artifact.texts()
+
+
+class _WhitespaceTokenizer:
+    def __call__(self, text, add_special_tokens=False, return_offsets_mapping=False, verbose=False):
+        offsets = [(m.start(), m.end()) for m in re.finditer(r"\S+", text)]
+        encoding = {"input_ids": list(range(len(offsets)))}
+        if return_offsets_mapping:
+            encoding["offset_mapping"] = offsets
+        return encoding
+
+
+class TestTokenModeSummaryChunks:
+    @pytest.fixture
+    def token_params(self):
+        from app.services.embedding_service import EmbeddingService
+
+        tokenizer = PropertyMock(return_value=_WhitespaceTokenizer())
+        with patch.object(EmbeddingService, "tokenizer", new_callable=lambda: tokenizer):
+            yield {
+                "version": 1,
+                "mode": "tokens",
+                "model": "test-model",
+                "max_tokens": 128,
+                "overlap_tokens": 0,
+                "reserved_tokens": 2,
+            }
+
+    def test_short_document_summarizes_in_one_char_chunk(self, token_params):
+        # 임베딩 chunk는 여러 개여도 요약은 문자 기준 chunk 하나로 직접 요약 대상이 된다
+        text = " ".join(f"단어{i}" for i in range(300))
+        normalized = normalize_text(text)
+
+        artifact = _build(normalized, "hash", token_params)
+
+        assert len(artifact.texts()) > DIRECT_SUMMARY_MAX_CHUNKS
+        assert artifact.summary_texts() == split_into_chunks(text, chunk_size=1100, overlap=180)
+        assert len(artifact.summary_texts()) <= DIRECT_SUMMARY_MAX_CHUNKS
+
+    def test_summary_spans_survive_round_trip_and_rebuild_when_missing(self, token_params):
+        text = " ".join(f"단어{i}" for i in range(300))
+        normalized = normalize_text(text)
+        stored = _build(normalized, "hash", token_params).to_dict()
+
+        restored = ChunkArtifact.from_dict(stored).bind(normalized)
+        legacy = ChunkArtifact.from_dict({**stored, "summary_spans": None}).bind(normalized)
+
+        assert restored.summary_spans is not None
+        assert restored.summary_texts() == legacy.summary_texts()
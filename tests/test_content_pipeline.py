@@ -5,6 +5,8 @@ content_tasks.py 의 순수 헬퍼 함수들을 단위 테스트한다.
 Celery / DB / AI 호출이 없는 함수들만 다룬다.
 """
 
+import asyncio
+
 import pytest
 
 from app.tasks.content_tasks import (
@@ -19,6 +21,7 @@ from app.tasks.content_tasks import (
     _needs_auto_title,
     _sentence_count,
     _should_use_direct_summary,
+    _summarize_chunks,
 )
 
 
@@ -240,3 +243,60 @@ class TestCleanGeneratedTitle:
     def test_both_empty_returns_default(self):
         result = _clean_generated_title("", "")
         assert result == "요약 콘텐츠"
+
+
+# ─────────────────────────────────────────────────────────────
+# _summarize_chunks
+# ─────────────────────────────────────────────────────────────
+class _FakeAIService:
+    def __init__(self, failures=(), errors=(), delay=0.01):
+        self.failures = set(failures)
+        self.errors = set(errors)
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = []
+
+    async def summarize_chunk(self, chunk, title, url):
+        self.calls.append(chunk)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # 뒤 chunk가 먼저 끝나도 결과 순서가 유지되는지 보기 위해 앞 chunk를 더 오래 기다린다
+            await asyncio.sleep(self.delay * (10 - int(chunk[-1])))
+        finally:
+            self.in_flight -= 1
+        if chunk in self.errors:
+            raise RuntimeError(f"{chunk} boom")
+        if chunk in self.failures:
+            return {"success": False, "error": f"{chunk} failed"}
+        return {"success": True, "summary": f"summary-{chunk}"}
+
+
+class TestSummarizeChunks:
+    async def test_keeps_chunk_order_under_concurrency_limit(self):
+        ai = _FakeAIService()
+        chunks = [f"chunk{i}" for i in range(6)]
+
+        results = await _summarize_chunks(ai, chunks, "제목", "", concurrency=3)
+
+        assert [r["summary"] for r in results] == [f"summary-{c}" for c in chunks]
+        assert ai.max_in_flight == 3
+
+    async def test_first_failure_in_order_wins(self):
+        ai = _FakeAIService(failures={"chunk1", "chunk3"})
+
+        results = await _summarize_chunks(ai, [f"chunk{i}" for i in range(5)], "", "", concurrency=5)
+
+        assert results[-1] == {"success": False, "error": "chunk1 failed"}
+        assert len(results) == 2
+
+    async def test_exception_propagates(self):
+        ai = _FakeAIService(errors={"chunk2"})
+        with pytest.raises(RuntimeError, match="chunk2"):
+            await _summarize_chunks(ai, [f"chunk{i}" for i in range(4)], "", "", concurrency=2)
+
+    async def test_failure_cancels_later_chunks(self):
+        ai = _FakeAIService(failures={"chunk0"}, delay=0)
+        await _summarize_chunks(ai, [f"chunk{i}" for i in range(6)], "", "", concurrency=1)
+        assert ai.calls == ["chunk0"]
@@ -0,0 +1,99 @@
+"""
+test_disk_cache.py
+
+DiskCache 의 TTL 만료, LRU 퇴출, 통계와 AIService 의 LLM 응답 캐시를 검증한다.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.utils.disk_cache import DiskCache
+
+
+class TestDiskCache:
+    def test_json_round_trip_and_stats(self, tmp_path):
+        cache = DiskCache(str(tmp_path / "c.sqlite3"))
+        assert cache.get_json("k") is None
+
+        cache.set_json("k", {"content": "요약"})
+
+        assert cache.get_json("k") == {"content": "요약"}
+        assert cache.stats()["hit_rate"] == 0.5
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        cache = DiskCache(str(tmp_path / "c.sqlite3"), ttl_seconds=60)
+        cache.set("k", b"v")
+        with patch("app.utils.disk_cache.time.time", return_value=10**12):
+            assert cache.get("k") is None
+        assert cache.stats()["expired"] == 1
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = DiskCache(str(tmp_path / "c.sqlite3"), max_entries=2)
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+        with patch("app.utils.disk_cache.time.time", return_value=10**10):
+            cache.get("a")
+            cache.set("c", b"3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1"
+        assert cache.stats()["evictions"] == 1
+
+    def test_shared_between_instances(self, tmp_path):
+        DiskCache(str(tmp_path / "c.sqlite3")).set("k", b"v")
+        assert DiskCache(str(tmp_path / "c.sqlite3")).get("k") == b"v"
+
+
+def _completion(content, finish_reason="stop"):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content), finish_reason=finish_reason)]
+    )
+
+
+class TestLLMResponseCache:
+    @pytest.fixture
+    def ai_service(self, tmp_path):
+        from app.services.ai_service import AIService
+
+        cache = DiskCache(str(tmp_path / "llm.sqlite3"))
+        with patch("app.services.ai_service.get_llm_response_cache", return_value=cache):
+            service = AIService()
+            service._request_completion = AsyncMock(return_value=_completion('{"summary": "요약"}'))
+            yield service
+
+    async def test_identical_prompt_is_served_from_cache(self, ai_service):
+        first = await ai_service._chat_json("sys", "user", max_tokens=100, temperature=0.2)
+        second = await ai_service._chat_json("sys", "user", max_tokens=100, temperature=0.2)
+
+        assert first == second == {"summary": "요약"}
+        ai_service._request_completion.assert_awaited_once()
+
+    async def test_params_are_part_of_the_key(self, ai_service):
+        await ai_service._chat_json("sys", "user", max_tokens=100, temperature=0.2)
+        await ai_service._chat_json("sys", "user", max_tokens=100, temperature=0.7)
+        assert ai_service._request_completion.await_count == 2
+
+    async def test_use_cache_false_always_calls_llm(self, ai_service):
+        for _ in range(2):
+            await ai_service._chat_completion("sys", "user", 100, 0.2, use_cache=False)
+        assert ai_service._request_completion.await_count == 2
+
+    async def test_cache_hit_does_not_query_store_stats(self, ai_service):
+        await ai_service._chat_json("sys", "user", max_tokens=100, temperature=0.2)
+        # 적중 로그는 메모리 카운터만 쓴다 (이벤트 루프에서 COUNT(*)를 돌리지 않는다)
+        with patch.object(DiskCache, "stats", side_effect=AssertionError("stats() on hot path")):
+            assert await ai_service._chat_json("sys", "user", max_tokens=100, temperature=0.2) == {"summary": "요약"}
+
+    async def test_truncated_completion_is_not_cached(self, ai_service):
+        ai_service._request_completion.return_value = _completion('{"summary": "요약"}', finish_reason="length")
+        for _ in range(2):
+            await ai_service._chat_completion("sys", "user", 100, 0.2, force_json=True)
+        assert ai_service._request_completion.await_count == 2
+
+    async def test_locally_repaired_json_is_not_cached(self, ai_service):
+        ai_service._request_completion.return_value = _completion('{"summary": "잘린 요약", "tags": ["a"')
+        for _ in range(2):
+            assert (await ai_service._chat_json("sys", "user", max_tokens=100, temperature=0.2))["summary"] == "잘린 요약"
+        assert ai_service._request_completion.await_count == 2
@@ -0,0 +1,69 @@
+"""
+test_embedding_batcher.py
+
+EmbeddingBatcher 의 요청 묶음 처리, 순서 보존, 예외 전파와 히스토그램을 검증한다.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.services.embedding_batcher import EmbeddingBatcher, _bucket_label
+
+
+def _make_batcher(encode_batch, max_batch_size: int = 32, max_wait_ms: float = 5.0) -> EmbeddingBatcher:
+    return EmbeddingBatcher(
+        encode_batch=encode_batch,
+        executor=ThreadPoolExecutor(max_workers=1),
+        max_batch_size=max_batch_size,
+        max_wait_ms=max_wait_ms,
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_batch():
+    calls = []
+
+    def encode_batch(texts):
+        calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+    batcher = _make_batcher(encode_batch)
+    results = await asyncio.gather(*(batcher.submit(text) for text in ["a", "bb", "ccc"]))
+
+    assert calls == [["a", "bb", "ccc"]]
+    assert results == [[1.0], [2.0], [3.0]]
+    stats = batcher.stats()
+    assert stats["batches"] == 1
+    assert stats["batch_size_histogram"] == {"3-4": 1}
+    assert stats["queue_depth_histogram"] == {"1": 1, "2": 1, "3-4": 1}
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_without_waiting():
+    calls = []
+
+    def encode_batch(texts):
+        calls.append(len(texts))
+        return [[0.0] for _ in texts]
+
+    batcher = _make_batcher(encode_batch, max_batch_size=2, max_wait_ms=10_000)
+    await asyncio.wait_for(asyncio.gather(batcher.submit("a"), batcher.submit("b")), timeout=1)
+
+    assert calls == [2]
+
+
+@pytest.mark.asyncio
+async def test_encode_error_reaches_every_caller():
+    def encode_batch(texts):
+        raise RuntimeError("boom")
+
+    batcher = _make_batcher(encode_batch)
+    results = await asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_bucket_labels():
+    assert [_bucket_label(n) for n in (1, 2, 3, 8, 9, 200)] == ["1", "2", "3-4", "5-8", "9-16", ">128"]
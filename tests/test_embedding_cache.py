@@ -0,0 +1,127 @@
+"""
+test_embedding_cache.py
+
+EmbeddingCache 의 디스크 저장, LRU 퇴출, 통계와
+EmbeddingService 의 캐시 우선 조회를 검증한다.
+"""
+
+import sqlite3
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from app.services.embedding_cache import EmbeddingCache
+
+
+def _make_cache(tmp_path, max_entries: int = 8, model_name: str = "test-model") -> EmbeddingCache:
+    return EmbeddingCache(
+        cache_dir=str(tmp_path),
+        model_name=model_name,
+        dimension=4,
+        max_entries=max_entries,
+    )
+
+
+class TestEmbeddingCache:
+    def test_miss_then_hit(self, tmp_path):
+        cache = _make_cache(tmp_path)
+        assert cache.get_many(["안녕"]) == [None]
+
+        cache.put_many(["안녕"], [[0.1, 0.2, 0.3, 0.4]])
+        cached = cache.get_many(["안녕"])[0]
+
+        assert cached == pytest.approx([0.1, 0.2, 0.3, 0.4])
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_survives_reopen(self, tmp_path):
+        cache = _make_cache(tmp_path)
+        cache.put_many(["persist"], [[1.0, 2.0, 3.0, 4.0]])
+
+        reopened = _make_cache(tmp_path)
+        assert reopened.get_many(["persist"])[0] == pytest.approx([1.0, 2.0, 3.0, 4.0])
+
+    def test_model_name_isolates_entries(self, tmp_path):
+        _make_cache(tmp_path, model_name="model-a").put_many(["text"], [[1.0] * 4])
+        other = _make_cache(tmp_path, model_name="model-b")
+        assert other.get_many(["text"]) == [None]
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = _make_cache(tmp_path, max_entries=2)
+        cache.put_many(["a"], [[1.0] * 4])
+        cache.put_many(["b"], [[2.0] * 4])
+        cache.get_many(["a"])  # a 를 최근 사용으로 갱신
+        cache.put_many(["c"], [[3.0] * 4])
+
+        assert cache.get_many(["b"]) == [None]
+        assert cache.get_many(["a"])[0] == pytest.approx([1.0] * 4)
+        assert cache.get_many(["c"])[0] == pytest.approx([3.0] * 4)
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["size"] == 2
+
+    def test_capacity_change_resets_store(self, tmp_path):
+        _make_cache(tmp_path, max_entries=2).put_many(["a"], [[1.0] * 4])
+        resized = _make_cache(tmp_path, max_entries=4)
+        assert resized.get_many(["a"]) == [None]
+
+    def test_failed_commit_leaves_evicted_slot_untouched(self, tmp_path):
+        cache = _make_cache(tmp_path, max_entries=1)
+        cache.put_many(["old"], [[1.0] * 4])
+
+        class _FailingCommit:
+            def __init__(self, conn):
+                self._conn = conn
+
+            def commit(self):
+                raise sqlite3.OperationalError("disk I/O error")
+
+            def __getattr__(self, name):
+                return getattr(self._conn, name)
+
+        real_conn = cache._conn
+        cache._conn = _FailingCommit(real_conn)
+        with pytest.raises(sqlite3.OperationalError):
+            cache.put_many(["new"], [[2.0] * 4])
+        cache._conn = real_conn
+
+        # 롤백된 old 행이 new 벡터를 가리키지 않는다
+        assert cache.get_many(["old"])[0] == pytest.approx([1.0] * 4)
+        assert cache.get_many(["new"]) == [None]
+
+    def test_slot_overwritten_by_another_process_is_a_miss(self, tmp_path):
+        cache = _make_cache(tmp_path)
+        cache.put_many(["a"], [[1.0] * 4])
+
+        # 다른 프로세스가 인덱스 조회와 읽기 사이에 슬롯을 재사용한 상황
+        other = _make_cache(tmp_path)
+        other._vectors[0] = np.full(4, 7.0, dtype=np.float32)
+
+        assert cache.get_many(["a"]) == [None]
+
+    def test_skips_wrong_dimension(self, tmp_path):
+        cache = _make_cache(tmp_path)
+        cache.put_many(["bad"], [[1.0, 2.0]])
+        assert cache.get_many(["bad"]) == [None]
+
+
+class TestEmbeddingServiceCache:
+    def test_batch_encodes_only_missing_texts(self, tmp_path):
+        from app.services.embedding_service import EmbeddingService
+
+        service = EmbeddingService(model_name="test-model")
+        service._dimension = 4
+        service.cache = _make_cache(tmp_path)
+        service.cache.put_many(["cached text"], [[9.0] * 4])
+        service._model = MagicMock()
+        service._model.encode.side_effect = lambda texts, batch_size: np.ones((len(texts), 4))
+
+        result = service.generate_batch_embeddings(["cached text", "new text"])
+
+        service._model.encode.assert_called_once()
+        assert service._model.encode.call_args.args[0] == ["new text"]
+        assert result[0] == pytest.approx([9.0] * 4)
+        assert result[1] == pytest.approx([1.0] * 4)
+        assert service.cache.get_many(["new text"])[0] == pytest.approx([1.0] * 4)
@@ -0,0 +1,79 @@
+"""
+test_embedding_server.py
+
+임베딩 서버 엔드포인트와 remote 모드 클라이언트를 검증한다.
+"""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import numpy as np
+from fastapi.testclient import TestClient
+
+
+def test_embed_endpoint_batches_multiple_texts():
+    from app import embedding_server
+
+    service = embedding_server.service
+    service._dimension = 2
+    with patch.object(service, "agenerate_batch_embeddings", AsyncMock(return_value=[[0.1, 0.2], [0.3, 0.4]])):
+        response = TestClient(embedding_server.app).post("/embed", json={"texts": ["a", "b"]})
+
+    assert response.status_code == 200
+    assert response.json()["embeddings"] == [[0.1, 0.2], [0.3, 0.4]]
+    assert response.json()["dimension"] == 2
+
+
+def test_single_text_goes_through_batcher():
+    from app import embedding_server
+
+    service = embedding_server.service
+    service._dimension = 2
+    with patch.object(service, "agenerate_embedding", AsyncMock(return_value=[0.5, 0.5])) as single:
+        response = TestClient(embedding_server.app).post("/embed", json={"texts": ["query"]})
+
+    single.assert_awaited_once_with("query")
+    assert response.json()["embeddings"] == [[0.5, 0.5]]
+
+
+def _mock_server(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/health":
+        return httpx.Response(200, json={"model": "m", "dimension": 2})
+    texts = json.loads(request.content)["texts"]
+    return httpx.Response(200, json={"embeddings": [[float(len(t)), 1.0] for t in texts]})
+
+
+class TestRemoteEmbeddingEncoder:
+    def test_encode_matches_local_interface(self):
+        from app.services.embedding_client import RemoteEmbeddingEncoder
+
+        encoder = RemoteEmbeddingEncoder("http://embedding", model_name="m", transport=httpx.MockTransport(_mock_server))
+
+        assert encoder.get_sentence_embedding_dimension() == 2
+        assert encoder.encode(["ab", "c"]).tolist() == [[2.0, 1.0], [1.0, 1.0]]
+        assert encoder.encode("abc").tolist() == [3.0, 1.0]
+
+    def test_remote_mode_skips_local_cache(self):
+        from app.services.embedding_service import EmbeddingService
+
+        service = EmbeddingService(model_name="m", mode="remote")
+        assert service.mode == "remote"
+        with patch("app.services.embedding_service.settings.EMBEDDING_CACHE_ENABLED", True):
+            assert service._build_cache() is None
+
+    def test_server_error_falls_back_to_zero_vector(self):
+        from app.services.embedding_client import RemoteEmbeddingEncoder
+        from app.services.embedding_service import EmbeddingService
+
+        def failing(request):
+            if request.url.path == "/health":
+                return httpx.Response(200, json={"model": "m", "dimension": 2})
+            return httpx.Response(503)
+
+        service = EmbeddingService(model_name="m", mode="remote")
+        service._model = RemoteEmbeddingEncoder("http://embedding", transport=httpx.MockTransport(failing))
+        service._dimension = 2
+
+        assert service.generate_embedding("query") == [0.0, 0.0]
+        assert np.allclose(service.generate_batch_embeddings(["a", "b"]), 0.0)
@@ -0,0 +1,77 @@
+"""
+test_embedding_service.py
+
+EmbeddingService 의 지연 로드, prefork 사전 로드/fork 후 재설정과
+백엔드별 캐시 네임스페이스를 검증한다.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+
+class TestEmbeddingServiceLazyLoad:
+    def test_model_is_not_loaded_on_construction(self):
+        from app.services.embedding_service import EmbeddingService
+
+        service = EmbeddingService(model_name="lazy-model")
+        assert service.is_loaded is False
+        assert service.cache is None
+
+    def test_dimension_comes_from_loaded_model(self):
+        from app.services.embedding_service import EmbeddingService
+
+        service = EmbeddingService(model_name="lazy-model")
+        assert service.dimension == 768
+        assert service.is_loaded is True
+
+    def test_preload_loads_weights_without_opening_disk_cache(self, tmp_path):
+        from app.services.embedding_service import EmbeddingService
+
+        service = EmbeddingService(model_name="lazy-model")
+        with (
+            patch("app.services.embedding_service.settings.EMBEDDING_CACHE_ENABLED", True),
+            patch("app.services.embedding_service.settings.EMBEDDING_CACHE_DIR", str(tmp_path)),
+        ):
+            assert service.preload_weights() is True
+            assert service.is_loaded is True
+            assert service.cache is None
+            assert list(tmp_path.iterdir()) == []
+
+            # fork된 자식에서는 첫 사용 시 자기 캐시를 연다
+            service.reset_after_fork()
+            service._model.encode.side_effect = lambda texts, batch_size: np.ones((len(texts), 768))
+            service.generate_batch_embeddings(["child text"])
+            assert service.cache is not None
+            assert service.cache.get_many(["child text"])[0] == pytest.approx([1.0] * 768)
+
+    def test_remote_mode_preload_and_reset_leave_no_client(self):
+        from app.services.embedding_service import EmbeddingService
+
+        service = EmbeddingService(model_name="lazy-model", mode="remote")
+        with patch("app.services.embedding_client.RemoteEmbeddingEncoder") as encoder_cls:
+            assert service.preload_weights() is False
+            encoder_cls.assert_not_called()
+
+        service._model = MagicMock()
+        service.reset_after_fork()
+        assert service.is_loaded is False
+
+    def test_empty_text_does_not_load_model(self):
+        from app.services.embedding_service import EmbeddingService
+
+        service = EmbeddingService(model_name="lazy-model")
+        assert service.generate_embedding("   ") == [0.0] * 768
+        assert service.is_loaded is False
+
+
+class TestEmbeddingBackend:
+    def test_backend_namespaces_cache_keys(self, monkeypatch):
+        from app.core.config import settings
+        from app.services.embedding_service import EmbeddingService
+
+        service = EmbeddingService(model_name="m")
+        assert service.cache_namespace == "m"
+        monkeypatch.setattr(settings, "EMBEDDING_BACKEND", "onnx-int8")
+        assert service.cache_namespace == "m@onnx-int8"
@@ -0,0 +1,114 @@
+"""
+test_html_extraction.py
+
+lxml 단일 순회 추출기가 저장된 HTML fixture에서 BeautifulSoup(html.parser) 경로와
+같은 결과 dict를 만드는지, 밀도 기반 본문 선택이 본문만 남기는지 검증한다.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from app.core.config import settings
+from app.services.scraper_service import ScraperService
+from app.utils.html_extraction import extract_html_page
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "html"
+FIXTURES = sorted(FIXTURE_DIR.glob("*.html"))
+EXPECTATIONS = json.loads((FIXTURE_DIR / "expectations.json").read_text(encoding="utf-8"))
+PAGE_URL = "https://news.example.com/article/2025/10/001"
+
+
+def _parse(engine: str, html: bytes, monkeypatch, extractor: str = "density") -> dict:
+    monkeypatch.setattr(settings, "SCRAPER_HTML_ENGINE", engine)
+    monkeypatch.setattr(settings, "SCRAPER_CONTENT_EXTRACTOR", extractor)
+    return ScraperService(http_cache=None)._parse_html_page(html, PAGE_URL)
+
+
+@pytest.mark.parametrize("extractor", ["density", "keywords"])
+@pytest.mark.parametrize("fixture", FIXTURES, ids=[path.stem for path in FIXTURES])
+def test_lxml_engine_matches_bs4_output(fixture, extractor, monkeypatch):
+    html = fixture.read_bytes()
+
+    assert _parse("lxml", html, monkeypatch, extractor) == _parse("bs4", html, monkeypatch, extractor)
+
+
+@pytest.mark.parametrize("fixture", FIXTURES, ids=[path.stem for path in FIXTURES])
+def test_density_extractor_keeps_article_and_drops_noise(fixture):
+    expected = EXPECTATIONS[fixture.name]
+    content = extract_html_page(fixture.read_bytes(), PAGE_URL)["content"]
+
+    assert [phrase for phrase in expected["include"] if phrase not in content] == []
+    assert [phrase for phrase in expected["exclude"] if phrase in content] == []
+
+
+def test_density_extractor_is_shorter_than_keyword_divs_on_portal_pages():
+    html = (FIXTURE_DIR / "portal_news.html").read_bytes()
+
+    density = extract_html_page(html, PAGE_URL, content_extractor="density")["content"]
+    keywords = extract_html_page(html, PAGE_URL, content_extractor="keywords")["content"]
+
+    # 키워드 div 방식은 중첩 div를 중복으로 이어 붙이고 관련 기사 목록까지 가져온다
+    assert "리튬 가격 급락" in keywords
+    assert len(density) < len(keywords) / 2
+
+
+def test_every_fixture_has_expectations():
+    assert len(FIXTURES) >= 5
+    assert {path.name for path in FIXTURES} == set(EXPECTATIONS)
+
+
+def test_inline_links_stay_in_paragraph_text():
+    from app.utils.content_density import DensityScorer
+
+    scorer = DensityScorer()
+    scorer.start("body")
+    scorer.start("div", "entry-content")
+    for sentence in ("첫 문단은 충분히 길어서 본문 문단으로 점수를 받는다, 쉼표도 있다.", "둘째 문단도 길게 쓴다, 그리고"):
+        scorer.start("p")
+        scorer.text(sentence)
+        scorer.start("a")
+        scorer.text("링크")
+        scorer.end()
+        scorer.end()
+    scorer.start("ul", "related-list")
+    for title in ("관련 글 하나", "관련 글 둘"):
+        scorer.start("li")
+        scorer.start("a")
+        scorer.text(title)
+        scorer.end()
+        scorer.end()
+    scorer.end()
+    scorer.end()
+    scorer.end()
+
+    text = scorer.best_text()
+    assert text.count("링크") == 2
+    assert "관련 글" not in text
+
+
+def test_boilerplate_is_excluded_and_json_ld_is_read():
+    page = extract_html_page((FIXTURE_DIR / "news_article.html").read_bytes(), PAGE_URL)
+
+    assert page["title"] == "반도체 수출, 석 달 연속 증가세"
+    assert "고대역폭 메모리" in page["content"]
+    assert "많이 본 뉴스" not in page["content"]
+    assert "loadAds" not in page["content"]
+
+    # og:image가 없는 페이지는 <script> 안의 JSON-LD 이미지를 쓴다
+    no_og = extract_html_page((FIXTURE_DIR / "paragraphs_only.html").read_bytes(), PAGE_URL)
+    assert no_og["thumbnail_url"] == "https://news.example.com/images/library-hall.jpg"
+
+
+def test_declared_legacy_charset_is_decoded():
+    page = extract_html_page((FIXTURE_DIR / "euc_kr_local_news.html").read_bytes(), PAGE_URL)
+
+    assert page["title"] == "지역 소식 - 시민일보"
+    assert "가을 축제" in page["content"]
+
+
+def test_document_without_body_tag_skips_body_fallback():
+    page = extract_html_page(b"plain text " * 20, PAGE_URL)
+
+    assert page["content"] == "내용을 추출할 수 없습니다."
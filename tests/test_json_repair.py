@@ -0,0 +1,68 @@
+"""
+test_json_repair.py
+
+repair_json 의 로컬 복구 규칙과 AIService._chat_json 의 복구 단계 순서를 검증한다.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.utils.json_repair import repair_json
+
+
+class TestRepairJson:
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ('```json\n{"summary": "a", "tags": ["x", "y",],}\n```', {"summary": "a", "tags": ["x", "y"]}),
+            ("{'summary': 'it\\'s', 'ok': True, 'v': None}", {"summary": "it's", "ok": True, "v": None}),
+            ('{"summary": "abc", "tags": ["a", "b', {"summary": "abc", "tags": ["a", "b"]}),
+            ('{"summary": "abc", "key_points": ["a"], "ke', {"summary": "abc", "key_points": ["a"]}),
+            ('{"summary": "abc", "insight":', {"summary": "abc"}),
+            ('설명입니다. {"summary": "줄\n바꿈"} 끝.', {"summary": "줄\n바꿈"}),
+            ('{"a": {"b": [1, 2, {"c": 3', {"a": {"b": [1, 2, {"c": 3}]}}),
+            ('{"summary": "Trueman None"}', {"summary": "Trueman None"}),
+        ],
+    )
+    def test_repairs_common_llm_breakage(self, raw, expected):
+        assert repair_json(raw) == expected
+
+    def test_without_json_value_raises(self):
+        with pytest.raises(json.JSONDecodeError):
+            repair_json("요약을 만들 수 없습니다")
+
+
+def _completion(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class TestChatJsonRepairTiers:
+    async def test_local_repair_skips_llm_round_trip(self):
+        from app.services.ai_service import JSON_PARSE_STATS, AIService
+
+        service = AIService()
+        service._chat_completion = AsyncMock(return_value=_completion('{"summary": "요약", "tags": ["a",]'))
+        service._repair_json_with_llm = AsyncMock()
+        before = JSON_PARSE_STATS["local_repair"]
+
+        result = await service._chat_json("sys", "user", max_tokens=100, temperature=0.2)
+
+        assert result == {"summary": "요약", "tags": ["a"]}
+        service._repair_json_with_llm.assert_not_awaited()
+        assert JSON_PARSE_STATS["local_repair"] == before + 1
+
+    async def test_falls_back_to_llm_when_local_repair_fails(self):
+        from app.services.ai_service import JSON_PARSE_STATS, AIService
+
+        service = AIService()
+        service._chat_completion = AsyncMock(return_value=_completion("JSON 없이 설명만 있는 응답"))
+        service._repair_json_with_llm = AsyncMock(return_value='{"summary": "복구"}')
+        before = JSON_PARSE_STATS["llm_repair"]
+
+        result = await service._chat_json("sys", "user", max_tokens=100, temperature=0.2)
+
+        assert result == {"summary": "복구"}
+        assert JSON_PARSE_STATS["llm_repair"] == before + 1
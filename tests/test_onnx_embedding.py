@@ -0,0 +1,90 @@
+"""
+test_onnx_embedding.py
+
+ONNX Runtime 인코더의 mean pooling / encode 형태와
+첫 사용 export·양자화의 원자성을 검증한다.
+"""
+
+import json
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+
+class TestOnnxSentenceEncoder:
+    def test_mean_pool_ignores_padding(self):
+        from app.services.onnx_embedding import mean_pool
+
+        hidden = np.array([[[1.0, 1.0], [3.0, 3.0], [100.0, 100.0]]], dtype=np.float32)
+        mask = np.array([[1, 1, 0]])
+
+        assert mean_pool(hidden, mask)[0] == pytest.approx([2.0, 2.0])
+
+    def test_encode_matches_sentence_transformer_shape(self):
+        from app.services.onnx_embedding import OnnxSentenceEncoder
+
+        session = MagicMock()
+        session.get_inputs.return_value = [SimpleNamespace(name="input_ids"), SimpleNamespace(name="attention_mask")]
+        session.run.side_effect = lambda _, feeds: [
+            np.ones((*feeds["input_ids"].shape, 4), dtype=np.float32)
+        ]
+        tokenizer = MagicMock(
+            side_effect=lambda texts, **_: {
+                "input_ids": np.ones((len(texts), 3)),
+                "attention_mask": np.ones((len(texts), 3)),
+                "token_type_ids": np.zeros((len(texts), 3)),
+            }
+        )
+        encoder = OnnxSentenceEncoder(session, tokenizer, max_seq_length=128, dimension=4, normalize=True)
+
+        batch = encoder.encode(["a", "b", "c"], batch_size=2)
+        single = encoder.encode("a")
+
+        assert batch.shape == (3, 4)
+        assert single.shape == (4,)
+        assert np.linalg.norm(single) == pytest.approx(1.0)
+        assert session.run.call_count == 3
+        assert "token_type_ids" not in session.run.call_args.args[1]
+
+    def test_failed_quantization_leaves_no_partial_model(self, tmp_path):
+        from app.services.onnx_embedding import quantize_onnx_model
+
+        def half_written(source, target, weight_type):
+            with open(target, "wb") as handle:
+                handle.write(b"partial")
+            raise RuntimeError("killed mid-write")
+
+        quantization = MagicMock(quantize_dynamic=half_written)
+        target = tmp_path / "model.int8.onnx"
+        modules = {"onnxruntime": MagicMock(quantization=quantization), "onnxruntime.quantization": quantization}
+        with patch.dict(sys.modules, modules):
+            with pytest.raises(RuntimeError):
+                quantize_onnx_model(tmp_path / "model.onnx", target)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_from_pretrained_exports_once_and_reuses_finished_export(self, tmp_path):
+        from app.services import onnx_embedding
+
+        def fake_export(model_name, output_dir):
+            output_dir.mkdir(parents=True, exist_ok=True)
+            (output_dir / onnx_embedding.ONNX_MODEL_FILE).write_bytes(b"onnx")
+            (output_dir / onnx_embedding.ENCODER_CONFIG_FILE).write_text(
+                json.dumps({"max_seq_length": 128, "dimension": 4})
+            )
+
+        session = MagicMock()
+        session.get_inputs.return_value = []
+        runtime = MagicMock(InferenceSession=MagicMock(return_value=session))
+        with (
+            patch.dict(sys.modules, {"onnxruntime": runtime, "transformers": MagicMock()}),
+            patch.object(onnx_embedding, "export_onnx_model", side_effect=fake_export) as export,
+        ):
+            onnx_embedding.OnnxSentenceEncoder.from_pretrained("org/model", cache_dir=str(tmp_path))
+            encoder = onnx_embedding.OnnxSentenceEncoder.from_pretrained("org/model", cache_dir=str(tmp_path))
+
+        export.assert_called_once()
+        assert encoder.dimension == 4
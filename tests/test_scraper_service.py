@@ -0,0 +1,282 @@
+"""
+test_scraper_service.py
+
+스크래퍼의 비동기 fetch 계층(공유 커넥션 풀, 호스트별 동시성 제한, 오류 매핑)을 검증한다.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+
+from app.services.scraper_service import ScraperService
+
+ARTICLE_HTML = """
+<html><head><title>테스트 기사</title>
+<meta property="og:image" content="/images/cover.jpg"></head>
+<body><article>{body}</article></body></html>
+""".format(body="본문 문장입니다. " * 40)
+
+
+def _transport(handler) -> httpx.MockTransport:
+    return httpx.MockTransport(handler)
+
+
+async def test_extract_content_parses_html_via_async_client():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, text=ARTICLE_HTML, headers={"content-type": "text/html; charset=utf-8"})
+
+    scraper = ScraperService(transport=_transport(handler))
+    result = await scraper.extract_content("https://example.com/news/1")
+    await scraper.aclose()
+
+    assert result["success"] is True
+    assert result["title"] == "테스트 기사"
+    assert result["thumbnail_url"] == "https://example.com/images/cover.jpg"
+    assert "본문 문장입니다." in result["content"]
+    assert "Mozilla" in seen[0].headers["user-agent"]
+
+
+async def test_client_is_shared_across_requests_on_same_loop():
+    scraper = ScraperService(transport=_transport(lambda request: httpx.Response(200, text=ARTICLE_HTML)))
+
+    await scraper._get("https://example.com/a")
+    first = scraper._client
+    await scraper._get("https://example.org/b")
+
+    assert scraper._client is first
+    await scraper.aclose()
+    assert scraper._client is None
+
+
+async def test_per_host_concurrency_is_capped(monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "SCRAPER_MAX_CONNECTIONS_PER_HOST", 2)
+    active = {"now": 0, "peak": 0}
+
+    class SlowTransport(httpx.AsyncBaseTransport):
+        async def handle_async_request(self, request):
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+            return httpx.Response(200, text="ok")
+
+    scraper = ScraperService(transport=SlowTransport())
+    await asyncio.gather(*(scraper._get(f"https://example.com/{i}") for i in range(6)))
+    await scraper.aclose()
+
+    assert active["peak"] == 2
+
+
+async def test_http_status_error_maps_to_existing_message():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(451, text="blocked")
+
+    scraper = ScraperService(transport=_transport(handler))
+    result = await scraper.extract_content("https://example.com/blocked")
+    await scraper.aclose()
+
+    assert result["success"] is False
+    assert "451" in result["error"]
+
+
+async def test_network_error_maps_to_network_message():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectTimeout("timed out", request=request)
+
+    scraper = ScraperService(transport=_transport(handler))
+    result = await scraper.extract_content("https://example.com/slow")
+    await scraper.aclose()
+
+    assert result["success"] is False
+    assert result["error"].startswith("네트워크 오류")
+
+
+class TestConditionalGetCache:
+    @staticmethod
+    def _scraper(tmp_path, handler):
+        from app.utils.http_cache import HttpCache
+
+        cache = HttpCache(str(tmp_path / "pages.sqlite3"))
+        return ScraperService(transport=_transport(handler), http_cache=cache), cache
+
+    async def test_304_reuses_stored_parse_without_reparsing(self, tmp_path):
+        requests_seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests_seen.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"etag": '"v1"'})
+            return httpx.Response(200, text=ARTICLE_HTML, headers={"etag": '"v1"', "cache-control": "no-cache"})
+
+        scraper, cache = self._scraper(tmp_path, handler)
+        first = await scraper.extract_content("https://example.com/news/1")
+        with patch.object(scraper, "_parse_html_page", side_effect=AssertionError("parsed again")):
+            second = await scraper.extract_content("https://example.com/news/1")
+        await scraper.aclose()
+
+        assert second == first
+        assert requests_seen[1].headers["if-none-match"] == '"v1"'
+        stats = cache.stats()
+        assert (stats["misses"], stats["revalidated"], stats["hits"]) == (1, 1, 0)
+
+    async def test_fresh_entry_skips_network(self, tmp_path):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(
+                200,
+                text=ARTICLE_HTML,
+                headers={"cache-control": "max-age=600", "last-modified": "Wed, 01 Oct 2025 00:00:00 GMT"},
+            )
+
+        scraper, cache = self._scraper(tmp_path, handler)
+        await scraper.extract_content("https://example.com/news/2")
+        result = await scraper.extract_content("https://example.com/news/2")
+        await scraper.aclose()
+
+        assert result["success"] is True
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+
+    async def test_no_store_response_is_not_cached(self, tmp_path):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, text=ARTICLE_HTML, headers={"etag": '"x"', "cache-control": "no-store"})
+
+        scraper, cache = self._scraper(tmp_path, handler)
+        await scraper.extract_content("https://example.com/private")
+        await scraper.extract_content("https://example.com/private")
+        await scraper.aclose()
+
+        assert "if-none-match" not in calls[1].headers
+        assert cache.stats()["uncacheable"] == 2
+
+    async def test_parser_version_change_reparses_cached_body(self, tmp_path, monkeypatch):
+        from app.services import scraper_service
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=ARTICLE_HTML, headers={"cache-control": "max-age=600"})
+
+        scraper, cache = self._scraper(tmp_path, handler)
+        await scraper.extract_content("https://example.com/news/3")
+        monkeypatch.setattr(scraper_service, "HTML_PARSER_VERSION", scraper_service.HTML_PARSER_VERSION + 1)
+        result = await scraper.extract_content("https://example.com/news/3")
+        await scraper.aclose()
+
+        assert result["title"] == "테스트 기사"
+        entry = cache.lookup("https://example.com/news/3")
+        assert entry.parsed["parser_version"] == scraper_service.HTML_PARSER_VERSION
+
+    async def test_cache_write_failures_do_not_fail_the_scrape(self, tmp_path, monkeypatch):
+        import sqlite3
+
+        from app.services import scraper_service
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"etag": '"v1"'})
+            return httpx.Response(200, text=ARTICLE_HTML, headers={"etag": '"v1"', "cache-control": "no-cache"})
+
+        scraper, cache = self._scraper(tmp_path, handler)
+        first = await scraper.extract_content("https://example.com/news/4")
+        locked = sqlite3.OperationalError("database is locked")
+        monkeypatch.setattr(scraper_service, "HTML_PARSER_VERSION", scraper_service.HTML_PARSER_VERSION + 1)
+        with (
+            patch.object(cache, "refresh", side_effect=locked),
+            patch.object(cache, "update_parsed", side_effect=locked),
+        ):
+            second = await scraper.extract_content("https://example.com/news/4")
+        await scraper.aclose()
+
+        assert second["success"] is True
+        assert second["title"] == first["title"]
+
+
+def test_freshness_lifetime_prefers_s_maxage_and_honors_no_cache():
+    from app.utils.http_cache import freshness_lifetime
+
+    assert freshness_lifetime({"cache-control": "max-age=60, s-maxage=120"}) == 120
+    assert freshness_lifetime({"cache-control": "no-cache, max-age=60"}) == 0
+    assert freshness_lifetime({}) == 0
+
+
+READER_TEXT = "리더가 가져온 본문입니다. " * 20
+
+
+class TestHedgedExtraction:
+    @staticmethod
+    def _scraper(monkeypatch, html_delay: float, reader_first=()):
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "SCRAPER_HEDGE_ENABLED", True)
+        monkeypatch.setattr(settings, "SCRAPER_HEDGE_DELAY_SECONDS", 0.05)
+        monkeypatch.setattr(settings, "SCRAPER_READER_FIRST_DOMAINS", list(reader_first))
+        calls = {"html": 0, "reader": 0, "html_cancelled": False}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "r.jina.ai":
+                calls["reader"] += 1
+                return httpx.Response(200, text=READER_TEXT)
+            calls["html"] += 1
+            try:
+                await asyncio.sleep(html_delay)
+            except asyncio.CancelledError:
+                calls["html_cancelled"] = True
+                raise
+            return httpx.Response(200, text=ARTICLE_HTML)
+
+        return ScraperService(transport=_transport(handler)), calls
+
+    async def test_fast_html_wins_without_starting_reader(self, monkeypatch):
+        scraper, calls = self._scraper(monkeypatch, html_delay=0)
+        result = await scraper.extract_content("https://example.com/fast")
+        await scraper.aclose()
+
+        assert result["title"] == "테스트 기사"
+        assert calls["reader"] == 0
+        assert scraper.route_stats.domain_stats("https://example.com/x")["html"] == 1
+
+    async def test_slow_html_loses_to_reader_and_is_cancelled(self, monkeypatch):
+        scraper, calls = self._scraper(monkeypatch, html_delay=5)
+        started = asyncio.get_running_loop().time()
+        result = await scraper.extract_content("https://example.com/slow")
+        elapsed = asyncio.get_running_loop().time() - started
+        await scraper.aclose()
+
+        assert "리더가 가져온 본문입니다." in result["content"]
+        assert calls["html_cancelled"] is True
+        # 느린 페이지를 썸네일 때문에 다시 받지 않는다
+        assert calls["html"] == 1
+        assert elapsed < 1
+        assert scraper.route_stats.totals["reader"] == 1
+        assert scraper.route_stats.domain_stats("https://example.com/x")["slow_html"] == 1
+
+    async def test_reader_first_domain_starts_reader_immediately(self, monkeypatch):
+        scraper, calls = self._scraper(monkeypatch, html_delay=5, reader_first=["example.com"])
+        with patch.object(scraper, "_fetch_og_thumbnail_only", return_value=None):
+            started = asyncio.get_running_loop().time()
+            await scraper.extract_content("https://news.example.com/a")
+            elapsed = asyncio.get_running_loop().time() - started
+        await scraper.aclose()
+
+        assert calls["reader"] == 1
+        assert elapsed < 0.05
+
+
+def test_route_stats_learn_reader_preference():
+    from app.services.scrape_routing import ScrapeRouteStats
+
+    stats = ScrapeRouteStats(min_samples=3, reader_win_ratio=0.6)
+    for route in ("reader", "none", "reader", "html"):
+        stats.record("https://www.blocked.example/a", route)
+    assert stats.prefers_reader("https://blocked.example/b") is True
+    assert stats.reader_delay("https://other.example/", 2.5) == 2.5
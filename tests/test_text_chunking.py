@@ -4,9 +4,18 @@ test_text_chunking.py
 text_chunking.py 의 순수 함수들을 단위 테스트한다.
 """
 
+import re
+
 import pytest
 
-from app.utils.text_chunking import normalize_text, split_into_chunks
+from app.utils.text_chunking import (
+    ChunkSpan,
+    count_tokens,
+    iter_chunk_spans,
+    normalize_text,
+    split_into_chunks,
+    split_into_token_chunks,
+)
 
 
 # ─────────────────────────────────────────────────────────────
@@ -78,3 +87,88 @@ class TestSplitIntoChunks:
 
     def test_whitespace_only_returns_empty(self):
         assert split_into_chunks("   \n\n   ") == []
+
+
+# ─────────────────────────────────────────────────────────────
+# iter_chunk_spans
+# ─────────────────────────────────────────────────────────────
+class TestIterChunkSpans:
+    def test_spans_materialize_to_split_into_chunks(self):
+        text = normalize_text("문단A " * 40 + "\n\n" + "문단B " * 40 + "\n\n\n" + "가" * 300)
+        spans = list(iter_chunk_spans(text, chunk_size=120, overlap=20))
+        assert [span.slice(text) for span in spans] == split_into_chunks(text, chunk_size=120, overlap=20)
+
+    def test_is_lazy_generator(self):
+        spans = iter_chunk_spans(normalize_text("가나다 " * 10_000), chunk_size=100, overlap=10)
+        first = next(spans)
+        assert first == ChunkSpan(0, 99)
+
+    def test_overlap_starts_inside_previous_span(self):
+        text = normalize_text("첫번째 문단입니다.\n\n두번째 문단입니다.\n\n세번째 문단입니다.")
+        spans = list(iter_chunk_spans(text, chunk_size=20, overlap=5))
+        assert len(spans) >= 2
+        for previous, current in zip(spans, spans[1:]):
+            assert previous.start < current.start < previous.end
+
+    def test_spans_cover_every_paragraph(self):
+        text = normalize_text("이강인\n\n손흥민\n\n황희찬\n\n김민재")
+        spans = list(iter_chunk_spans(text, chunk_size=8, overlap=0))
+        combined = " ".join(span.slice(text) for span in spans)
+        for name in ["이강인", "손흥민", "황희찬", "김민재"]:
+            assert name in combined
+
+
+# ─────────────────────────────────────────────────────────────
+# split_into_token_chunks
+# ─────────────────────────────────────────────────────────────
+class _WhitespaceTokenizer:
+    """공백 단위 토큰과 offset mapping을 돌려주는 테스트용 fast tokenizer 대역"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, text, add_special_tokens=False, return_offsets_mapping=False, verbose=False):
+        self.calls += 1
+        offsets = [(m.start(), m.end()) for m in re.finditer(r"\S+", text)]
+        encoding = {"input_ids": list(range(len(offsets)))}
+        if return_offsets_mapping:
+            encoding["offset_mapping"] = offsets
+        return encoding
+
+
+class TestSplitIntoTokenChunks:
+    def test_empty_text_returns_empty_list(self):
+        assert split_into_token_chunks("", _WhitespaceTokenizer(), max_tokens=10) == []
+
+    def test_chunks_respect_budget_after_reservation(self):
+        text = " ".join(f"w{i}" for i in range(50))
+        chunks = split_into_token_chunks(text, _WhitespaceTokenizer(), max_tokens=12, overlap_tokens=0, reserved_tokens=2)
+        assert all(chunk.token_count <= 10 for chunk in chunks)
+        assert sum(chunk.token_count for chunk in chunks) == 50
+
+    def test_overlap_repeats_trailing_tokens(self):
+        text = " ".join(f"w{i}" for i in range(20))
+        chunks = split_into_token_chunks(text, _WhitespaceTokenizer(), max_tokens=10, overlap_tokens=3)
+        assert chunks[1].text.split()[:3] == chunks[0].text.split()[-3:]
+
+    def test_offsets_point_into_normalized_text(self):
+        text = "첫 문단 입니다.\n\n두번째   문단 입니다."
+        chunks = split_into_token_chunks(text, _WhitespaceTokenizer(), max_tokens=4, overlap_tokens=0)
+        normalized = normalize_text(text)
+        for chunk in chunks:
+            assert normalized[chunk.start : chunk.end] == chunk.text
+
+    def test_prefers_paragraph_boundary(self):
+        text = "a b c d e f\n\ng h i"
+        chunks = split_into_token_chunks(text, _WhitespaceTokenizer(), max_tokens=8, overlap_tokens=0)
+        assert chunks[0].text == "a b c d e f"
+        assert chunks[1].text == "g h i"
+
+    def test_tokenizes_once(self):
+        tokenizer = _WhitespaceTokenizer()
+        split_into_token_chunks("\n\n".join(["x y z"] * 30), tokenizer, max_tokens=8)
+        assert tokenizer.calls == 1
+
+    def test_count_tokens(self):
+        assert count_tokens(_WhitespaceTokenizer(), "제목 태그1 태그2") == 3
+        assert count_tokens(_WhitespaceTokenizer(), "  ") == 0
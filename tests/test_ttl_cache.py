@@ -0,0 +1,78 @@
+"""
+test_ttl_cache.py
+
+AsyncLRUCache 의 LRU/TTL 동작과 동시 요청 병합(singleflight)을 검증한다.
+"""
+
+import asyncio
+
+import pytest
+
+from app.utils.ttl_cache import AsyncLRUCache
+
+
+class TestAsyncLRUCache:
+    def test_lru_eviction(self):
+        cache = AsyncLRUCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_expired_entry_is_dropped(self):
+        cache = AsyncLRUCache(ttl_seconds=-1)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_compute(self):
+        cache = AsyncLRUCache()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return [0.5]
+
+        results = await asyncio.gather(*(cache.get_or_compute("q", compute) for _ in range(5)))
+
+        assert calls == 1
+        assert results == [[0.5]] * 5
+        stats = cache.stats()
+        assert stats["misses"] == 1
+        assert stats["coalesced"] == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_compute_is_not_cached(self):
+        cache = AsyncLRUCache()
+
+        async def failing():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await cache.get_or_compute("q", failing)
+        assert cache.get("q") is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        cache = AsyncLRUCache()
+        started = asyncio.Event()
+
+        async def compute():
+            started.set()
+            await asyncio.sleep(0.02)
+            return [0.5]
+
+        leader = asyncio.create_task(cache.get_or_compute("q", compute))
+        await started.wait()
+        follower = asyncio.create_task(cache.get_or_compute("q", compute))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == [0.5]
+        assert leader.cancelled()
+        assert cache.get("q") == [0.5]
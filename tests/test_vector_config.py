@@ -0,0 +1,146 @@
+"""
+test_vector_config.py
+
+VectorDBConfig 가 기존 컬렉션을 Settings 값에 맞춰 조정하고
+필터용 payload 인덱스를 보장하는지 검증한다.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+def _collection_info(
+    m: int = 16,
+    ef_construct: int = 100,
+    on_disk: bool = False,
+    payload_schema=None,
+    quantization_config=None,
+):
+    return SimpleNamespace(
+        config=SimpleNamespace(
+            params=SimpleNamespace(vectors=SimpleNamespace(size=768, on_disk=on_disk)),
+            hnsw_config=SimpleNamespace(m=m, ef_construct=ef_construct),
+            quantization_config=quantization_config,
+        ),
+        payload_schema=payload_schema or {},
+    )
+
+
+@pytest.fixture
+def config_and_client():
+    from app.core.vector_config import VectorDBConfig
+
+    config = VectorDBConfig()
+    client = AsyncMock()
+    client.get_collections.return_value = SimpleNamespace(
+        collections=[SimpleNamespace(name=config.collection_name)]
+    )
+    with patch.object(VectorDBConfig, "async_client", new=client):
+        yield config, client
+
+
+@pytest.mark.asyncio
+async def test_existing_collection_in_sync_only_adds_missing_indexes(config_and_client):
+    config, client = config_and_client
+    client.get_collection.return_value = _collection_info(payload_schema={"user_id": object()})
+
+    await config.setup_collection()
+
+    client.update_collection.assert_not_awaited()
+    indexed = {call.kwargs["field_name"] for call in client.create_payload_index.await_args_list}
+    assert indexed == {"content_id", "is_public"}
+
+
+@pytest.mark.asyncio
+async def test_existing_collection_reconciled_to_settings(config_and_client):
+    config, client = config_and_client
+    client.get_collection.return_value = _collection_info(m=8, on_disk=True)
+
+    with (
+        patch("app.core.vector_config.settings.QDRANT_QUANTIZATION", "int8"),
+        patch("app.core.vector_config.settings.QDRANT_ON_DISK_VECTORS", False),
+    ):
+        await config.setup_collection()
+
+    client.update_collection.assert_awaited_once()
+    updated = client.update_collection.await_args.kwargs
+    assert {"hnsw_config", "vectors_config", "quantization_config"} <= set(updated)
+
+
+@pytest.mark.asyncio
+async def test_new_collection_creates_all_payload_indexes(config_and_client):
+    config, client = config_and_client
+    client.get_collections.return_value = SimpleNamespace(collections=[])
+
+    await config.setup_collection()
+
+    client.create_collection.assert_awaited_once()
+    assert client.create_payload_index.await_count == 3
+
+
+@pytest.fixture
+def scalar_quantization_models():
+    # qdrant_client는 conftest에서 Mock이므로 비교 가능한 값 객체로 바꾼다
+    with (
+        patch("app.core.vector_config.ScalarQuantization", side_effect=lambda **kw: SimpleNamespace(**kw)),
+        patch("app.core.vector_config.ScalarQuantizationConfig", side_effect=lambda **kw: SimpleNamespace(**kw)),
+        patch("app.core.vector_config.ScalarType", SimpleNamespace(INT8="int8")),
+        patch("app.core.vector_config.settings.QDRANT_QUANTIZATION", "int8"),
+    ):
+        yield
+
+
+def _scalar(always_ram: bool):
+    return SimpleNamespace(scalar=SimpleNamespace(type="int8", quantile=0.99, always_ram=always_ram))
+
+
+@pytest.mark.asyncio
+async def test_quantization_parameter_change_is_reconciled(config_and_client, scalar_quantization_models):
+    config, client = config_and_client
+    client.get_collection.return_value = _collection_info(quantization_config=_scalar(always_ram=False))
+
+    with patch("app.core.vector_config.settings.QDRANT_QUANTIZATION_ALWAYS_RAM", True):
+        await config.setup_collection()
+
+    client.update_collection.assert_awaited_once()
+    assert client.update_collection.await_args.kwargs["quantization_config"].scalar.always_ram is True
+
+
+@pytest.mark.asyncio
+async def test_matching_quantization_is_left_alone(config_and_client, scalar_quantization_models):
+    config, client = config_and_client
+    client.get_collection.return_value = _collection_info(quantization_config=_scalar(always_ram=True))
+
+    with patch("app.core.vector_config.settings.QDRANT_QUANTIZATION_ALWAYS_RAM", True):
+        await config.setup_collection()
+
+    client.update_collection.assert_not_awaited()
+
+
+def test_search_params_disabled_by_default():
+    from app.core.vector_config import VectorDBConfig
+
+    assert VectorDBConfig().search_params is None
+
+
+def test_async_client_replaced_on_new_loop_closes_previous_client():
+    from app.core.vector_config import VectorDBConfig
+
+    config = VectorDBConfig()
+
+    async def use_client():
+        client = config.async_client
+        await asyncio.sleep(0)
+        return client
+
+    with patch("app.core.vector_config.AsyncQdrantClient", side_effect=lambda **_: MagicMock(close=AsyncMock())):
+        first = asyncio.run(use_client())
+        second = asyncio.run(use_client())
+        asyncio.run(config.aclose())
+
+    assert first is not second
+    first.close.assert_awaited_once()
+    second.close.assert_awaited_once()
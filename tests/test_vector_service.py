@@ -15,10 +15,9 @@ import pytest
 async def test_store_content_chunks_prefers_raw_content_over_summary():
     from app.services.vector_service import VectorService
 
-    service = VectorService()
+    service = VectorService(client=AsyncMock())
     service._ensure_collection = AsyncMock()
-    service.delete_content_vector = AsyncMock(return_value=True)
-    service.client = MagicMock()
+    service.client.scroll.return_value = ([], None)
     service.collection_name = "test_collection"
 
     captured_points = []
@@ -33,7 +32,10 @@ async def test_store_content_chunks_prefers_raw_content_over_summary():
 
     with (
         patch("app.services.vector_service.PointStruct", side_effect=fake_point_struct),
-        patch("app.services.vector_service.embedding_service.generate_embedding", return_value=[0.1] * 768),
+        patch(
+            "app.services.vector_service.embedding_service.generate_batch_embeddings",
+            side_effect=lambda texts: [[0.1] * 768 for _ in texts],
+        ) as mock_batch,
     ):
         result = await service.store_content_chunks(
             content_id=1,
@@ -47,5 +49,285 @@ async def test_store_content_chunks_prefers_raw_content_over_summary():
     assert result is True
     assert captured_points
     assert "미켈 아르테타" in captured_points[0].payload["chunk_text"]
-    assert captured_points[0].payload["summary"] == summary
-    service.client.upsert.assert_called_once()
+    # 문서 메타데이터는 point마다 중복 저장하지 않는다
+    assert "summary" not in captured_points[0].payload
+    assert "title" not in captured_points[0].payload
+    assert captured_points[0].payload["user_id"] == 10
+    service.client.upsert.assert_awaited_once()
+    mock_batch.assert_called_once()
+
+
+def test_generate_batch_embeddings_restores_input_order():
+    from app.services.embedding_service import EmbeddingService
+
+    service = EmbeddingService()
+    service._model = MagicMock()
+    service._dimension = 1
+    # 모델은 길이순으로 정렬된 입력을 받으므로, 각 텍스트 길이를 벡터 값으로 돌려준다
+    service._model.encode.side_effect = lambda texts, batch_size: [
+        SimpleNamespace(tolist=lambda t=t: [float(len(t))]) for t in texts
+    ]
+
+    texts = ["medium text", "a", "the longest text of all"]
+    result = service.generate_batch_embeddings(texts)
+
+    encoded_inputs = service._model.encode.call_args.args[0]
+    assert encoded_inputs == sorted(texts, key=len)
+    assert result == [[float(len(t))] for t in texts]
+
+
+@pytest.mark.asyncio
+async def test_search_reuses_cached_query_embedding_across_modes():
+    from app.services.vector_service import VectorService
+
+    service = VectorService(client=AsyncMock())
+    service._ensure_collection = AsyncMock()
+    service._load_documents = AsyncMock(return_value={})
+    service.client.search.return_value = []
+
+    with patch(
+        "app.services.vector_service.embedding_service.generate_batch_embeddings",
+        return_value=[[0.1] * 768],
+    ) as mock_embed:
+        for threshold in (0.45, 0.25, 0.12):
+            await service.search_similar_chunks("손흥민 토트넘 이적", user_id=1, score_threshold=threshold)
+
+    mock_embed.assert_called_once()
+    assert service.query_embedding_cache.stats()["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_async_embedding_runs_off_event_loop_thread():
+    import threading
+
+    from app.services.embedding_service import embedding_service
+
+    seen_threads = []
+
+    def fake_generate(texts):
+        seen_threads.append(threading.current_thread().name)
+        return [[0.1] * 768 for _ in texts]
+
+    with patch.object(embedding_service, "generate_batch_embeddings", side_effect=fake_generate):
+        result = await embedding_service.agenerate_embedding("query")
+
+    assert result == [0.1] * 768
+    assert seen_threads and seen_threads[0].startswith("embedding")
+
+
+def _scored_point(point_id: str, score: float, content_id: int = 1):
+    return SimpleNamespace(
+        id=point_id,
+        score=score,
+        payload={
+            "content_id": content_id,
+            "chunk_index": 0,
+            "chunk_text": f"아스널 경기 분석 본문 {point_id}",
+            "title": "아스널 분석",
+            "tags": [],
+            "user_id": 10,
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_fallback_uses_single_search_and_splits_tiers_client_side():
+    from app.services.vector_service import VectorService
+
+    service = VectorService(client=AsyncMock())
+    service._ensure_collection = AsyncMock()
+    service._load_documents = AsyncMock(return_value={})
+    service.client.search.return_value = [
+        _scored_point("a", 0.9),
+        _scored_point("b", 0.5),
+        _scored_point("c", 0.1),
+    ]
+
+    with patch(
+        "app.services.vector_service.embedding_service.agenerate_embedding",
+        AsyncMock(return_value=[0.1] * 768),
+    ):
+        sparse = await service.search_similar_chunks("아스널 전술", user_id=10, limit=5, score_threshold=0.4)
+        service.query_embedding_cache.clear()
+        dense = await service.search_similar_chunks("아스널 전술", user_id=10, limit=2, score_threshold=0.4)
+
+    assert service.client.search.await_count == 2
+    assert service.client.search.await_args.kwargs["score_threshold"] == 0.0
+    # limit 5 > 엄격 구간 2건 → 완화 구간까지 포함
+    assert {row["chunk_text"][-1] for row in sparse} == {"a", "b", "c"}
+    # limit 2 == 엄격 구간 2건 → 완화 구간은 제외
+    assert {row["chunk_text"][-1] for row in dense} == {"a", "b"}
+
+
+@pytest.mark.asyncio
+async def test_reindex_only_upserts_changed_chunks_and_deletes_vanished():
+    from app.services.vector_service import VectorService
+
+    service = VectorService(client=AsyncMock())
+    service._ensure_collection = AsyncMock()
+
+    kwargs = dict(
+        content_id=7,
+        title="제목",
+        summary="요약",
+        tags=["태그"],
+        user_id=3,
+        is_public=False,
+    )
+    first_text = "첫 문단 내용입니다."
+    second_text = "두 번째 문단 내용입니다."
+    unchanged_id = service._chunk_point_id(7, 0, f"제목 {first_text} 태그")
+    service.client.scroll.return_value = (
+        [
+            SimpleNamespace(id=unchanged_id, payload={"user_id": 3, "is_public": False, "title": "제목"}),
+            SimpleNamespace(id="legacy-random-id", payload={"user_id": 3, "is_public": False}),
+        ],
+        None,
+    )
+
+    with patch(
+        "app.services.vector_service.embedding_service.agenerate_batch_embeddings",
+        AsyncMock(side_effect=lambda texts: [[0.1] * 768 for _ in texts]),
+    ) as mock_batch, patch(
+        "app.services.vector_service.build_chunk_artifact",
+        return_value=_artifact_for([first_text, second_text]),
+    ), patch(
+        "app.services.vector_service.PointIdsList", side_effect=lambda **kw: SimpleNamespace(**kw)
+    ):
+        result = await service.store_content_chunks(**kwargs)
+
+    assert result is True
+    # 바뀐 두 번째 chunk만 임베딩한다
+    assert mock_batch.await_args.args[0] == [f"제목 {second_text} 태그"]
+    upserted = service.client.upsert.await_args.kwargs["points"]
+    assert len(upserted) == 1
+    service.client.set_payload.assert_not_awaited()
+    # 유지되는 예전 형식 point는 중복 메타데이터 필드만 지운다
+    assert service.client.delete_payload.await_args.kwargs["points"] == [unchanged_id]
+    deleted = service.client.delete.await_args.kwargs["points_selector"]
+    assert deleted.points == ["legacy-random-id"]
+
+
+def _artifact_for(texts):
+    from app.services.chunk_artifact import ChunkArtifact
+
+    normalized = "\n\n".join(texts)
+    spans, position = [], 0
+    for text in texts:
+        spans.append((position, position + len(text)))
+        position += len(text) + 2
+    return ChunkArtifact(source_hash="h", params={}, spans=spans).bind(normalized)
+
+
+def test_chunk_point_id_is_deterministic():
+    from app.services.vector_service import VectorService
+
+    service = VectorService(client=MagicMock())
+    first = service._chunk_point_id(1, 0, "same text")
+    assert first == service._chunk_point_id(1, 0, "same text")
+    assert first != service._chunk_point_id(1, 1, "same text")
+    assert first != service._chunk_point_id(1, 0, "changed text")
+
+
+@pytest.mark.asyncio
+async def test_search_similar_contents_uses_query_groups():
+    from app.services.vector_service import VectorService
+
+    service = VectorService(client=AsyncMock())
+    service._ensure_collection = AsyncMock()
+    service._load_documents = AsyncMock(return_value={})
+    service.client.search_groups.return_value = SimpleNamespace(
+        groups=[
+            SimpleNamespace(id=1, hits=[_scored_point("a", 0.82, content_id=1), _scored_point("b", 0.6, content_id=1)]),
+            SimpleNamespace(id=2, hits=[_scored_point("c", 0.78, content_id=2)]),
+        ]
+    )
+
+    with patch(
+        "app.services.vector_service.embedding_service.agenerate_embedding",
+        AsyncMock(return_value=[0.1] * 768),
+    ):
+        results = await service.search_similar_contents("아스널 전술", user_id=10, limit=2, score_threshold=0.25)
+
+    kwargs = service.client.search_groups.await_args.kwargs
+    assert kwargs["group_by"] == "content_id"
+    assert kwargs["group_size"] == 3
+    service.client.search.assert_not_awaited()
+
+    assert [row["content_id"] for row in results] == [1, 2]
+    first = results[0]
+    assert first["similarity_score"] == pytest.approx(0.82)
+    assert len(first["matched_chunks"]) == 2
+    assert first["top_snippet"] == first["matched_chunks"][0]["chunk_text"]
+
+
+@pytest.mark.asyncio
+async def test_slim_payload_hits_are_hydrated_from_document_metadata():
+    from app.services.vector_service import VectorService
+
+    service = VectorService(client=AsyncMock())
+    service._ensure_collection = AsyncMock()
+    service._load_documents = AsyncMock(
+        return_value={5: {"title": "아스널 분석", "summary": "요약문", "tags": ["축구"]}}
+    )
+    service.client.search.return_value = [
+        SimpleNamespace(
+            id="p1",
+            score=0.7,
+            payload={"content_id": 5, "chunk_index": 0, "chunk_text": "아스널 경기 분석 본문", "user_id": 1},
+        )
+    ]
+
+    with patch(
+        "app.services.vector_service.embedding_service.agenerate_embedding",
+        AsyncMock(return_value=[0.1] * 768),
+    ):
+        results = await service.search_similar_chunks("아스널 전술", user_id=1, limit=1)
+
+    service._load_documents.assert_awaited_once_with([5])
+    assert results[0]["title"] == "아스널 분석"
+    assert results[0]["summary"] == "요약문"
+    assert results[0]["tags"] == ["축구"]
+
+
+@pytest.mark.asyncio
+async def test_metadata_lookup_failure_keeps_hits_with_placeholder_metadata():
+    import sys
+
+    from app.services.vector_service import VectorService
+
+    service = VectorService(client=AsyncMock())
+    service._ensure_collection = AsyncMock()
+    service.client.search.return_value = [
+        SimpleNamespace(
+            id="p1",
+            score=0.7,
+            payload={"content_id": 5, "chunk_index": 0, "chunk_text": "아스널 경기 분석 본문", "user_id": 1},
+        ),
+        SimpleNamespace(
+            id="p2",
+            score=0.6,
+            payload={
+                "content_id": 6,
+                "chunk_index": 0,
+                "chunk_text": "예전 형식 point 본문",
+                "user_id": 1,
+                "title": "예전 제목",
+            },
+        ),
+    ]
+    failing_database = SimpleNamespace(async_session_maker=MagicMock(side_effect=ConnectionError("db down")))
+
+    with (
+        patch.dict(sys.modules, {"app.core.database": failing_database, "app.models.content": MagicMock()}),
+        patch(
+            "app.services.vector_service.embedding_service.agenerate_embedding",
+            AsyncMock(return_value=[0.1] * 768),
+        ),
+    ):
+        results = await service.search_similar_chunks("아스널 전술", user_id=1, limit=2)
+
+    titles = {row["content_id"]: row["title"] for row in results}
+    assert titles == {5: "", 6: "예전 제목"}
+    # 실패한 조회 결과는 캐시하지 않는다
+    assert service.document_cache.get(5) is None
@@ -0,0 +1,45 @@
+"""
+test_worker_runtime.py
+
+Celery 워커 런타임이 이벤트 루프와 서비스 인스턴스를 태스크 사이에 재사용하는지 검증한다.
+"""
+
+import asyncio
+
+import pytest
+
+from app.tasks import worker_runtime
+
+
+@pytest.fixture
+def fresh_runtime():
+    worker_runtime.shutdown_worker_runtime()
+    yield
+    worker_runtime.shutdown_worker_runtime()
+
+
+def test_run_async_reuses_one_loop(fresh_runtime):
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    first = worker_runtime.run_async(current_loop())
+    second = worker_runtime.run_async(current_loop())
+
+    assert first is second
+    assert first is worker_runtime.get_worker_runtime().loop
+
+
+def test_services_live_for_the_worker(fresh_runtime):
+    runtime = worker_runtime.init_worker_runtime()
+
+    assert worker_runtime.get_worker_runtime() is runtime
+    assert runtime.ai_service is worker_runtime.get_worker_runtime().ai_service
+    assert runtime.scraper is worker_runtime.get_worker_runtime().scraper
+
+
+def test_shutdown_closes_loop_and_recreates_on_demand(fresh_runtime):
+    runtime = worker_runtime.init_worker_runtime()
+    worker_runtime.shutdown_worker_runtime()
+
+    assert runtime.loop.is_closed()
+    assert worker_runtime.get_worker_runtime() is not runtime